@@ -7,7 +7,7 @@ from game_engine.models.actions.spell_casting import SpellCasting
 from config.logging import get_configured_logger
 
 from ai.config.ai_config import TurnManagement
-import random
+from utils.rng_utils import RngStream, get_seeded_rng
 
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
@@ -28,6 +28,11 @@ class AIPlayer:
             match_handler_unit.match_context.player1.player_id == player_id
         )
 
+        # Drawn from the match seed, apart from the game draws that it must not shift
+        self._rng = get_seeded_rng(
+            match_handler_unit.match_context.rng_seed, RngStream.AI
+        )
+
         # Initialize the decision brain
         self._brain = AIDecisionBrain(match_handler_unit, self._ai_is_player1)
 
@@ -71,7 +76,7 @@ class AIPlayer:
                 )
                 return
 
-            delay = random.uniform(
+            delay = self._rng.uniform(
                 TurnManagement.THINKING_DELAY_MIN_IN_S,
                 TurnManagement.THINKING_DELAY_MAX_IN_S,
             )
@@ -6,6 +6,7 @@ from ai.strategy.decision_makers.movement_decider import MovementDecider
 from ai.strategy.decision_makers.spell_decider import SpellDecider
 from ai.strategy.scored_action import ScoredAction
 from config.logging import get_configured_logger
+from game_engine.action_calculation import get_all_legal_actions
 
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
@@ -52,20 +53,24 @@ class AIDecisionBrain:
         no action is taken.
         """
         candidates: list[ScoredAction] = []
+        # Computed once from the current board state, then shared by every decider
+        legal_actions = get_all_legal_actions(
+            self._ai_is_player1, self._match.match_context, self._match.turn_state
+        )
 
-        movement = self._movement_decider.decide_movement(evaluation)
+        movement = self._movement_decider.decide_movement(evaluation, legal_actions)
         if movement:
             candidates.append(movement)
 
-        attack = self._attack_decider.decide_attack(evaluation)
+        attack = self._attack_decider.decide_attack(evaluation, legal_actions)
         if attack:
             candidates.append(attack)
 
-        spell = self._spell_decider.decide_spell(evaluation)
+        spell = self._spell_decider.decide_spell(evaluation, legal_actions)
         if spell:
             candidates.append(spell)
 
-        spawn = self._spawn_decider.decide_spawn(evaluation)
+        spawn = self._spawn_decider.decide_spawn(evaluation, legal_actions)
         if spawn:
             candidates.append(spawn)
 
@@ -1,9 +1,11 @@
 from typing import TYPE_CHECKING, List, Optional, TypeVar, Callable
 from ai.strategy.scored_action import ScoredAction
+from game_engine.action_calculation import get_all_legal_actions
 
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
     from game_engine.models.actions.base_action import BaseAction
+    from game_engine.models.actions.legal_actions import LegalActions
 
 T = TypeVar("T", bound="BaseAction")
 
@@ -24,12 +26,16 @@ class BaseDecider:
         """Returns the current game board."""
         return self._match_context.game_board
 
-    def _get_transient_board(self):
+    def _get_legal_actions(self, legal_actions: Optional["LegalActions"]):
         """
-        Returns a cloned version of the board suitable for "what-if" calculations.
-        Prevents marking real board cells with transient states like CAN_BE_SPAWNED_INTO.
+        Returns the given legal actions of the AI, computing them if none were given.
+        The brain computes them once per decision and shares them with every decider.
         """
-        return self.game_board.clone_as_transient()
+        if legal_actions is not None:
+            return legal_actions
+        return get_all_legal_actions(
+            self._ai_is_player1, self._match_context, self._match.turn_state
+        )
 
     def _pick_best_action(
         self,
@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Optional, List
 from game_engine.models.actions.cell_movement import CellMovement
-from game_engine.action_calculation import get_possible_movements_and_attacks
 from ai.strategy.decision_makers.base_decider import BaseDecider
 from ai.strategy.evaluators.movement_evaluator import MovementEvaluator
 from ai.strategy.scored_action import ScoredAction
@@ -8,7 +7,7 @@ from ai.strategy.scored_action import ScoredAction
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
     from ai.strategy.evaluators.board.board_evaluation import BoardEvaluation
-    from game_engine.models.cell.cell import Cell
+    from game_engine.models.actions.legal_actions import LegalActions
 
 
 class MovementDecider(BaseDecider):
@@ -24,32 +23,21 @@ class MovementDecider(BaseDecider):
     def decide_movement(
         self,
         board_evaluation: "BoardEvaluation",
+        legal_actions: Optional["LegalActions"] = None,
     ) -> Optional[ScoredAction]:
         """
         Calculates the best movement action available.
         Returns a ScoredAction so the brain can compare across action types.
         """
-        # 1. Setup board and state
-        transient_board = self._get_transient_board()
-        turn_state = self._match.turn_state
-
-        # 2. Get AI cells from the current board state
-        ai_cells = self.game_board.get_cells_owned_by_player(
-            player1=self._ai_is_player1
-        )
-        all_possible_movements: List[CellMovement] = []
-
-        # 3. Consider all possible movements for each AI cell
-        for cell in ai_cells:
-            # Use transient board to avoid marking real board cells with transient states
-            options = get_possible_movements_and_attacks(
-                self._ai_is_player1, cell, transient_board, turn_state
-            )
-            for option in options:
-                if isinstance(option, CellMovement):
-                    all_possible_movements.append(option)
-
-        # 4. Evaluate each possible move and pick the best one
+        # 1. Gather the movements of every AI cell
+        legal_actions = self._get_legal_actions(legal_actions)
+        all_possible_movements: List[CellMovement] = [
+            movement
+            for movements in legal_actions.movements.values()
+            for movement in movements
+        ]
+
+        # 2. Evaluate each possible move and pick the best one
         return self._pick_best_action(
             all_possible_movements,
             lambda move: self._evaluator.evaluate(move, board_evaluation),
@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 from game_engine.models.actions.cell_spawn import CellSpawn
 from ai.strategy.evaluators.spawn_evaluator import SpawnEvaluator
-from game_engine.action_calculation import get_possible_spawns
 from utils.perf_utils import with_performance_logging
 from ai.strategy.decision_makers.base_decider import BaseDecider
 from ai.strategy.scored_action import ScoredAction
@@ -9,6 +8,7 @@ from ai.strategy.scored_action import ScoredAction
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
     from ai.strategy.evaluators.board.board_evaluation import BoardEvaluation
+    from game_engine.models.actions.legal_actions import LegalActions
 
 
 class SpawnDecider(BaseDecider):
@@ -25,6 +25,7 @@ class SpawnDecider(BaseDecider):
     def decide_spawn(
         self,
         board_evaluation: "BoardEvaluation",
+        legal_actions: Optional["LegalActions"] = None,
     ) -> Optional[ScoredAction]:
         """
         Decides whether to spawn a cell and returns the best ScoredAction if so.
@@ -40,8 +41,7 @@ class SpawnDecider(BaseDecider):
             return None
 
         # 2. Get all possible spawns.
-        transient_board = self._get_transient_board()
-        possible_spawns = get_possible_spawns(self._ai_is_player1, transient_board)
+        possible_spawns = self._get_legal_actions(legal_actions).spawns
         if not possible_spawns:
             return None
 
@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING, Optional, List
 from ai.strategy.decision_makers.base_decider import BaseDecider
 from ai.strategy.scored_action import ScoredAction
 from game_engine.models.actions.spell_casting import SpellCasting
-from game_engine.models.spells.spell_factory import get_spell
 from game_engine.models.spells.spell_id import SpellId
 from utils.perf_utils import with_performance_logging
 from ai.strategy.evaluators.spells import (
@@ -18,6 +17,7 @@ from ai.config.ai_config import SpellWeights
 if TYPE_CHECKING:
     from handlers.match_handler_unit import MatchHandlerUnit
     from ai.strategy.evaluators.board.board_evaluation import BoardEvaluation
+    from game_engine.models.actions.legal_actions import LegalActions
     from ai.strategy.evaluators.spells.base_spell_evaluator import BaseSpellEvaluator
 
 
@@ -50,6 +50,7 @@ class SpellDecider(BaseDecider):
     def decide_spell(
         self,
         board_evaluation: "BoardEvaluation",
+        legal_actions: Optional["LegalActions"] = None,
     ) -> Optional[ScoredAction]:
         """
         Decides whether to cast a spell and returns the best ScoredAction if so.
@@ -68,16 +69,13 @@ class SpellDecider(BaseDecider):
             return None
 
         # 2. Get all possible spell actions we can afford
-        possible_actions: List[SpellCasting] = []
-        transient_board = self._get_transient_board()
-
-        for spell_id in available_spells:
-            spell = get_spell(spell_id)
-            if player.resources.current_mp >= spell.MANA_COST:
-                spell_actions = SpellCasting.calculate(
-                    spell, self._ai_is_player1, transient_board
-                )
-                possible_actions.extend(list(spell_actions))
+        possible_actions: List[SpellCasting] = [
+            spell_casting
+            for spell_castings in self._get_legal_actions(
+                legal_actions
+            ).spell_castings.values()
+            for spell_casting in spell_castings
+        ]
 
         if not possible_actions:
             return None
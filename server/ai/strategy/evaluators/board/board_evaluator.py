@@ -21,6 +21,8 @@ from ai.strategy.evaluators.board.evaluation_constants import (
 from game_engine.models.cell.cell import Cell
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
+from utils.bitboard_utils import to_bit_index
+from utils.board_geometry import NEIGHBOURS_MASKS
 from utils.board_utils import manhattan_distance
 
 if TYPE_CHECKING:
@@ -60,12 +62,14 @@ class BoardEvaluator(BaseEvaluator):
         )
 
         # Find master cells
-        ai_master_cell = self._find_master_cell(ai_cells)
-        enemy_master_cell = self._find_master_cell(enemy_cells)
+        ai_master_cell = self._find_master_cell(game_board, self._ai_is_player1)
+        enemy_master_cell = self._find_master_cell(game_board, not self._ai_is_player1)
 
         # Cell control analysis
-        ai_cell_count = len(ai_cells)
-        enemy_cell_count = len(enemy_cells)
+        ai_cell_count = game_board.count_cells_owned_by_player(self._ai_is_player1)
+        enemy_cell_count = game_board.count_cells_owned_by_player(
+            not self._ai_is_player1
+        )
         cell_control_advantage = ai_cell_count - enemy_cell_count
 
         # Threat analysis
@@ -133,19 +137,21 @@ class BoardEvaluator(BaseEvaluator):
             ai_cells_that_can_attack_enemy_master=ai_cells_that_can_attack_enemy_master,
         )
 
-    def _find_master_cell(self, cells: list[Cell]) -> Cell:
-        """Finds and returns the master cell from a list of cells."""
-        for cell in cells:
-            if cell.is_master:
-                return cell
-        raise ValueError("No master cell found in the provided list")
+    def _find_master_cell(self, game_board: GameBoard, player1: bool) -> Cell:
+        """Returns the master cell of the given player."""
+        master_cell = game_board.get_master(player1)
+        if master_cell is None:
+            raise ValueError("No master cell found for the given player")
+        return master_cell
 
     def _is_cell_stuck(self, cell: Cell, board: GameBoard) -> bool:
         """
         Check if a cell has no valid movement neighbors (all neighbors are occupied).
         """
-        neighbours = board.get_neighbours(cell.row_index, cell.column_index)
-        return all(neighbour.is_owned() for neighbour in neighbours)
+        neighbours_mask = NEIGHBOURS_MASKS[
+            to_bit_index(cell.row_index, cell.column_index)
+        ]
+        return not neighbours_mask & board.bit_board.get_idle()
 
     def _find_cells_near_target(
         self, cells: list[Cell], target: Cell, max_distance: int
@@ -26,7 +26,9 @@ class CelerityEvaluator(BaseSpellEvaluator):
 
         # Analyze the diagonal formation this target belongs to
         target_coords = action.metadata.impacted_coords
-        diagonal_cells = action.spell.get_impacted_cells(target_coords)
+        diagonal_cells = action.spell.get_impacted_cells(
+            target_coords, action.targeting_result
+        )
 
         # Bonus based on diagonal size (more cells = more value)
         score += len(diagonal_cells) * SpellWeights.CELERITY_PER_CELL_BONUS
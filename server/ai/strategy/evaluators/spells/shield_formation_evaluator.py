@@ -24,7 +24,9 @@ class ShieldFormationEvaluator(BaseSpellEvaluator):
 
         # Retrieve the full formation this target coordinate belongs to
         target_coords = action.metadata.impacted_coords
-        square_cells = action.spell.get_impacted_cells(target_coords)
+        square_cells = action.spell.get_impacted_cells(
+            target_coords, action.targeting_result
+        )
 
         # Calculate counts of AI-owned shielded vs non-shielded cells
         shielded_count, non_shielded_count = self._get_shield_stats(square_cells)
@@ -18,6 +18,7 @@ from config.logging import (
 from config.variables import OptionalVariable, RequiredVariable
 from middlewares.error_handler import handle_error
 from persistence.database import db, postgre_utils
+from persistence.database.schema_updates import apply_schema_updates
 from persistence.session import redis_utils
 from utils import logging_utils
 from utils.os_utils import delete_file_or_folder
@@ -64,6 +65,7 @@ class Application(Flask):
             with self.app_context():
                 self.logger.info("Creating all database tables")
                 db.create_all()
+                apply_schema_updates()
 
     def _clean_up(self):
         """
@@ -0,0 +1,62 @@
+"""
+Compares playing random matches (cell actions only) one by one through the
+match simulator with playing them in lockstep through the batched simulator.
+
+Run from the server directory with : python -m benchmarks.batched_simulator_benchmark
+"""
+
+import random
+import time
+
+from game_engine.models.actions.spell_casting import SpellCasting
+from game_engine.simulator.batched_simulator import END_TURN, BatchedMatchSimulator
+from game_engine.simulator.match_simulator import MatchSimulator
+
+GAMES = 50
+SEED = 0
+END_TURN_PROBABILITY = 0.25
+
+
+def _play_sequentially(rng: random.Random):
+    for _ in range(GAMES):
+        simulator = MatchSimulator.create()
+        while not simulator.is_over():
+            cell_actions = [
+                action
+                for action in simulator.legal_actions()
+                if not isinstance(action, SpellCasting)
+            ]
+            if not cell_actions or rng.random() < END_TURN_PROBABILITY:
+                simulator.end_turn()
+            else:
+                simulator.step(rng.choice(cell_actions))
+
+
+def _play_batched(rng: random.Random):
+    batch = BatchedMatchSimulator(GAMES)
+    while not batch.all_over():
+        action_codes = []
+        for match_index, legal_actions in enumerate(batch.legal_actions()):
+            if batch.is_over(match_index):
+                action_codes.append(None)
+            elif not legal_actions or rng.random() < END_TURN_PROBABILITY:
+                action_codes.append(END_TURN)
+            else:
+                action_codes.append(rng.choice(legal_actions))
+
+        batch.step(action_codes)
+
+
+def main():
+    for title, play in (("sequential", _play_sequentially), ("batched", _play_batched)):
+        start = time.perf_counter()
+        play(random.Random(SEED))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{title:<12} {GAMES} games in {elapsed:6.2f} s"
+            f"   ->  {GAMES * 60 / elapsed:8.0f} games per minute"
+        )
+
+
+if __name__ == "__main__":
+    main()
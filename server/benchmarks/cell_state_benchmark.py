@@ -0,0 +1,58 @@
+"""
+Compares the cell state checks and updates done through the CellState IntFlag
+operators with the plain int ones the cells now use.
+
+Run from the server directory with : python -m benchmarks.cell_state_benchmark
+"""
+
+import timeit
+
+from game_engine.models.cell.cell_state import (
+    CORE_STATES_MASK,
+    STATE_ARCHER,
+    STATE_FRESHLY_SPAWNED,
+    STATE_SHIELDED,
+    CellState,
+)
+
+NUMBER = 200_000
+
+
+def _run(title: str, enum_statement, int_statement):
+    enum_time = timeit.timeit(enum_statement, number=NUMBER)
+    int_time = timeit.timeit(int_statement, number=NUMBER)
+    print(
+        f"{title:<24} IntFlag: {enum_time * 1e9 / NUMBER:7.1f} ns"
+        f"   int: {int_time * 1e9 / NUMBER:7.1f} ns"
+        f"   speedup: x{enum_time / int_time:.1f}"
+    )
+
+
+def main():
+    enum_state = CellState.SHIELDED | CellState.ARCHER
+    int_state = enum_state.value
+
+    _run(
+        "contains",
+        lambda: enum_state.contains(CellState.ARCHER),
+        lambda: bool(int_state & STATE_ARCHER),
+    )
+    _run(
+        "with_core_state",
+        lambda: enum_state.with_core_state(CellState.FRESHLY_SPAWNED),
+        lambda: int_state & ~CORE_STATES_MASK | STATE_FRESHLY_SPAWNED,
+    )
+    _run(
+        "remove_state",
+        lambda: enum_state.remove_state(CellState.SHIELDED),
+        lambda: int_state & ~STATE_SHIELDED,
+    )
+    _run(
+        "core_states_cleared",
+        lambda: enum_state.core_states_cleared(),
+        lambda: int_state & ~CORE_STATES_MASK,
+    )
+
+
+if __name__ == "__main__":
+    main()
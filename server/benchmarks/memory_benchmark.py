@@ -0,0 +1,96 @@
+"""
+Measures the memory held by a match and by the boards derived from it
+(clones, transient overlays), along with the size of single model instances.
+
+Run from the server directory with : python -m benchmarks.memory_benchmark
+"""
+
+import tracemalloc
+
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.metadata.action_metadata import ActionMedatata
+from game_engine.models.actions.metadata.cell_attack_metadata import (
+    CellAttackMetadata,
+)
+from game_engine.models.cell.cell import Cell
+from game_engine.models.cell.cell_hidden_state import CellHiddenState
+from game_engine.models.cell.cell_hidden_state_info import CellHiddenStateInfo
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from game_engine.models.player.player_resources import PlayerResources
+from game_engine.models.turn.turn_state import TurnState
+from game_engine.simulator.match_simulator import MatchSimulator
+
+INSTANCES = 100
+
+
+def _measure(create):
+    """
+    Returns the average number of bytes still allocated by each object returned by
+    the given function.
+    """
+    create()  # warm up the caches
+    tracemalloc.start()
+    objects = [create() for _ in range(INSTANCES)]
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated_bytes // INSTANCES
+
+
+def _create_match_context():
+    return MatchSimulator.create().match_context
+
+
+def _create_marked_transient_board(game_board: GameBoard):
+    """
+    Returns a transient overlay in which every cell got a transient state,
+    which is the worst case.
+    """
+    transient_board = game_board.create_transient_overlay()
+    for row in game_board.board:
+        for cell in row:
+            transient_board.get(cell.row_index, cell.column_index).set_selected()
+    return transient_board
+
+
+def main():
+    match_context = _create_match_context()
+    game_board = match_context.game_board
+
+    print("Bytes per object")
+    print(f"  match context      {_measure(_create_match_context):>8}")
+    print(f"  board clone        {_measure(game_board.clone):>8}")
+    print(
+        "  transient board    "
+        f"{_measure(lambda: _create_marked_transient_board(game_board)):>8}"
+    )
+
+    coordinates = Coordinates(1, 5)
+    deaths = []
+    player1_resources, player2_resources = match_context.get_both_players_resources()
+    print("Bytes per model instance, along with what it owns")
+    for name, create in (
+        ("cell", lambda: Cell.get_default_idle_cell(0, 0)),
+        (
+            "cell hidden state info",
+            lambda: CellHiddenStateInfo(CellHiddenState.MINE_TRAP, CellOwner.PLAYER_1),
+        ),
+        ("coordinates", lambda: Coordinates(0, 0)),
+        ("action metadata", lambda: ActionMedatata(coordinates, coordinates, deaths)),
+        ("cell attack metadata", lambda: CellAttackMetadata(True, False)),
+        ("cell movement", lambda: CellMovement.create(True, 1, 1, 5, 2, 5)),
+        ("cell attack", lambda: CellAttack.create(True, 1, coordinates, coordinates)),
+        ("player resources", PlayerResources.get_initial),
+        (
+            "turn state",
+            lambda: TurnState.get_initial(True, player1_resources, player2_resources),
+        ),
+    ):
+        print(f"  {name:<24} {_measure(create):>6}")
+
+
+if __name__ == "__main__":
+    main()
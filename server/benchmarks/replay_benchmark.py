@@ -0,0 +1,63 @@
+"""
+Compares seeking turns of a replayed match with and without checkpoints.
+
+Run from the server directory with : python -m benchmarks.replay_benchmark
+"""
+
+import random
+import time
+
+from game_engine.simulator.match_replay import MatchReplay
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+
+SEED = 0
+SEEKS = 50
+CHECKPOINT_INTERVAL = 10
+
+
+def _play_random_match():
+    simulator = MatchSimulator.create(rng_seed=SEED)
+    play_random_turns(simulator, random.Random(SEED))
+    return simulator
+
+
+def _get_replay(simulator: MatchSimulator, checkpoint_interval: int):
+    return MatchReplay(
+        {
+            turn: [action.to_dto().to_dict() for action in actions]
+            for turn, actions in simulator.actions_per_turn.items()
+        },
+        simulator.match_context.current_turn,
+        simulator.match_context.rng_seed,
+        checkpoint_interval,
+    )
+
+
+def _run(title: str, replay: MatchReplay, turns: list[int]):
+    start = time.perf_counter()
+    for turn in turns:
+        replay.seek(turn)
+    elapsed = time.perf_counter() - start
+    print(f"{title:<24} {elapsed * 1e3 / len(turns):8.2f} ms per seek")
+
+
+def main():
+    simulator = _play_random_match()
+    total_turns = simulator.match_context.current_turn
+    rng = random.Random(SEED)
+    turns = [rng.randint(1, total_turns) for _ in range(SEEKS)]
+
+    replay = _get_replay(simulator, CHECKPOINT_INTERVAL)
+    start = time.perf_counter()
+    for _ in replay.iter_frames():
+        pass
+    elapsed = time.perf_counter() - start
+
+    print(f"Match of {total_turns} turns, replayed in {elapsed * 1e3:.1f} ms")
+    _run("without checkpoints", _get_replay(simulator, total_turns + 1), turns)
+    _run(f"checkpoints every {CHECKPOINT_INTERVAL}", replay, turns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measures how many random matches the headless simulator plays per minute,
+on a single core.
+
+Run from the server directory with : python -m benchmarks.simulator_benchmark
+"""
+
+import random
+import time
+
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+
+GAMES = 20
+SEED = 0
+MAX_ACTIONS_PER_TURN = 3
+
+
+def _play_random_match(rng: random.Random):
+    simulator = MatchSimulator.create(rng_seed=rng.getrandbits(32))
+    steps = play_random_turns(simulator, rng, max_actions_per_turn=MAX_ACTIONS_PER_TURN)
+    return simulator.match_context.current_turn, steps
+
+
+def main():
+    rng = random.Random(SEED)
+    turns = steps = 0
+
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        game_turns, game_steps = _play_random_match(rng)
+        turns += game_turns
+        steps += game_steps
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{GAMES} games, {turns} turns, {steps} actions in {elapsed:.2f} s"
+        f"   ->  {GAMES * 60 / elapsed:.0f} games per minute"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares saving and restoring a mid-game position through the binary snapshots
+with building the match context dto.
+
+Run from the server directory with : python -m benchmarks.snapshot_benchmark
+"""
+
+import random
+import timeit
+
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+from game_engine.snapshot_codec import SNAPSHOT_SIZE, encode_snapshot, restore_snapshot
+
+NUMBER = 2_000
+SEED = 0
+TURNS = 30
+
+
+def _get_mid_game_simulator():
+    simulator = MatchSimulator.create(rng_seed=SEED)
+    play_random_turns(simulator, random.Random(SEED), turns=TURNS)
+    return simulator
+
+
+def _run(title: str, statement):
+    elapsed = timeit.timeit(statement, number=NUMBER)
+    print(f"{title:<20} {elapsed * 1e6 / NUMBER:8.1f} µs")
+
+
+def main():
+    simulator = _get_mid_game_simulator()
+    match_context, turn_state = simulator.match_context, simulator.turn_state
+    snapshot = encode_snapshot(match_context, turn_state)
+    target = MatchSimulator.create()
+
+    print(f"Snapshot size : {SNAPSHOT_SIZE} bytes")
+    _run("encode_snapshot", lambda: encode_snapshot(match_context, turn_state))
+    _run(
+        "restore_snapshot",
+        lambda: restore_snapshot(snapshot, target.match_context, target.turn_state),
+    )
+    _run("to_dto", lambda: match_context.to_dto(for_player1=True))
+
+
+if __name__ == "__main__":
+    main()
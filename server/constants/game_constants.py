@@ -11,6 +11,10 @@ BOARD_SIZE = 11  # Do not ever change that
 PLAYER_1_ROWS = (0, 4)  # Do not ever change that
 PLAYER_2_ROWS = (6, 10)  # Do not ever change that
 
+PLAYER_1_MASTER_STARTING_COORDINATES = (1, 5)
+PLAYER_2_MASTER_STARTING_COORDINATES = (9, 5)
+MANA_BUBBLES_COORDINATES = ((6, 5), (5, 1), (5, 9))
+
 MAX_HP_VALUE = 12
 MAX_MP_VALUE = 9
 MAX_STAMINA_VALUE = 20
@@ -1,11 +1,17 @@
 from game_engine.models.actions.cell_attack import CellAttack
 from game_engine.models.actions.cell_movement import CellMovement
 from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.actions.legal_actions import LegalActions
 from game_engine.models.actions.spell_casting import SpellCasting
 from game_engine.models.cell.cell import Cell
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
+from game_engine.models.match.match_context import MatchContext
 from game_engine.models.spells.abstract.spell import Spell
+from game_engine.models.spells.spell_factory import get_spell
 from game_engine.models.turn.turn_state import TurnState
+from utils.bitboard_utils import from_bit_index, get_neighbours_mask, iter_bit_indexes
 
 
 def get_possible_movements_and_attacks(
@@ -16,10 +22,10 @@ def get_possible_movements_and_attacks(
 
     movements: set[CellMovement] = set()
     attacks: set[CellAttack] = set()
-    if not _has_already_moved_this_turn(cell, turn_state):
+    if not turn_state.has_already_moved(cell):
         movements = CellMovement.calculate(cell, player1, transient_board)
 
-    if not _has_already_attacked_this_turn(cell, turn_state):
+    if not turn_state.has_already_attacked(cell):
         attacks = CellAttack.calculate(cell, player1, transient_board)
 
     return movements.union(attacks)
@@ -35,20 +41,78 @@ def get_possible_spell_castings(
     return SpellCasting.calculate(spell, player1, transient_board)
 
 
-def _has_already_moved_this_turn(cell: Cell, turn_state: TurnState):
-    if cell.id not in turn_state.movements:
-        return False
+def get_all_legal_actions(
+    player1: bool, match_context: MatchContext, turn_state: TurnState
+) -> LegalActions:
+    """
+    Returns every movement, attack, spawn and spell casting the given player
+    can perform.
+
+    The cell actions are computed straight from the bit board layers,
+    without marking any cell with a transient state.
+    The spell targets are computed by the spells themselves, on a single shared overlay.
+    """
+    game_board = match_context.game_board
+    bit_board = game_board.bit_board
+    player_resources = match_context.get_player_resources(player1)
+    legal_actions = LegalActions.get_empty()
+
+    owned_mask = bit_board.get_owned(player1)
+    active_mask = owned_mask & ~bit_board.get_state(CellState.FRESHLY_SPAWNED)
+
+    # Movements and attacks
+    for bit_index in iter_bit_indexes(active_mask):
+        row_index, column_index = from_bit_index(bit_index)
+        cell = game_board.get(row_index, column_index)
+        coordinates = cell.get_coordinates()
+
+        if not turn_state.has_already_moved(cell):
+            targets_mask = CellMovement.get_targets_mask(cell, game_board, True)
+            if targets_mask:
+                legal_actions.movements[coordinates] = [
+                    CellMovement.create(
+                        player1, cell.id, row_index, column_index, *target
+                    )
+                    for target in map(from_bit_index, iter_bit_indexes(targets_mask))
+                ]
+
+        if not turn_state.has_already_attacked(cell):
+            attacks = [
+                CellAttack.create(
+                    player1,
+                    cell.id,
+                    coordinates,
+                    Coordinates.of(*from_bit_index(target_index)),
+                    is_ranged_attack,
+                    is_retaliated,
+                )
+                for target_index, is_ranged_attack, is_retaliated in (
+                    CellAttack.get_targets(cell, game_board)
+                )
+            ]
+            if attacks:
+                legal_actions.attacks[coordinates] = attacks
+
+    # Spawns
+    if player_resources.current_mp >= CellSpawn.DEFAULT_MANA_COST:
+        targets_mask = get_neighbours_mask(owned_mask) & bit_board.get_idle()
+        legal_actions.spawns = [
+            CellSpawn.create(player1, *from_bit_index(bit_index))
+            for bit_index in iter_bit_indexes(targets_mask)
+        ]
+
+    # Spells
+    transient_board = None
+    for spell_id, count in player_resources.spells.items():
+        spell = get_spell(spell_id)
+        if count <= 0 or player_resources.current_mp < spell.MANA_COST:
+            continue
+
+        if transient_board is None:
+            transient_board = game_board.create_transient_overlay()
+        spell_castings = SpellCasting.calculate(spell, player1, transient_board)
+        if spell_castings:
+            legal_actions.spell_castings[spell_id] = list(spell_castings)
+
+    return legal_actions
 
-    if cell.is_accelerated():
-        return turn_state.movements[cell.id] == 2
-
-    return turn_state.movements[cell.id] == 1
-
-
-def _has_already_attacked_this_turn(cell: Cell, turn_state: TurnState):
-    if cell.id not in turn_state.attacks:
-        return False
-
-    if cell.is_accelerated():
-        return turn_state.attacks[cell.id] == 2
-    return turn_state.attacks[cell.id] == 1
@@ -0,0 +1,161 @@
+"""
+Packs actions into plain integers and back, for the places handling lots of them
+(search, logs) where allocating and hashing action objects is too costly.
+
+Layout of an action code, from the lowest bit :
+
+• 7 bits : bit index of the originating square (NO_SQUARE if none)
+
+• 7 bits : bit index of the impacted square
+
+• 2 bits : action type
+
+• 4 bits : spell id (0 if not a spell casting)
+
+• 1 bit : whether the action comes from player 1
+"""
+
+from game_engine.models.actions.abstract.action import Action
+from game_engine.models.actions.action_type import ActionType
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.actions.spell_casting import SpellCasting
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from game_engine.models.spells.spell_factory import get_spell
+from utils.bitboard_utils import from_bit_index, to_bit_index
+
+NO_SQUARE = 0x7F
+
+_SQUARE_BITS = 7
+_TYPE_BITS = 2
+_SPELL_ID_BITS = 4
+
+_TARGET_SHIFT = _SQUARE_BITS
+_TYPE_SHIFT = _TARGET_SHIFT + _SQUARE_BITS
+_SPELL_ID_SHIFT = _TYPE_SHIFT + _TYPE_BITS
+_PLAYER1_SHIFT = _SPELL_ID_SHIFT + _SPELL_ID_BITS
+
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+_TYPE_MASK = (1 << _TYPE_BITS) - 1
+_SPELL_ID_MASK = (1 << _SPELL_ID_BITS) - 1
+
+
+def pack_action(
+    action_type: ActionType,
+    from_player1: bool,
+    target_index: int,
+    origin_index: int = NO_SQUARE,
+    spell_id: int = 0,
+) -> int:
+    return (
+        origin_index
+        | target_index << _TARGET_SHIFT
+        | action_type << _TYPE_SHIFT
+        | spell_id << _SPELL_ID_SHIFT
+        | from_player1 << _PLAYER1_SHIFT
+    )
+
+
+# region Fields
+
+
+def get_origin_index(code: int) -> int:
+    return code & _SQUARE_MASK
+
+
+def get_target_index(code: int) -> int:
+    return (code >> _TARGET_SHIFT) & _SQUARE_MASK
+
+
+def get_action_type(code: int) -> ActionType:
+    return ActionType((code >> _TYPE_SHIFT) & _TYPE_MASK)
+
+
+def get_spell_id(code: int) -> int:
+    return (code >> _SPELL_ID_SHIFT) & _SPELL_ID_MASK
+
+
+def is_from_player1(code: int) -> bool:
+    return bool(code >> _PLAYER1_SHIFT & 1)
+
+
+# endregion
+
+
+def encode_action(action: Action) -> int:
+    """
+    Returns the code of the given action.
+    """
+    metadata = action.metadata
+    target_index = _get_index(metadata.impacted_coords)
+
+    if isinstance(action, CellMovement):
+        action_type = ActionType.CELL_MOVE
+    elif isinstance(action, CellAttack):
+        action_type = ActionType.CELL_ATTACK
+    elif isinstance(action, CellSpawn):
+        return pack_action(ActionType.CELL_SPAWN, action.from_player1, target_index)
+    elif isinstance(action, SpellCasting):
+        return pack_action(
+            ActionType.PLAYER_SPELL,
+            action.from_player1,
+            target_index,
+            spell_id=action.spell.ID,
+        )
+    else:
+        raise ValueError(f"Cannot encode the action {action}")
+
+    return pack_action(
+        action_type,
+        action.from_player1,
+        target_index,
+        origin_index=_get_index(metadata.originating_coords),
+    )
+
+
+def decode_action(code: int, game_board: GameBoard) -> Action:
+    """
+    Returns the action corresponding to the given code.
+
+    The board is needed to retrieve the id of the cell performing a cell action.
+    """
+    action_type = get_action_type(code)
+    from_player1 = is_from_player1(code)
+    target_row_index, target_column_index = from_bit_index(get_target_index(code))
+
+    if action_type == ActionType.CELL_SPAWN:
+        return CellSpawn.create(from_player1, target_row_index, target_column_index)
+
+    if action_type == ActionType.PLAYER_SPELL:
+        return SpellCasting.create(
+            from_player1,
+            get_spell(get_spell_id(code)),
+            target_row_index,
+            target_column_index,
+        )
+
+    origin_row_index, origin_column_index = from_bit_index(get_origin_index(code))
+    cell_id = game_board.get(origin_row_index, origin_column_index).id
+
+    if action_type == ActionType.CELL_MOVE:
+        return CellMovement.create(
+            from_player1,
+            cell_id,
+            origin_row_index,
+            origin_column_index,
+            target_row_index,
+            target_column_index,
+        )
+
+    return CellAttack.create(
+        from_player1,
+        cell_id,
+        Coordinates.of(origin_row_index, origin_column_index),
+        Coordinates.of(target_row_index, target_column_index),
+    )
+
+
+def _get_index(coordinates: Coordinates):
+    return to_bit_index(coordinates.row_index, coordinates.column_index)
@@ -7,6 +7,9 @@ _logger = get_configured_logger(__name__)
 
 
 def process_action(action: Action, match_context: MatchContext) -> Action:
+    # Everything the action changes, including its callbacks, can be undone at once
+    match_context.journal.begin_entry()
+
     player_resources = match_context.get_player_resources(action.from_player1)
 
     _process_player_mana(player_resources, action)
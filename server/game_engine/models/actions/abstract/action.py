@@ -1,15 +1,18 @@
 from functools import wraps
-from typing import Any, Type
+from typing import TYPE_CHECKING, Any, Type
 
 from dto.base_dto import BaseDto
 from game_engine.models.actions.abstract.with_callbacks import WithCallbacks
 from game_engine.models.actions.callbacks.action_callback_id import ActionCallBackId
-from game_engine.models.actions.callbacks.callback_factory import get_callback
+from game_engine.models.actions.callbacks.callback_factory import get_callback_type
 from game_engine.models.actions.hooks.action_hook import ActionHook
 from game_engine.models.actions.metadata.action_metadata import ActionMedatata
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.match.match_context import MatchContext
 
+if TYPE_CHECKING:
+    from game_engine.models.turn.turn_state import TurnState
+
 
 class ActionMeta(type):
     """
@@ -39,6 +42,8 @@ class Action(WithCallbacks, metaclass=ActionMeta):
     Base class for all actions
     """
 
+    __slots__ = ("from_player1", "mana_cost", "metadata", "specific_metadata")
+
     DEFAULT_MANA_COST = 0
     HOOKS: set[ActionHook] = set()
     CALLBACKS: set[ActionCallBackId] = set()
@@ -77,6 +82,13 @@ class Action(WithCallbacks, metaclass=ActionMeta):
         """
         raise NotImplementedError
 
+    def is_valid(self, match_context: MatchContext, turn_state: "TurnState") -> bool:
+        """
+        Checks whether the action can be performed on the current board,
+        straight from the game rules.
+        """
+        raise NotImplementedError
+
     def apply(self, match_context: MatchContext) -> None:
         """
         Applies the action on the given board.
@@ -85,7 +97,11 @@ class Action(WithCallbacks, metaclass=ActionMeta):
 
     def register_callbacks(self, match_context: MatchContext) -> None:
         for callback_id in self.CALLBACKS:
-            callback = get_callback(callback_id, self)
+            callback_type = get_callback_type(callback_id)
+            if not callback_type.can_be_registered(self, match_context):
+                continue
+
+            callback = callback_type(self)
             if callback.can_be_triggered(match_context):
                 self._callbacks_to_trigger.append(callback)
 
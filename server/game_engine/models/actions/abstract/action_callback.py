@@ -107,6 +107,14 @@ class ActionCallback(WithCallbacks, metaclass=ActionCallbackMeta):
             updatedGameContext=GameContextDto.from_action_callback(self, for_player1),
         )
 
+    @staticmethod
+    def can_be_registered(parent_action: "Action", match_context: MatchContext):
+        """
+        Cheap check done before creating the callback for the given action,
+        allowing to skip it altogether when it could not be triggered.
+        """
+        return True
+
     def can_be_triggered(self, match_context: MatchContext):
         raise NotImplementedError
 
@@ -1,16 +1,23 @@
+from typing import TYPE_CHECKING
+
 from dto.actions.match_action_dto import MatchActionDto
 from game_engine.models.actions.abstract.action import Action
 from game_engine.models.dtos.coordinates import Coordinates
 
+if TYPE_CHECKING:
+    from game_engine.models.match.match_context import MatchContext
+    from game_engine.models.turn.turn_state import TurnState
+
 
 class CellAction(Action):
+    __slots__ = ("cell_id",)
 
     def __init__(
         self,
         from_player1: bool,
         impacted_coords: Coordinates,
         originating_coords: Coordinates,
-        cell_id: str,
+        cell_id: int,
     ):
         super().__init__(from_player1, impacted_coords)
         self.cell_id = cell_id
@@ -25,3 +32,35 @@ class CellAction(Action):
             metadata=self.metadata.to_dto(),
             specificMetadata=None,  # meant to be set in subclasses
         )
+
+    def is_valid(self, match_context: "MatchContext", turn_state: "TurnState"):
+        """
+        Checks that the cell is still at the originating coordinates
+        before checking the rules of the action.
+        """
+        originating_coords = self.metadata.originating_coords
+        target_coords = self.metadata.impacted_coords
+        if (
+            self.from_player1 != turn_state.is_player1_turn
+            or not originating_coords.is_on_board()
+            or not target_coords.is_on_board()
+        ):
+            return False
+
+        cell = match_context.game_board.get(*originating_coords.as_tuple())
+        return cell.id == self.cell_id and self.is_legal(
+            match_context, turn_state, originating_coords, target_coords
+        )
+
+    @staticmethod
+    def is_legal(
+        match_context: "MatchContext",
+        turn_state: "TurnState",
+        origin: Coordinates,
+        target: Coordinates,
+    ) -> bool:
+        """
+        Checks whether the cell at the origin can perform the action on the target,
+        for the player whose turn it is.
+        """
+        raise NotImplementedError
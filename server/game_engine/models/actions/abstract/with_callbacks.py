@@ -13,6 +13,8 @@ class WithCallbacks:
     implement common callback logic.
     """
 
+    __slots__ = ("_callbacks_to_trigger",)
+
     CALLBACKS: set[ActionCallBackId] = set()
 
     def __init__(self):
@@ -7,6 +7,18 @@ if TYPE_CHECKING:
     from game_engine.models.actions.abstract.action_callback import ActionCallback
 
 
+def get_callback_type(id: ActionCallBackId) -> type["ActionCallback"]:
+    from game_engine.models.actions.callbacks.mine_explosion_callback import (
+        MineExplosionCallback,
+    )
+
+    CALLBACK_TYPES = {
+        ActionCallBackId.MINE_EXPLOSION: MineExplosionCallback,
+    }
+
+    return CALLBACK_TYPES[id]
+
+
 def get_callback(
     id: ActionCallBackId,
     parent_action: "Action",
@@ -15,14 +27,4 @@ def get_callback(
     """
     Factory method to create a callback based on the given id.
     """
-    from game_engine.models.actions.callbacks.mine_explosion_callback import (
-        MineExplosionCallback,
-    )
-
-    CALLBACKS = {
-        ActionCallBackId.MINE_EXPLOSION: lambda parent_action, parent_callback: MineExplosionCallback(
-            parent_action, parent_callback
-        )
-    }
-
-    return CALLBACKS[id](parent_action, parent_callback)
+    return get_callback_type(id)(parent_action, parent_callback)
@@ -4,8 +4,10 @@ from dto.actions.action_callback_dto import ActionCallbackDto
 from game_engine.models.actions.abstract.action_callback import ActionCallback
 from game_engine.models.actions.callbacks.action_callback_id import ActionCallBackId
 from game_engine.models.dtos.coordinates import Coordinates
-from game_engine.models.game_board import GameBoard
 from game_engine.models.spells.mine_trap_spell import MineTrapSpell
+from utils.bitboard_utils import from_bit_index, get_bit, to_bit_index
+from utils.board_geometry import NEIGHBOURS, NEIGHBOURS_MASKS
+from utils.board_utils import manhattan_distance
 
 if TYPE_CHECKING:
     from game_engine.models.actions.abstract.action import Action
@@ -63,22 +65,42 @@ class MineExplosionCallback(ActionCallback):
         )
         return impacted_cell.is_mine_trap()
 
+    @staticmethod
+    def can_be_registered(parent_action: "Action", match_context):
+        coords = parent_action.metadata.impacted_coords
+        return bool(
+            match_context.game_board.bit_board.mine_traps
+            & get_bit(coords.row_index, coords.column_index)
+        )
+
     def register_callbacks(self, match_context):
         game_board = match_context.game_board
-        row_index, col_index = (
+        mine_traps_mask = game_board.bit_board.mine_traps
+        origin_index = to_bit_index(
             self.explosion_center_coords.row_index,
             self.explosion_center_coords.column_index,
         )
+        # No chained explosion, which is by far the most common case
+        if not NEIGHBOURS_MASKS[origin_index] & mine_traps_mask:
+            return
+
+        explosions_per_radius: dict[int, list[MineExplosionCallback]] = {}
+        for bit_index in self._get_chained_mines(origin_index, mine_traps_mask):
+            row_index, col_index = from_bit_index(bit_index)
+            radius = manhattan_distance(
+                row_index,
+                col_index,
+                self.explosion_center_coords.row_index,
+                self.explosion_center_coords.column_index,
+            )
+
+            callback = MineExplosionCallback(self.parent_action, self)
+            callback.explosion_center_coords = game_board.get(
+                row_index, col_index
+            ).get_coordinates()
+            callback.can_trigger_callbacks = False
+            explosions_per_radius.setdefault(radius, []).append(callback)
 
-        processed_mines = set()
-        explosions_per_radius = {}
-        self._scan_for_neighbour_mines(
-            game_board,
-            (row_index, col_index),
-            (row_index, col_index),
-            processed_mines,
-            explosions_per_radius,
-        )
         # add the explosion callbacks from the closest ones to the farthest ones
         for radius in explosions_per_radius:
             self._callbacks_to_trigger += explosions_per_radius[radius]
@@ -110,56 +132,32 @@ class MineExplosionCallback(ActionCallback):
         )
 
         # The cell is not longer a mine trap
-        impacted_cell.hidden_state_info.reset()
-
-    def _scan_for_neighbour_mines(
-        self,
-        game_board: GameBoard,
-        coords: tuple[int, int],
-        origin_coords: tuple[int, int],
-        processed_mines: set,
-        explosions_per_radius: dict[int, list["MineExplosionCallback"]],
-    ):
-        """
-        Will recursively scan the neighbour mines to add chained explosions
-        into the given dictionary.
-        """
-        current_mine_coords = coords
-        if current_mine_coords in processed_mines:
-            return
-
-        processed_mines.add(current_mine_coords)
-
-        row_index, col_index = coords
-        origin_row, origin_col = origin_coords
-
-        from utils.board_utils import manhattan_distance
+        impacted_cell.reset_hidden_state()
 
-        # Calculate Manhattan distance from origin explosion
-        current_radius = manhattan_distance(
-            row_index, col_index, origin_row, origin_col
-        )
-        if current_radius > 0:  # Don't add the origin mine
-            if current_radius not in explosions_per_radius:
-                explosions_per_radius[current_radius] = []
+    @staticmethod
+    def _get_chained_mines(origin_index: int, mine_traps_mask: int):
+        """
+        Returns the bit indexes of the mines connected to the origin square
+        through adjacent mines, in depth-first discovery order.
 
-            callback = MineExplosionCallback(self.parent_action, self)
-            callback.explosion_center_coords = game_board.get(
-                row_index, col_index
-            ).get_coordinates()
-            callback.can_trigger_callbacks = False
-            explosions_per_radius[current_radius].append(callback)
-
-        neighbours = game_board.get_neighbours(row_index, col_index)
-        mine_neighbours = [
-            neighbour for neighbour in neighbours if neighbour.is_mine_trap()
-        ]
-
-        for neighbour in mine_neighbours:
-            self._scan_for_neighbour_mines(
-                game_board,
-                (neighbour.row_index, neighbour.column_index),
-                (origin_row, origin_col),
-                processed_mines,
-                explosions_per_radius,
-            )
+        The traversal uses an explicit stack over the mines mask, and visits the
+        neighbours in the board's direction order, as the chain order is client-visible.
+        """
+        chained_mines: list[int] = []
+        visited_mask = 1 << origin_index
+        stack = [origin_index]
+        while stack:
+            bit_index = stack.pop()
+            bit = 1 << bit_index
+            if bit_index != origin_index:
+                if visited_mask & bit:
+                    continue
+                visited_mask |= bit
+                chained_mines.append(bit_index)
+
+            # Pushed in reverse so that the first direction gets explored first
+            for neighbour_index in reversed(NEIGHBOURS[bit_index]):
+                if mine_traps_mask & ~visited_mask & (1 << neighbour_index):
+                    stack.append(neighbour_index)
+
+        return chained_mines
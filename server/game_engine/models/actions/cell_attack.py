@@ -1,10 +1,21 @@
+from typing import Iterator
+
 from dto.actions.match_action_dto import ActionType
 from game_engine.models.actions.abstract.cell_action import CellAction
 from game_engine.models.actions.metadata.cell_attack_metadata import CellAttackMetadata
 from game_engine.models.cell.cell import Cell
+from game_engine.models.cell.cell_state import CellState
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
 from game_engine.models.match.match_context import MatchContext
+from game_engine.models.turn.turn_state import TurnState
+from utils.bitboard_utils import (
+    from_bit_index,
+    get_bit,
+    iter_bit_indexes,
+    to_bit_index,
+)
+from utils.board_geometry import NEIGHBOURS_MASKS
 
 
 class CellAttack(CellAction):
@@ -12,6 +23,8 @@ class CellAttack(CellAction):
     Represents a cell attacking another.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         return (
             isinstance(other, CellAttack)
@@ -43,10 +56,15 @@ class CellAttack(CellAction):
     @staticmethod
     def create(
         from_player1: bool,
-        cell_id: str,
+        cell_id: int,
         attacker_coordinates: Coordinates,
         target_coordinates: Coordinates,
+        is_ranged_attack: bool | None = None,
+        is_retaliated: bool = False,
     ):
+        """
+        The attack is tagged as ranged from the coordinates if not specified.
+        """
         cell_attack = CellAttack(
             from_player1=from_player1,
             impacted_coords=target_coordinates,
@@ -54,9 +72,11 @@ class CellAttack(CellAction):
             cell_id=cell_id,
         )
 
+        if is_ranged_attack is None:
+            is_ranged_attack = not attacker_coordinates.is_neighbour(target_coordinates)
         cell_attack.specific_metadata = CellAttackMetadata(
-            is_ranged_attack=not attacker_coordinates.is_neighbour(target_coordinates),
-            is_retaliated=False,
+            is_ranged_attack=is_ranged_attack,
+            is_retaliated=is_retaliated,
         )
 
         return cell_attack
@@ -70,18 +90,81 @@ class CellAttack(CellAction):
         """
         Returns a set of attacks that an owned cell can perform.
         """
-
         attacks: set[CellAttack] = set()
-        if cell.is_archer():
-            CellAttack._calculate_all_attacks(
-                cell, from_player1, transient_game_board, attacks
-            )
-        else:
-            CellAttack._calculate_neighbour_attacks(
-                cell, from_player1, transient_game_board, attacks
+        attacker_coordinates = cell.get_coordinates()
+        for target_index, is_ranged_attack, is_retaliated in CellAttack.get_targets(
+            cell, transient_game_board
+        ):
+            target_cell = transient_game_board.get(*from_bit_index(target_index))
+            target_cell.set_can_be_attacked()
+
+            attacks.add(
+                CellAttack.create(
+                    from_player1,
+                    cell.id,
+                    attacker_coordinates,
+                    target_cell.get_coordinates(),
+                    is_ranged_attack,
+                    is_retaliated,
+                )
             )
+
         return attacks
 
+    @staticmethod
+    def get_targets(
+        cell: Cell, game_board: GameBoard
+    ) -> Iterator[tuple[int, bool, bool]]:
+        """
+        Yields the bit index of each square the given cell can attack (ascending order),
+        along with whether the attack would be ranged and retaliated.
+
+        Archers can attack any enemy cell, the others only their enemy neighbours.
+        Melee attacks are always retaliated, ranged ones only by archers.
+        """
+        bit_board = game_board.bit_board
+        bit_index = to_bit_index(cell.row_index, cell.column_index)
+        enemies_mask = bit_board.get_hostile_to(cell.owner)
+        melee_targets_mask = enemies_mask & NEIGHBOURS_MASKS[bit_index]
+
+        if not cell.is_archer():
+            for target_index in iter_bit_indexes(melee_targets_mask):
+                yield target_index, False, True
+            return
+
+        archers_mask = bit_board.get_state(CellState.ARCHER)
+        for target_index in iter_bit_indexes(enemies_mask):
+            target_bit = 1 << target_index
+            if melee_targets_mask & target_bit:
+                yield target_index, False, True
+            else:
+                yield target_index, True, bool(archers_mask & target_bit)
+
+    @staticmethod
+    def is_legal(
+        match_context: MatchContext,
+        turn_state: TurnState,
+        origin: Coordinates,
+        target: Coordinates,
+    ):
+        cell = match_context.game_board.get(origin.row_index, origin.column_index)
+        if (
+            not cell.belongs_to(turn_state.is_player1_turn)
+            or cell.is_freshly_spawned()
+            or turn_state.has_already_attacked(cell)
+        ):
+            return False
+
+        bit_board = match_context.game_board.bit_board
+        target_bit = get_bit(target.row_index, target.column_index)
+        if not bit_board.get_hostile_to(cell.owner) & target_bit:
+            return False
+
+        return cell.is_archer() or bool(
+            NEIGHBOURS_MASKS[to_bit_index(origin.row_index, origin.column_index)]
+            & target_bit
+        )
+
     def apply(self, match_context: MatchContext):
         """
         Triggers an attack between two cells on the board.
@@ -138,64 +221,3 @@ class CellAttack(CellAction):
             target_cell.damage(
                 player1_resources, player2_resources, death_list=death_list
             )
-
-    @staticmethod
-    def _calculate_all_attacks(
-        cell: Cell,
-        from_player1: bool,
-        transient_game_board: GameBoard,
-        attacks: set["CellAttack"],
-    ):
-        for row in transient_game_board.board:
-            for board_cell in row:
-                if not board_cell.is_hostile_to(cell):
-                    continue
-
-                CellAttack._register_attack(
-                    cell, board_cell, from_player1, transient_game_board, attacks
-                )
-
-    @staticmethod
-    def _calculate_neighbour_attacks(
-        cell: Cell,
-        from_player1: bool,
-        transient_game_board: GameBoard,
-        attacks: set["CellAttack"],
-    ):
-        neighbours: list[Cell] = transient_game_board.get_neighbours(
-            cell.row_index,
-            cell.column_index,
-        )
-        for neighbour in neighbours:
-            if not cell.is_hostile_to(neighbour):
-                continue
-
-            CellAttack._register_attack(
-                cell,
-                neighbour,
-                from_player1,
-                transient_game_board,
-                attacks,
-            )
-
-    @staticmethod
-    def _register_attack(
-        attacker_cell: Cell,
-        target_cell: Cell,
-        from_player1: bool,
-        transient_game_board: GameBoard,
-        attacks: set["CellAttack"],
-    ):
-        transient_board_cell = transient_game_board.get(
-            target_cell.row_index, target_cell.column_index
-        )
-        transient_board_cell.set_can_be_attacked()
-
-        attacks.add(
-            CellAttack.create(
-                from_player1,
-                attacker_cell.id,
-                attacker_cell.get_coordinates(),
-                target_cell.get_coordinates(),
-            )
-        )
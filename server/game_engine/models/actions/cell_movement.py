@@ -1,4 +1,3 @@
-from constants.game_constants import BOARD_SIZE
 from dto.actions.match_action_dto import ActionType
 from game_engine.models.actions.abstract.cell_action import CellAction
 from game_engine.models.actions.callbacks.action_callback_id import ActionCallBackId
@@ -7,7 +6,13 @@ from game_engine.models.cell.cell import Cell
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
 from game_engine.models.match.match_context import MatchContext
-from utils.board_utils import is_out_of_bounds
+from game_engine.models.turn.turn_state import TurnState
+from utils.bitboard_utils import (
+    get_bit,
+    get_orthogonal_neighbours_mask,
+    to_bit_index,
+)
+from utils.board_geometry import PRIMARY_NEIGHBOURS_MASKS
 
 
 class CellMovement(CellAction):
@@ -15,6 +20,8 @@ class CellMovement(CellAction):
     Represents a cell moving from one cell to another
     """
 
+    __slots__ = ()
+
     HOOKS = {ManaBubbleHook()}
     CALLBACKS = {ActionCallBackId.MINE_EXPLOSION}
 
@@ -54,8 +61,8 @@ class CellMovement(CellAction):
         return CellMovement(
             from_player1=from_player1,
             cell_id=cell_id,
-            impacted_coords=Coordinates(new_row_index, new_column_index),
-            originating_coords=Coordinates(row_index, column_index),
+            impacted_coords=Coordinates.of(new_row_index, new_column_index),
+            originating_coords=Coordinates.of(row_index, column_index),
         )
 
     @staticmethod
@@ -71,47 +78,44 @@ class CellMovement(CellAction):
         row_index, column_index = cell.row_index, cell.column_index
 
         movements: set[CellMovement] = set()
-        primary_directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # down, up, left, right
-        for direction in primary_directions:
-            new_row_index = row_index + direction[0]
-            new_col_index = column_index + direction[1]
-
-            if not CellMovement._is_valid_movement_target(
-                new_row_index,
-                new_col_index,
-                cell,
-                transient_game_board,
-            ):
-                continue
-
-            target_cell: Cell = transient_game_board.get(new_row_index, new_col_index)
-
-            if allow_extra_movements:
-                movements = movements.union(
-                    CellMovement._calculate_extra_movements(
-                        cell, target_cell, player1, transient_game_board
-                    )
-                )
-
-            if not target_cell.is_owned():
-                transient_board_cell = transient_game_board.get(
-                    new_row_index, new_col_index
-                )
-                transient_board_cell.set_can_be_moved_into()
-
-                movements.add(
-                    CellMovement.create(
-                        player1,
-                        cell.id,
-                        row_index,
-                        column_index,
-                        new_row_index,
-                        new_col_index,
-                    )
+        targets_mask = CellMovement.get_targets_mask(
+            cell, transient_game_board, allow_extra_movements
+        )
+        for target_cell in transient_game_board.get_cells_from_mask(targets_mask):
+            target_cell.set_can_be_moved_into()
+
+            movements.add(
+                CellMovement.create(
+                    player1,
+                    cell.id,
+                    row_index,
+                    column_index,
+                    target_cell.row_index,
+                    target_cell.column_index,
                 )
+            )
 
         return movements
 
+    @staticmethod
+    def is_legal(
+        match_context: MatchContext,
+        turn_state: TurnState,
+        origin: Coordinates,
+        target: Coordinates,
+    ):
+        game_board = match_context.game_board
+        cell = game_board.get(origin.row_index, origin.column_index)
+        if (
+            not cell.belongs_to(turn_state.is_player1_turn)
+            or cell.is_freshly_spawned()
+            or turn_state.has_already_moved(cell)
+        ):
+            return False
+
+        targets_mask = CellMovement.get_targets_mask(cell, game_board, True)
+        return bool(targets_mask & get_bit(target.row_index, target.column_index))
+
     def apply(self, match_context: MatchContext):
         """
         Moves a cell from the given original coordinates to the given new coordinates.
@@ -135,53 +139,31 @@ class CellMovement(CellAction):
         CellMovement._transfer_cell(cell_original_coords, cell_new_coords)
 
     @staticmethod
-    def _calculate_extra_movements(
+    def get_targets_mask(
         cell: Cell,
-        target_cell: Cell,
-        player1: bool,
-        transient_game_board: GameBoard,
-    ):
-        """
-        Gets the additional movements that a master cell may perform from a primary direction
-        neighbour cell.
-        """
-        additional_movements: set[CellMovement] = CellMovement.calculate(
-            target_cell, player1, transient_game_board, False
-        )
-        return {
-            CellMovement.create(
-                player1,
-                cell.id,
-                cell.row_index,
-                cell.column_index,
-                move.metadata.impacted_coords.row_index,
-                move.metadata.impacted_coords.column_index,
-            )
-            for move in additional_movements
-        }
-
-    @staticmethod
-    def _is_valid_movement_target(
-        row_index,
-        col_index,
-        cell_to_move: Cell,
         game_board: GameBoard,
+        allow_extra_movements: bool,
     ):
         """
-        A valid movement target is:
+        A cell moves in the primary directions (up, down, left, right) to any square that is:
 
         • Not out of bounds
 
-        • Not an enemy cell
+        • Not owned
+
+        Extra movements allow to move once more in a primary direction from any
+        primary direction square that is not an enemy cell.
         """
+        bit_board = game_board.bit_board
+        primary_targets_mask = PRIMARY_NEIGHBOURS_MASKS[
+            to_bit_index(cell.row_index, cell.column_index)
+        ] & ~bit_board.get_hostile_to(cell.owner)
 
-        if CellMovement._is_out_of_bounds(row_index) or CellMovement._is_out_of_bounds(
-            col_index
-        ):
-            return False
+        targets_mask = primary_targets_mask
+        if allow_extra_movements:
+            targets_mask |= get_orthogonal_neighbours_mask(primary_targets_mask)
 
-        target_cell = game_board.get(row_index, col_index)
-        return not target_cell.is_hostile_to(cell_to_move)
+        return targets_mask & bit_board.get_idle()
 
     @staticmethod
     def _transfer_cell(old_cell: Cell, new_cell: Cell):
@@ -197,7 +179,3 @@ class CellMovement(CellAction):
         new_cell.hidden_state_info = new_cell_hidden_state_info
 
         old_cell.kill()
-
-    @staticmethod
-    def _is_out_of_bounds(index: int):
-        return is_out_of_bounds(index, board_size=BOARD_SIZE)
@@ -5,12 +5,14 @@ from dto.actions.match_action_dto import ActionType, MatchActionDto
 from game_engine.models.actions.abstract.action import Action
 from game_engine.models.actions.callbacks.action_callback_id import ActionCallBackId
 from game_engine.models.actions.hooks.mana_bubble_hook import ManaBubbleHook
-from game_engine.models.cell.cell import Cell
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
+from utils.bitboard_utils import get_bit, get_neighbours_mask, to_bit_index
+from utils.board_geometry import NEIGHBOURS_MASKS
 
 if TYPE_CHECKING:
     from game_engine.models.match.match_context import MatchContext
+    from game_engine.models.turn.turn_state import TurnState
 
 
 @dataclass
@@ -19,6 +21,8 @@ class CellSpawn(Action):
     Represents a friendly/enemy cell being summoned.
     """
 
+    __slots__ = ()
+
     DEFAULT_MANA_COST = 1
     HOOKS = {ManaBubbleHook()}
     CALLBACKS = {ActionCallBackId.MINE_EXPLOSION}
@@ -60,7 +64,7 @@ class CellSpawn(Action):
     def create(from_player1: bool, row_index: int, column_index: int):
         return CellSpawn(
             from_player1=from_player1,
-            impacted_coords=Coordinates(row_index, column_index),
+            impacted_coords=Coordinates.of(row_index, column_index),
         )
 
     @staticmethod
@@ -73,28 +77,52 @@ class CellSpawn(Action):
         """
         possible_spawns: set[CellSpawn] = set()
 
-        owned_cells = transient_game_board.get_cells_owned_by_player(from_player1)
-        for cell in owned_cells:
-            row_index, column_index = cell.row_index, cell.column_index
-            neighbours: list[Cell] = transient_game_board.get_neighbours(
-                row_index, column_index
+        bit_board = transient_game_board.bit_board
+        spawn_targets_mask = get_neighbours_mask(
+            bit_board.get_owned(from_player1)
+        ) & bit_board.get_idle()
+        for target_cell in transient_game_board.get_cells_from_mask(
+            spawn_targets_mask
+        ):
+            target_cell.set_can_be_spawned_into()
+
+            possible_spawns.add(
+                CellSpawn.create(
+                    from_player1, target_cell.row_index, target_cell.column_index
+                )
             )
-            for neighbour in neighbours:
-                if neighbour.is_owned():
-                    continue
 
-                transient_board_cell = transient_game_board.get(
-                    neighbour.row_index, neighbour.column_index
-                )
-                transient_board_cell.set_can_be_spawned_into()
+        return possible_spawns
 
-                possible_spawns.add(
-                    CellSpawn.create(
-                        from_player1, neighbour.row_index, neighbour.column_index
-                    )
-                )
+    @staticmethod
+    def is_legal(
+        match_context: "MatchContext",
+        turn_state: "TurnState",
+        target: Coordinates,
+    ):
+        """
+        Checks whether the player whose turn it is can spawn a cell on the target.
+        """
+        player1 = turn_state.is_player1_turn
+        player_resources = match_context.get_player_resources(player1)
+        if player_resources.current_mp < CellSpawn.DEFAULT_MANA_COST:
+            return False
+
+        bit_board = match_context.game_board.bit_board
+        row_index, column_index = target.as_tuple()
+        return bool(
+            bit_board.get_idle() & get_bit(row_index, column_index)
+            and NEIGHBOURS_MASKS[to_bit_index(row_index, column_index)]
+            & bit_board.get_owned(player1)
+        )
 
-        return possible_spawns
+    def is_valid(self, match_context: "MatchContext", turn_state: "TurnState"):
+        target_coords = self.metadata.impacted_coords
+        return (
+            self.from_player1 == turn_state.is_player1_turn
+            and target_coords.is_on_board()
+            and CellSpawn.is_legal(match_context, turn_state, target_coords)
+        )
 
     def apply(self, match_context: "MatchContext"):
         """
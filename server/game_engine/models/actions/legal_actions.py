@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from game_engine.models.actions.abstract.action import Action
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.actions.spell_casting import SpellCasting
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.spells.spell_id import SpellId
+
+
+@dataclass
+class LegalActions:
+    """
+    Every action a player can perform at a given time, grouped by type,
+    and by originating cell for the cell actions.
+    """
+
+    # Originating coordinates | movements of the cell
+    movements: dict[Coordinates, list[CellMovement]]
+    # Originating coordinates | attacks of the cell
+    attacks: dict[Coordinates, list[CellAttack]]
+    spawns: list[CellSpawn]
+    # Spell id | possible castings of the spell
+    spell_castings: dict[SpellId, list[SpellCasting]]
+
+    @staticmethod
+    def get_empty():
+        return LegalActions(movements={}, attacks={}, spawns=[], spell_castings={})
+
+    def __iter__(self) -> Iterator[Action]:
+        for movements in self.movements.values():
+            yield from movements
+        for attacks in self.attacks.values():
+            yield from attacks
+        yield from self.spawns
+        for spell_castings in self.spell_castings.values():
+            yield from spell_castings
+
+    def __len__(self):
+        return (
+            sum(len(movements) for movements in self.movements.values())
+            + sum(len(attacks) for attacks in self.attacks.values())
+            + len(self.spawns)
+            + sum(len(castings) for castings in self.spell_castings.values())
+        )
+
+    def get_cell_actions(self, coordinates: Coordinates) -> list[Action]:
+        """
+        Returns the movements and attacks of the cell at the given coordinates.
+        """
+        return self.movements.get(coordinates, []) + self.attacks.get(coordinates, [])
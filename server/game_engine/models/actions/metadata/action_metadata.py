@@ -4,7 +4,7 @@ from dto.actions.action_metadata_dto import ActionMetadataDto
 from game_engine.models.dtos.coordinates import Coordinates
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionMedatata:
     originating_coords: Coordinates
     impacted_coords: Coordinates
@@ -39,7 +39,11 @@ class ActionMedatata:
 
     def get_default():
         return ActionMedatata(
-            originating_coords=Coordinates(-1, -1),
-            impacted_coords=Coordinates(-1, -1),
+            originating_coords=_NO_COORDINATES,
+            impacted_coords=_NO_COORDINATES,
             deaths=[],
         )
+
+
+# Placeholder for the coordinates an action does not have, shared since immutable
+_NO_COORDINATES = Coordinates(-1, -1)
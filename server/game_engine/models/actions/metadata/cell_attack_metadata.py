@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from dto.actions.cell_attack_metadata_dto import CellAttackMetadataDto
 
 
-@dataclass
+@dataclass(slots=True)
 class CellAttackMetadata:
     is_ranged_attack: bool
     is_retaliated: bool
@@ -8,6 +8,8 @@ from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.game_board import GameBoard
 from game_engine.models.match.match_context import MatchContext
 from game_engine.models.spells.abstract.spell import Spell
+from game_engine.models.spells.targeting_result import TargetingResult
+from game_engine.models.turn.turn_state import TurnState
 
 
 class SpellCasting(Action):
@@ -15,6 +17,8 @@ class SpellCasting(Action):
     Represents the effective invocation of a spell.
     """
 
+    __slots__ = ("spell", "targeting_result")
+
     HOOKS = {StaminaRestorationHook()}
 
     def __init__(
@@ -22,10 +26,14 @@ class SpellCasting(Action):
         from_player1: bool,
         impacted_coords: bool,
         spell: Spell,
+        targeting_result: TargetingResult | None = None,
     ):
         super().__init__(from_player1, impacted_coords)
         self.spell = spell
         self.mana_cost = spell.MANA_COST
+        # Targets of the spell on the board it is casted on, computed when applied
+        # if not given
+        self.targeting_result = targeting_result
 
     def __eq__(self, other):
         return (
@@ -45,15 +53,22 @@ class SpellCasting(Action):
             # contain the count number as it will be sent to both clients
             spell=self.spell.to_partial_dto(),
             metadata=self.metadata.to_dto(),
-            specificMetadata=self.spell.get_specific_metadata_dto(),
+            specificMetadata=self.specific_metadata,
         )
 
     @staticmethod
-    def create(from_player1: bool, spell: Spell, row_index: int, column_index: int):
+    def create(
+        from_player1: bool,
+        spell: Spell,
+        row_index: int,
+        column_index: int,
+        targeting_result: TargetingResult | None = None,
+    ):
         return SpellCasting(
             from_player1=from_player1,
-            impacted_coords=Coordinates(row_index, column_index),
+            impacted_coords=Coordinates.of(row_index, column_index),
             spell=spell,
+            targeting_result=targeting_result,
         )
 
     @staticmethod
@@ -66,27 +81,66 @@ class SpellCasting(Action):
         Returns a set of spell casting actions that can be performed on a cell.
         """
         possible_spell_targets: set[SpellCasting] = set()
-        possible_targets = spell.get_possible_targets(
+        targeting_result = spell.get_possible_targets(
             transient_game_board, from_player1
         )
 
-        for target_coordinates in possible_targets:
+        for target_coordinates in targeting_result:
+            row_index, column_index = target_coordinates.as_tuple()
+            transient_game_board.get(
+                row_index, column_index
+            ).set_can_be_spell_targetted()
             possible_spell_targets.add(
                 SpellCasting.create(
-                    from_player1,
-                    spell,
-                    target_coordinates.row_index,
-                    target_coordinates.column_index,
+                    from_player1, spell, row_index, column_index, targeting_result
                 )
             )
 
         return possible_spell_targets
 
+    @staticmethod
+    def is_legal(
+        match_context: MatchContext,
+        turn_state: TurnState,
+        spell: Spell,
+        target: Coordinates,
+    ):
+        """
+        Checks whether the player whose turn it is can cast the spell on the target.
+
+        The spell targets are cached per board state, so this only searches them
+        once per board.
+        """
+        player1 = turn_state.is_player1_turn
+        player_resources = match_context.get_player_resources(player1)
+        if (
+            player_resources.spells.get(spell.ID, 0) <= 0
+            or player_resources.current_mp < spell.MANA_COST
+        ):
+            return False
+
+        return target in spell.get_possible_targets(match_context.game_board, player1)
+
+    def is_valid(self, match_context: MatchContext, turn_state: TurnState):
+        return self.from_player1 == turn_state.is_player1_turn and (
+            SpellCasting.is_legal(
+                match_context, turn_state, self.spell, self.metadata.impacted_coords
+            )
+        )
+
     def apply(self, match_context: MatchContext):
+        if self.targeting_result is None:
+            self.targeting_result = self.spell.get_possible_targets(
+                match_context.game_board, self.from_player1
+            )
+        self.specific_metadata = self.spell.get_specific_metadata_dto(
+            self.targeting_result
+        )
         callbacks = self.spell.invoke(
             coordinates=self.metadata.impacted_coords,
             match_context=match_context,
             invocator=CellOwner.PLAYER_1 if self.from_player1 else CellOwner.PLAYER_2,
+            spell_casting=self,
         )
         if callbacks:
             # Remove duplicates
@@ -95,6 +149,6 @@ class SpellCasting(Action):
 
     def _decrease_spell_count(self, match_context: MatchContext):
         current_player = match_context.get_current_player()
-        current_player.resources.spells[self.spell.ID] = max(
-            0, current_player.resources.spells[self.spell.ID] - 1
+        current_player.resources.set_spell_count(
+            self.spell.ID, max(0, current_player.resources.spells[self.spell.ID] - 1)
         )
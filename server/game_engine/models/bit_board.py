@@ -0,0 +1,260 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from game_engine.models.cell.cell_hidden_state_info import CellHiddenStateInfo
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.cell.cell_transient_state import CellTransientState
+from utils.bitboard_utils import FULL_MASK, iter_bit_indexes
+from utils.zobrist_utils import ZobristFeature, create_square_keys
+
+if TYPE_CHECKING:
+    from game_engine.models.match.match_journal import MatchJournal
+    from game_engine.models.spells.targeting_result import TargetingResult
+
+# Every single flag a cell state can be made of
+_STATE_FLAGS = (
+    CellState.FRESHLY_SPAWNED,
+    CellState.MANA_BUBBLE,
+    CellState.SHIELDED,
+    CellState.ACCELERATED,
+    CellState.ARCHER,
+)
+
+_TRANSIENT_STATES = tuple(
+    transient_state
+    for transient_state in CellTransientState
+    if transient_state != CellTransientState.NONE
+)
+
+# Zobrist keys of the hashed layers, indexed by bit index
+_PLAYER1_KEYS = create_square_keys(ZobristFeature.PLAYER1_SQUARE)
+_PLAYER2_KEYS = create_square_keys(ZobristFeature.PLAYER2_SQUARE)
+_MASTER_KEYS = create_square_keys(ZobristFeature.MASTER_SQUARE)
+_STATE_KEYS = {
+    flag: create_square_keys(ZobristFeature.STATE_SQUARE, flag) for flag in _STATE_FLAGS
+}
+# Same as above as plain ints, to check the changed flags without any enum operation
+_STATE_FLAG_KEYS = tuple((flag.value, _STATE_KEYS[flag]) for flag in _STATE_FLAGS)
+_MINE_TRAP_KEYS = create_square_keys(ZobristFeature.MINE_TRAP_SQUARE)
+_MINE_TRAP_VISIBLE_TO_PLAYER1_KEYS = create_square_keys(
+    ZobristFeature.MINE_TRAP_VISIBLE_TO_PLAYER1_SQUARE
+)
+_MINE_TRAP_VISIBLE_TO_PLAYER2_KEYS = create_square_keys(
+    ZobristFeature.MINE_TRAP_VISIBLE_TO_PLAYER2_SQUARE
+)
+
+
+@dataclass
+class BitBoard:
+    """
+    Bitmask layers mirroring the cells of a game board.
+
+    Each layer is an integer in which the bit of index row_index * BOARD_SIZE + column_index
+    is set when the square at these coordinates matches the layer.
+    The layers are kept up to date by the cells themselves whenever one of their fields changes.
+
+    The Zobrist hash of every layer but the transient ones is maintained along the way.
+    """
+
+    player1: int
+    player2: int
+    masters: int
+    states: dict[CellState, int]
+    mine_traps: int
+    mine_traps_visible_to_player1: int
+    mine_traps_visible_to_player2: int
+    transient_states: dict[CellTransientState, int]
+    zobrist_hash: int = 0
+    # Id to give to the next cell taking a square, ids being unique within a match
+    next_cell_id: int = 1
+    # Journal the cells report their changes to, not carried over to clones
+    journal: "MatchJournal | None" = field(default=None, repr=False, compare=False)
+    # Spell targets per (Zobrist hash, spell id, player), see Spell.get_possible_targets
+    targeting_results: dict[tuple[int, int, bool], "TargetingResult"] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @staticmethod
+    def get_empty():
+        return BitBoard(
+            player1=0,
+            player2=0,
+            masters=0,
+            states={state: 0 for state in _STATE_FLAGS},
+            mine_traps=0,
+            mine_traps_visible_to_player1=0,
+            mine_traps_visible_to_player2=0,
+            transient_states={state: 0 for state in _TRANSIENT_STATES},
+        )
+
+    def clone(self):
+        return BitBoard(
+            player1=self.player1,
+            player2=self.player2,
+            masters=self.masters,
+            states=dict(self.states),
+            mine_traps=self.mine_traps,
+            mine_traps_visible_to_player1=self.mine_traps_visible_to_player1,
+            mine_traps_visible_to_player2=self.mine_traps_visible_to_player2,
+            transient_states=dict(self.transient_states),
+            zobrist_hash=self.zobrist_hash,
+            next_cell_id=self.next_cell_id,
+        )
+
+    def allocate_cell_id(self):
+        """
+        Returns a new cell id, as a small integer rather than a string
+        to keep the turn state bookkeeping cheap.
+        """
+        cell_id = self.next_cell_id
+        if self.journal is not None:
+            self.journal.record_attribute(self, "next_cell_id", cell_id)
+        self.next_cell_id = cell_id + 1
+        return cell_id
+
+    # region Getters
+
+    def get_owned(self, player1: bool):
+        return self.player1 if player1 else self.player2
+
+    def get_hostile_to(self, owner: CellOwner):
+        """
+        Returns the squares owned by the opponent of the given owner, if any.
+        """
+        if owner == CellOwner.PLAYER_1:
+            return self.player2
+        if owner == CellOwner.PLAYER_2:
+            return self.player1
+        return 0
+
+    def get_occupied(self):
+        return self.player1 | self.player2
+
+    def get_idle(self):
+        return FULL_MASK & ~(self.player1 | self.player2)
+
+    def get_state(self, state: CellState):
+        """
+        Returns the squares having at least one of the flags of the given state.
+        """
+        mask = 0
+        for flag in _STATE_FLAGS:
+            if state & flag:
+                mask |= self.states[flag]
+        return mask
+
+    def get_visible_mine_traps(self, for_player1: bool | None):
+        """
+        Returns the mine traps the given player can see.
+        If no player is given, only the mine traps visible to both players are returned.
+        """
+        if for_player1 is None:
+            return (
+                self.mine_traps_visible_to_player1 & self.mine_traps_visible_to_player2
+            )
+        if for_player1:
+            return self.mine_traps_visible_to_player1
+        return self.mine_traps_visible_to_player2
+
+    def get_transient_state(self, transient_state: CellTransientState):
+        return self.transient_states[transient_state]
+
+    # endregion
+
+    def compute_zobrist_hash(self):
+        """
+        Computes the Zobrist hash of the layers from scratch, meant to check
+        the one maintained incrementally or to hash layers built in bulk.
+        """
+        layers = (
+            (self.player1, _PLAYER1_KEYS),
+            (self.player2, _PLAYER2_KEYS),
+            (self.masters, _MASTER_KEYS),
+            (self.mine_traps, _MINE_TRAP_KEYS),
+            (self.mine_traps_visible_to_player1, _MINE_TRAP_VISIBLE_TO_PLAYER1_KEYS),
+            (self.mine_traps_visible_to_player2, _MINE_TRAP_VISIBLE_TO_PLAYER2_KEYS),
+        ) + tuple((self.states[flag], _STATE_KEYS[flag]) for flag in _STATE_FLAGS)
+
+        zobrist_hash = 0
+        for layer, keys in layers:
+            for bit_index in iter_bit_indexes(layer):
+                zobrist_hash ^= keys[bit_index]
+        return zobrist_hash
+
+    # region Updates
+
+    def update_owner(self, bit: int, old_owner: CellOwner, new_owner: CellOwner):
+        if old_owner == new_owner:
+            return
+
+        bit_index = bit.bit_length() - 1
+        if old_owner == CellOwner.PLAYER_1:
+            self.player1 &= ~bit
+            self.zobrist_hash ^= _PLAYER1_KEYS[bit_index]
+        elif old_owner == CellOwner.PLAYER_2:
+            self.player2 &= ~bit
+            self.zobrist_hash ^= _PLAYER2_KEYS[bit_index]
+
+        if new_owner == CellOwner.PLAYER_1:
+            self.player1 |= bit
+            self.zobrist_hash ^= _PLAYER1_KEYS[bit_index]
+        elif new_owner == CellOwner.PLAYER_2:
+            self.player2 |= bit
+            self.zobrist_hash ^= _PLAYER2_KEYS[bit_index]
+
+    def update_master(self, bit: int, is_master: bool):
+        if bool(self.masters & bit) == is_master:
+            return
+
+        self.masters ^= bit
+        self.zobrist_hash ^= _MASTER_KEYS[bit.bit_length() - 1]
+
+    def update_state(self, bit: int, old_state: int, new_state: int):
+        changed_flags = old_state ^ new_state
+        if not changed_flags:
+            return
+
+        bit_index = bit.bit_length() - 1
+        for flag, state_keys in _STATE_FLAG_KEYS:
+            if changed_flags & flag:
+                self.states[flag] ^= bit
+                self.zobrist_hash ^= state_keys[bit_index]
+
+    def update_hidden_state(self, bit: int, hidden_state_info: CellHiddenStateInfo):
+        is_mine_trap = hidden_state_info.is_mine_trap()
+        visible_to = hidden_state_info.visible_to
+        bit_index = bit.bit_length() - 1
+
+        if bool(self.mine_traps & bit) != is_mine_trap:
+            self.mine_traps ^= bit
+            self.zobrist_hash ^= _MINE_TRAP_KEYS[bit_index]
+
+        visible_to_player1 = is_mine_trap and visible_to in (
+            CellOwner.PLAYER_1,
+            CellOwner.BOTH,
+        )
+        if bool(self.mine_traps_visible_to_player1 & bit) != visible_to_player1:
+            self.mine_traps_visible_to_player1 ^= bit
+            self.zobrist_hash ^= _MINE_TRAP_VISIBLE_TO_PLAYER1_KEYS[bit_index]
+
+        visible_to_player2 = is_mine_trap and visible_to in (
+            CellOwner.PLAYER_2,
+            CellOwner.BOTH,
+        )
+        if bool(self.mine_traps_visible_to_player2 & bit) != visible_to_player2:
+            self.mine_traps_visible_to_player2 ^= bit
+            self.zobrist_hash ^= _MINE_TRAP_VISIBLE_TO_PLAYER2_KEYS[bit_index]
+
+    def update_transient_state(
+        self,
+        bit: int,
+        old_transient_state: CellTransientState,
+        new_transient_state: CellTransientState,
+    ):
+        if old_transient_state != CellTransientState.NONE:
+            self.transient_states[old_transient_state] &= ~bit
+        if new_transient_state != CellTransientState.NONE:
+            self.transient_states[new_transient_state] |= bit
+
+    # endregion
@@ -1,34 +1,184 @@
+from typing import TYPE_CHECKING
+
 from dto.cell.cell_dto import CellDto
 from game_engine.models.cell.cell_hidden_state import CellHiddenState
 from game_engine.models.cell.cell_hidden_state_info import CellHiddenStateInfo
 from game_engine.models.cell.cell_owner import CellOwner
-from game_engine.models.cell.cell_state import CellState
+from game_engine.models.cell.cell_state import (
+    CORE_STATES_MASK,
+    STATE_ACCELERATED,
+    STATE_ARCHER,
+    STATE_FRESHLY_SPAWNED,
+    STATE_MANA_BUBBLE,
+    STATE_NONE,
+    STATE_SHIELDED,
+    CellState,
+)
 from game_engine.models.cell.cell_transient_state import CellTransientState
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.player.player import Player
 from game_engine.models.player.player_resources import PlayerResources
 
+if TYPE_CHECKING:
+    from game_engine.models.bit_board import BitBoard
+
 
 class Cell:
+    __slots__ = (
+        "_bit_board",
+        "_bit",
+        "_owner",
+        "_is_master",
+        "row_index",
+        "column_index",
+        "_state",
+        "_hidden_state_info",
+        "_transient_state",
+        "_id",
+    )
+
     def __init__(
         self,
         owner: CellOwner,
         is_master: bool,
         row_index: int,
         column_index: int,
-        state: CellState,
+        state: CellState | int,
         hidden_state_info: CellHiddenStateInfo,
         transient_state: CellTransientState,
-        id: str,
+        id: int | None,
     ):
-        self.owner = owner
-        self.is_master = is_master
+        # Bitmask layers of the board the cell belongs to (if any),
+        # along with the bit representing the cell's square within them
+        self._bit_board: "BitBoard | None" = None
+        self._bit = 0
+
+        self._owner = owner
+        self._is_master = is_master
         self.row_index = row_index
         self.column_index = column_index
-        self.state = state
-        self.hidden_state_info = hidden_state_info
-        self.transient_state = transient_state
-        self.id = id
+        # Stored as a plain int, see the state property
+        self._state = int(state)
+        self._hidden_state_info = hidden_state_info
+        self._transient_state = transient_state
+        self._id = id
+
+    # region Bit board synced fields
+
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, owner: CellOwner):
+        if self._bit_board is not None:
+            self._record_change("owner", self._owner)
+            self._bit_board.update_owner(self._bit, self._owner, owner)
+        self._owner = owner
+
+    @property
+    def is_master(self):
+        return self._is_master
+
+    @is_master.setter
+    def is_master(self, is_master: bool):
+        if self._bit_board is not None:
+            self._record_change("is_master", self._is_master)
+            self._bit_board.update_master(self._bit, is_master)
+        self._is_master = is_master
+
+    @property
+    def state(self):
+        """
+        The state as a CellState. The cell methods work on the raw int value instead,
+        which avoids creating enum instances on every check.
+        """
+        return CellState(self._state)
+
+    @state.setter
+    def state(self, state: CellState | int):
+        state = int(state)
+        if self._bit_board is not None:
+            self._record_change("state", self._state)
+            self._bit_board.update_state(self._bit, self._state, state)
+        self._state = state
+
+    @property
+    def state_value(self) -> int:
+        """
+        The state as the plain int it is stored as.
+        """
+        return self._state
+
+    @property
+    def hidden_state_info(self):
+        return self._hidden_state_info
+
+    @hidden_state_info.setter
+    def hidden_state_info(self, hidden_state_info: CellHiddenStateInfo):
+        if self._bit_board is not None:
+            self._record_change("hidden_state_info", self._hidden_state_info)
+            self._bit_board.update_hidden_state(self._bit, hidden_state_info)
+        self._hidden_state_info = hidden_state_info
+
+    @property
+    def transient_state(self):
+        return self._transient_state
+
+    @transient_state.setter
+    def transient_state(self, transient_state: CellTransientState):
+        if self._bit_board is not None:
+            self._record_change("transient_state", self._transient_state)
+            self._bit_board.update_transient_state(
+                self._bit, self._transient_state, transient_state
+            )
+        self._transient_state = transient_state
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id: int | None):
+        if self._bit_board is not None:
+            self._record_change("id", self._id)
+        self._id = id
+
+    def attach_to_bit_board(self, bit_board: "BitBoard", bit: int, sync: bool = True):
+        """
+        Binds the cell to the given bit board so that every further change
+        of its fields gets mirrored into the board's bitmask layers.
+
+        If sync is True, the cell's current fields are written into the layers right away.
+        """
+        self._bit_board = bit_board
+        self._bit = bit
+
+        if not sync:
+            return
+
+        bit_board.update_owner(bit, CellOwner.NONE, self._owner)
+        bit_board.update_master(bit, self._is_master)
+        bit_board.update_state(bit, STATE_NONE, self._state)
+        bit_board.update_hidden_state(bit, self._hidden_state_info)
+        bit_board.update_transient_state(
+            bit, CellTransientState.NONE, self._transient_state
+        )
+
+    def _allocate_id(self):
+        if self._bit_board is None:
+            raise ValueError("Only the cells of a board can be given an id")
+        return self._bit_board.allocate_cell_id()
+
+    def _record_change(self, name: str, old_value):
+        """
+        Reports the change of a field to the journal of the board, if any.
+        """
+        journal = self._bit_board.journal
+        if journal is not None:
+            journal.record_attribute(self, name, old_value)
+
+    # endregion
 
     def __eq__(self, other_cell):
         return (
@@ -50,14 +200,21 @@ class Cell:
         )
 
     def to_dto(self, for_player1: bool | None):
+        return self.to_dto_with_hidden_state(self._get_hidden_state(for_player1))
+
+    def to_dto_with_hidden_state(self, hidden_state: CellHiddenState):
+        """
+        Builds the dto with an already projected hidden state,
+        for callers that resolved the visibility of the whole board at once.
+        """
         return CellDto(
-            owner=self.owner,
-            isMaster=self.is_master,
+            owner=self._owner,
+            isMaster=self._is_master,
             rowIndex=self.row_index,
             columnIndex=self.column_index,
-            state=self.state,
-            hiddenState=self._get_hidden_state(for_player1),
-            transientState=self.transient_state,
+            state=CellState(self._state),
+            hiddenState=hidden_state,
+            transientState=self._transient_state,
         )
 
     def clone(self):
@@ -66,14 +223,14 @@ class Cell:
             is_master=self.is_master,
             row_index=self.row_index,
             column_index=self.column_index,
-            state=self.state,
-            hidden_state_info=self.hidden_state_info.clone(),
+            state=self._state,
+            hidden_state_info=self.hidden_state_info,
             transient_state=self.transient_state,
             id=self.id,
         )
 
     def get_coordinates(self):
-        return Coordinates(self.row_index, self.column_index)
+        return Coordinates.of(self.row_index, self.column_index)
 
     @staticmethod
     def get_default_idle_cell(row_index: int, col_index: int):
@@ -82,7 +239,7 @@ class Cell:
             is_master=False,
             row_index=row_index,
             column_index=col_index,
-            state=CellState.NONE,
+            state=STATE_NONE,
             hidden_state_info=CellHiddenStateInfo.default(),
             # hidden_state_info=CellHiddenStateInfo(
             #     state=CellHiddenState.MINE_TRAP, visible_to=CellOwner.PLAYER_1
@@ -92,10 +249,10 @@ class Cell:
         )
 
     def clear_state(self):
-        self.state = CellState.NONE
+        self.state = STATE_NONE
 
     def clear_core_state(self):
-        self.state = self.state.core_states_cleared()
+        self.state = self._state & ~CORE_STATES_MASK
 
     # region ==is==
 
@@ -130,31 +287,31 @@ class Cell:
         Freshly spawned cells are cells that have just been spawned and shouldn't be able to move nor attack
         until next turn.
         """
-        return self.has_state(CellState.FRESHLY_SPAWNED)
+        return bool(self._state & STATE_FRESHLY_SPAWNED)
 
     def is_mana_bubble(self):
         """
         Mana bubbles are cells that give 1 mana point to the player who moves/spawns on them.
         """
-        return self.has_state(CellState.MANA_BUBBLE)
+        return bool(self._state & STATE_MANA_BUBBLE)
 
     def is_shielded(self):
         """
         Shielded cells will pop their shield instead of taking damage.
         """
-        return self.has_state(CellState.SHIELDED)
+        return bool(self._state & STATE_SHIELDED)
 
     def is_accelerated(self):
         """
         Accelerated cells can move and attack twice during the turn.
         """
-        return self.has_state(CellState.ACCELERATED)
+        return bool(self._state & STATE_ACCELERATED)
 
     def is_archer(self):
         """
         Archer cells can attack from a distance.
         """
-        return self.has_state(CellState.ARCHER)
+        return bool(self._state & STATE_ARCHER)
 
     def is_mine_trap(self):
         """
@@ -166,8 +323,8 @@ class Cell:
 
     # region ==has==
 
-    def has_state(self, state: CellState):
-        return self.state.contains(state)
+    def has_state(self, state: CellState | int):
+        return bool(self._state & int(state))
 
     def has_hidden_state(self):
         return self.hidden_state_info.state != CellHiddenState.NONE
@@ -180,7 +337,7 @@ class Cell:
         self.owner = CellOwner.NONE
         self.id = None
         self.is_master = False
-        self.state = CellState.NONE
+        self.state = STATE_NONE
         self.hidden_state_info = CellHiddenStateInfo.default()
         self.transient_state = CellTransientState.NONE
 
@@ -193,7 +350,7 @@ class Cell:
         self.owner = CellOwner.NONE
         self.id = None
         self.is_master = False
-        self.state = CellState.NONE
+        self.state = STATE_NONE
         self.transient_state = CellTransientState.NONE
 
     def copy_state(self, other: "Cell"):
@@ -201,8 +358,8 @@ class Cell:
         self.is_master = other.is_master
         self.row_index = other.row_index
         self.column_index = other.column_index
-        self.state = other.state
-        self.hidden_state_info = other.hidden_state_info.clone()
+        self.state = other._state
+        self.hidden_state_info = other.hidden_state_info
         self.transient_state = other.transient_state
         self.id = other.id
 
@@ -234,30 +391,29 @@ class Cell:
         else:
             self.kill(death_list)
 
-    def remove_state(self, state: CellState):
-        self.state = self.state.remove_state(state)
+    def remove_state(self, state: CellState | int):
+        self.state = self._state & ~int(state)
 
-    def add_modifier(self, modifier: CellState):
-        self.state = self.state.with_modifier(modifier)
+    def add_modifier(self, modifier: CellState | int):
+        modifier = int(modifier)
+        if modifier & CORE_STATES_MASK:
+            raise ValueError("Cannot add a core state as modifier")
+        self.state = self._state | modifier
 
-    def set_owned_by_player1(self, id: str = None):
+    def set_owned_by_player1(self, id: int = None):
         if self.owner == CellOwner.PLAYER_1:
             return
 
-        from utils.id_generation_utils import generate_id
-
         self.owner = CellOwner.PLAYER_1
-        self.id = id if id else generate_id(Cell)
+        self.id = id if id is not None else self._allocate_id()
         self.is_master = False
 
-    def set_owned_by_player2(self, id: str = None):
+    def set_owned_by_player2(self, id: int = None):
         if self.owner == CellOwner.PLAYER_2:
             return
 
-        from utils.id_generation_utils import generate_id
-
         self.owner = CellOwner.PLAYER_2
-        self.id = id if id else generate_id(Cell)
+        self.id = id if id is not None else self._allocate_id()
         self.is_master = False
 
     # region Transient states
@@ -278,12 +434,12 @@ class Cell:
         self.transient_state = CellTransientState.CAN_BE_SPELL_TARGETTED
 
     def set_freshly_spawned(self):
-        self.state = self.state.with_core_state(CellState.FRESHLY_SPAWNED)
+        self.state = self._state & ~CORE_STATES_MASK | STATE_FRESHLY_SPAWNED
 
     # endregion
 
     def set_as_mana_bubble(self):
-        self.state = self.state.with_core_state(CellState.MANA_BUBBLE)
+        self.state = self._state & ~CORE_STATES_MASK | STATE_MANA_BUBBLE
 
     def set_as_mine_trap(self, owner: CellOwner):
         visible_to = owner
@@ -307,8 +463,11 @@ class Cell:
             visible_to=visible_to,
         )
 
+    def reset_hidden_state(self):
+        self.hidden_state_info = CellHiddenStateInfo.default()
+
     def pop_shield(self):
-        self.state = self.state.remove_state(CellState.SHIELDED)
+        self.state = self._state & ~STATE_SHIELDED
 
     # endregion
 
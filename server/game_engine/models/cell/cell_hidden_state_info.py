@@ -4,23 +4,18 @@ from game_engine.models.cell.cell_hidden_state import CellHiddenState
 from game_engine.models.cell.cell_owner import CellOwner
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CellHiddenStateInfo:
+    """
+    Immutable, so that instances can be shared between cells and board clones.
+    """
+
     state: CellHiddenState
     visible_to: CellOwner
 
     @staticmethod
     def default():
-        return CellHiddenStateInfo(
-            state=CellHiddenState.NONE, visible_to=CellOwner.NONE
-        )
-
-    def clone(self):
-        return CellHiddenStateInfo(self.state, self.visible_to)
-
-    def reset(self):
-        self.state = CellHiddenState.NONE
-        self.visible_to = CellOwner.NONE
+        return _DEFAULT_HIDDEN_STATE_INFO
 
     def is_visible_to_player1(self):
         return self.visible_to == CellOwner.PLAYER_1
@@ -33,3 +28,8 @@ class CellHiddenStateInfo:
 
     def is_mine_trap(self):
         return self.state == CellHiddenState.MINE_TRAP
+
+
+_DEFAULT_HIDDEN_STATE_INFO = CellHiddenStateInfo(
+    state=CellHiddenState.NONE, visible_to=CellOwner.NONE
+)
@@ -64,3 +64,20 @@ class CellState(IntFlag):
         return self & ~modifier
 
     # endregion
+
+
+# region Plain int values
+
+# Raw values of the states, for the hot paths (cell checks and updates) where
+# going through the IntFlag operators would create enum instances every time.
+# Cells store their state as a plain int, see Cell.state.
+
+STATE_NONE = CellState.NONE.value
+STATE_FRESHLY_SPAWNED = CellState.FRESHLY_SPAWNED.value
+STATE_MANA_BUBBLE = CellState.MANA_BUBBLE.value
+STATE_SHIELDED = CellState.SHIELDED.value
+STATE_ACCELERATED = CellState.ACCELERATED.value
+STATE_ARCHER = CellState.ARCHER.value
+CORE_STATES_MASK = CellState.CORE_STATES.value
+
+# endregion
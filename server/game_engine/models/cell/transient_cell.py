@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+from game_engine.models.cell.cell import Cell
+from game_engine.models.cell.cell_transient_state import CellTransientState
+
+if TYPE_CHECKING:
+    from game_engine.models.bit_board import BitBoard
+
+
+class _LiveCellField:
+    """
+    Field of a transient cell read from its live cell, that cannot be written
+    through the transient cell.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, transient_cell: "TransientCell | None", owner: type = None):
+        if transient_cell is None:
+            return self
+        return getattr(transient_cell._live_cell, self._name)
+
+    def __set__(self, transient_cell: "TransientCell", value):
+        raise AttributeError(f"Cannot set {self._name} through a transient cell")
+
+
+class TransientCell(Cell):
+    """
+    View over a live cell that only owns its transient state.
+
+    Every other field is read from the live cell and cannot be written through the view.
+    """
+
+    __slots__ = ("_live_cell",)
+
+    def __init__(self, live_cell: Cell, bit_board: "BitBoard", bit: int):
+        self._live_cell = live_cell
+        self.row_index = live_cell.row_index
+        self.column_index = live_cell.column_index
+        self._bit_board = bit_board
+        self._bit = bit
+        self._transient_state = CellTransientState.NONE
+
+    def __getattr__(self, name: str):
+        # Only called for the fields that are not set, looked up on the live cell
+        try:
+            live_cell = object.__getattribute__(self, "_live_cell")
+        except AttributeError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        return getattr(live_cell, name)
+
+    def __repr__(self):
+        return (
+            f"<TransientCell(live_cell={self._live_cell!r}, "
+            f"transient_state={self._transient_state!r})>"
+        )
+
+    # Fields the view does not own, read from the live cell
+    _owner = _LiveCellField()
+    _is_master = _LiveCellField()
+    _state = _LiveCellField()
+    _hidden_state_info = _LiveCellField()
+    _id = _LiveCellField()
+
+    # Read-only views over the live cell's fields
+    owner = property(Cell.owner.fget)
+    is_master = property(Cell.is_master.fget)
+    state = property(Cell.state.fget)
+    hidden_state_info = property(Cell.hidden_state_info.fget)
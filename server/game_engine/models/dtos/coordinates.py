@@ -1,13 +1,51 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from constants.game_constants import PLAYER_1_ROWS, PLAYER_2_ROWS
+from constants.game_constants import BOARD_SIZE, PLAYER_1_ROWS, PLAYER_2_ROWS
 from dto.misc.coordinates_dto import CoordinatesDto
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Coordinates:
+    """
+    Immutable coordinates of a square.
+
+    The coordinates of the board squares are interned, use Coordinates.of to get them
+    rather than building new instances.
+    """
+
     row_index: int
     column_index: int
+    # Same value as the hash of the fields tuple, computed once
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.row_index, self.column_index)))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not Coordinates:
+            return NotImplemented
+        return (
+            self.row_index == other.row_index
+            and self.column_index == other.column_index
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    @staticmethod
+    def of(row_index: int, column_index: int) -> "Coordinates":
+        """
+        Returns the interned instance of the given coordinates, if they are on the board.
+        """
+        if 0 <= row_index < BOARD_SIZE and 0 <= column_index < BOARD_SIZE:
+            return _BOARD_COORDINATES[row_index * BOARD_SIZE + column_index]
+        return Coordinates(row_index, column_index)
+
+    @staticmethod
+    def from_dto(coordinates_dto: CoordinatesDto):
+        return Coordinates.of(coordinates_dto.rowIndex, coordinates_dto.columnIndex)
 
     def to_dto(self):
         return CoordinatesDto(self.row_index, self.column_index)
@@ -15,6 +53,11 @@ class Coordinates:
     def as_tuple(self):
         return (self.row_index, self.column_index)
 
+    def is_on_board(self):
+        return (
+            0 <= self.row_index < BOARD_SIZE and 0 <= self.column_index < BOARD_SIZE
+        )
+
     def is_neighbour(self, other: "Coordinates") -> bool:
         """
         Check if the two coordinates are neighbours.
@@ -39,3 +82,11 @@ class Coordinates:
             return (
                 self.row_index >= player2_min_row and self.row_index <= player2_max_row
             )
+
+
+# Indexed by bit index (row_index * BOARD_SIZE + column_index)
+_BOARD_COORDINATES = tuple(
+    Coordinates(row_index, column_index)
+    for row_index in range(BOARD_SIZE)
+    for column_index in range(BOARD_SIZE)
+)
@@ -1,34 +1,127 @@
-from dataclasses import dataclass
-from typing import Callable
-
-from constants.game_constants import BOARD_SIZE
+from constants.game_constants import (
+    BOARD_SIZE,
+    MANA_BUBBLES_COORDINATES,
+    PLAYER_1_MASTER_STARTING_COORDINATES,
+    PLAYER_2_MASTER_STARTING_COORDINATES,
+)
+from game_engine.models.bit_board import BitBoard
 from game_engine.models.cell.cell import Cell
+from game_engine.models.cell.cell_hidden_state import CellHiddenState
+from game_engine.models.cell.cell_hidden_state_info import CellHiddenStateInfo
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_transient_state import CellTransientState
 from game_engine.models.dtos.coordinates import Coordinates
-from utils.board_utils import get_neighbours
+from utils.bitboard_utils import (
+    SQUARE_COUNT,
+    count_bits,
+    from_bit_index,
+    get_bit,
+    get_lowest_bit_index,
+    iter_bit_indexes,
+    to_bit_index,
+)
+from utils.board_geometry import NEIGHBOURS, NEIGHBOURS_MASKS
 
 
-@dataclass
 class GameBoard:
     """
     Grid/board in which the players play.
+
+    A board can also be created straight from its bit board layers
+    (see from_bit_board), in which case each cell is only built
+    the first time it is accessed.
     """
 
-    board: list[list[Cell]]
-    is_transient: bool
+    def __init__(
+        self,
+        board: list[list[Cell]],
+        is_transient: bool,
+        # Bitmask layers kept in sync by the cells, built from the cells if not provided
+        bit_board: BitBoard | None = None,
+    ):
+        self.is_transient = is_transient
+        sync = bit_board is None
+        if sync:
+            bit_board = BitBoard.get_empty()
+            bit_board.next_cell_id = 1 + max(
+                (cell.id for row in board for cell in row if cell.id is not None),
+                default=0,
+            )
+        self.bit_board = bit_board
+
+        # Flat view of the board, indexed the same way as the bit board,
+        # holding None for the cells not built yet
+        self._cells: list[Cell | None] = [cell for row in board for cell in row]
+        for cell in self._cells:
+            cell.attach_to_bit_board(
+                bit_board, get_bit(cell.row_index, cell.column_index), sync
+            )
+        self._rows: list[list[Cell]] | None = board
+        # Ids of the cells not built yet, by bit index
+        self._cell_ids: list[int | None] = []
+
+        # Ownership index : the cells owned by each player, along with
+        # the ownership mask they correspond to
+        self._owned_cells: dict[bool, tuple[int, tuple[Cell, ...]]] = {}
+
+    def __repr__(self):
+        return f"<GameBoard(board={self.board!r}, is_transient={self.is_transient!r})>"
+
+    @staticmethod
+    def from_bit_board(bit_board: BitBoard, cell_ids: list[int | None]):
+        """
+        Returns a board over the given layers, whose cells are built on demand.
+
+        The cell ids are given by bit index, as the layers do not hold them.
+        """
+        game_board = GameBoard([], is_transient=False, bit_board=bit_board)
+        game_board._cells = [None] * SQUARE_COUNT
+        game_board._rows = None
+        game_board._cell_ids = cell_ids
+        return game_board
+
+    @property
+    def board(self) -> list[list[Cell]]:
+        if self._rows is None:
+            self._rows = [
+                [
+                    self.get(row_index, column_index)
+                    for column_index in range(BOARD_SIZE)
+                ]
+                for row_index in range(BOARD_SIZE)
+            ]
+        return self._rows
 
     def to_dto(self, for_player1: bool | None):
         """
         Note : GameBoardDto is not defined, this simply returns a 2D CellDto array
         """
-        return [[cell.to_dto(for_player1) for cell in row] for row in self.board]
+        visible_mine_traps = self.bit_board.get_visible_mine_traps(for_player1)
+        if not visible_mine_traps:
+            return [
+                [cell.to_dto_with_hidden_state(CellHiddenState.NONE) for cell in row]
+                for row in self.board
+            ]
+
+        return [
+            [
+                cell.to_dto_with_hidden_state(
+                    CellHiddenState.MINE_TRAP
+                    if visible_mine_traps & get_bit(cell.row_index, cell.column_index)
+                    else CellHiddenState.NONE
+                )
+                for cell in row
+            ]
+            for row in self.board
+        ]
 
     @staticmethod
     def get_initial():
-        board = _create_starting_board(BOARD_SIZE)
+        game_board = GameBoard(_create_starting_board(BOARD_SIZE), is_transient=False)
 
         # Initialize the master cells
-        player1_master_cell = board[1][5]
-        player2_master_cell = board[9][5]
+        player1_master_cell = game_board.get(*PLAYER_1_MASTER_STARTING_COORDINATES)
+        player2_master_cell = game_board.get(*PLAYER_2_MASTER_STARTING_COORDINATES)
 
         player1_master_cell.set_owned_by_player1()
         player1_master_cell.is_master = True
@@ -37,23 +130,29 @@ class GameBoard:
         player2_master_cell.is_master = True
 
         # Initialize mana bubbles
-        board[6][5].set_as_mana_bubble()
-        board[5][1].set_as_mana_bubble()
-        board[5][9].set_as_mana_bubble()
+        for row_index, column_index in MANA_BUBBLES_COORDINATES:
+            game_board.get(row_index, column_index).set_as_mana_bubble()
 
-        return GameBoard(board, is_transient=False)
+        return game_board
 
-    def get(self, row_index: int, column_index: int):
-        return self.board[row_index][column_index]
+    def get(self, row_index: int, column_index: int) -> Cell:
+        bit_index = to_bit_index(row_index, column_index)
+        return self._cells[bit_index] or self._build_cell(bit_index)
+
+    def create_transient_overlay(self):
+        """
+        Returns an overlay of the board that can be marked with transient states
+        without affecting this board.
+        """
+        from game_engine.models.transient_game_board import TransientGameBoard
 
-    def clone_as_transient(self):
-        cloned_game_board = self.clone()
-        cloned_game_board.is_transient = True
-        return cloned_game_board
+        return TransientGameBoard(self)
 
     def clone(self):
         cloned_board = [[cell.clone() for cell in row] for row in self.board]
-        return GameBoard(cloned_board, is_transient=False)
+        return GameBoard(
+            cloned_board, is_transient=False, bit_board=self.bit_board.clone()
+        )
 
     def spawn_cell(self, coords: Coordinates, for_player1: bool):
         """
@@ -73,35 +172,123 @@ class GameBoard:
     # region Getters
 
     def get_cells_owned_by_player(self, player1: bool):
+        """
+        Returns the cells owned by the given player, row by row.
+
+        The cells are only looked up again if the player's ownership mask changed
+        since the last call, which the cell mutators keep up to date.
+        """
+        owned_mask = self.bit_board.get_owned(player1)
+        indexed_mask, owned_cells = self._owned_cells.get(player1, (None, ()))
+        if indexed_mask != owned_mask:
+            owned_cells = tuple(self.get_cells_from_mask(owned_mask))
+            self._owned_cells[player1] = (owned_mask, owned_cells)
+
+        return list(owned_cells)
+
+    def get_master(self, player1: bool) -> Cell | None:
+        """
+        Returns the given player's master cell, None if it is dead.
+        """
+        bit_board = self.bit_board
+        master_mask = bit_board.masters & bit_board.get_owned(player1)
+        if not master_mask:
+            return None
+
+        return self.get(*from_bit_index(get_lowest_bit_index(master_mask)))
+
+    def count_cells_owned_by_player(self, player1: bool):
+        return count_bits(self.bit_board.get_owned(player1))
+
+    def get_cells_from_mask(self, mask: int) -> list[Cell]:
+        """
+        Returns the cells of the squares set in the given mask, row by row.
+        """
+        cells = self._cells
         return [
-            cell
-            for row in self.board
-            for cell in row
-            if (player1 and cell.belongs_to_player_1())
-            or (not player1 and cell.belongs_to_player_2())
+            cells[bit_index] or self._build_cell(bit_index)
+            for bit_index in iter_bit_indexes(mask)
         ]
 
     def get_neighbours(self, row_index: int, column_index: int) -> list[Cell]:
-        return get_neighbours(row_index, column_index, self.board)
+        cells = self._cells
+        return [
+            cells[bit_index] or self._build_cell(bit_index)
+            for bit_index in NEIGHBOURS[to_bit_index(row_index, column_index)]
+        ]
 
     def get_owned_neighbours(self, row_index: int, column_index: int) -> list[Cell]:
-        return self._get_neighbours_matching_condition(
-            row_index, column_index, lambda cell: cell.is_owned()
+        neighbours_mask = NEIGHBOURS_MASKS[to_bit_index(row_index, column_index)]
+        return self.get_cells_from_mask(
+            neighbours_mask & self.bit_board.get_occupied()
         )
 
     def get_idle_neighbours(self, row_index: int, column_index: int) -> list[Cell]:
-        return self._get_neighbours_matching_condition(
-            row_index, column_index, lambda cell: not cell.is_owned()
-        )
+        neighbours_mask = NEIGHBOURS_MASKS[to_bit_index(row_index, column_index)]
+        return self.get_cells_from_mask(neighbours_mask & self.bit_board.get_idle())
 
-    def _get_neighbours_matching_condition(
-        self, row_index: int, column_index: int, condition: Callable[[Cell], bool]
-    ) -> list[Cell]:
-        neighbours = self.get_neighbours(row_index, column_index)
-        return [cell for cell in neighbours if condition(cell)]
+    def get_cell_ids(self) -> list[int | None]:
+        """
+        Returns the id of the cell of each square, by bit index,
+        without building the cells not built yet.
+        """
+        cell_ids = self._cell_ids
+        return [
+            cell_ids[bit_index] if cell is None else cell.id
+            for bit_index, cell in enumerate(self._cells)
+        ]
 
     # endregion
 
+    def _build_cell(self, bit_index: int):
+        """
+        Builds the cell of the given square from the bit board layers.
+        """
+        bit_board = self.bit_board
+        bit = 1 << bit_index
+
+        owner = CellOwner.NONE
+        if bit_board.player1 & bit:
+            owner = CellOwner.PLAYER_1
+        elif bit_board.player2 & bit:
+            owner = CellOwner.PLAYER_2
+
+        state = 0
+        for flag, state_mask in bit_board.states.items():
+            if state_mask & bit:
+                state |= flag
+
+        hidden_state_info = CellHiddenStateInfo.default()
+        if bit_board.mine_traps & bit:
+            hidden_state_info = CellHiddenStateInfo(
+                state=CellHiddenState.MINE_TRAP,
+                visible_to=CellOwner(
+                    bool(bit_board.mine_traps_visible_to_player1 & bit)
+                    | bool(bit_board.mine_traps_visible_to_player2 & bit) << 1
+                ),
+            )
+
+        transient_state = CellTransientState.NONE
+        for candidate, transient_state_mask in bit_board.transient_states.items():
+            if transient_state_mask & bit:
+                transient_state = candidate
+                break
+
+        row_index, column_index = from_bit_index(bit_index)
+        cell = Cell(
+            owner,
+            bool(bit_board.masters & bit),
+            row_index,
+            column_index,
+            state,
+            hidden_state_info,
+            transient_state,
+            self._cell_ids[bit_index],
+        )
+        cell.attach_to_bit_board(bit_board, bit, sync=False)
+        self._cells[bit_index] = cell
+        return cell
+
 
 def _create_starting_board(board_size: int):
     return [
@@ -12,6 +12,8 @@ class MatchClosureInfo:
     loser: Player | None  # None if draw or no loser
     total_turns: int
     actions_per_turn_serialized: dict[int, list[dict]]
+    # Seed of the match's random draws, to replay it from its actions
+    rng_seed: int
 
     def simple_str(self) -> str:
         """
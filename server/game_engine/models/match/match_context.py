@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+import random
+from dataclasses import dataclass, field
 
 from ai import AI_PLAYER_USERNAME
 from dto.match.match_context_dto import MatchContextDto
 from game_engine.models.dtos.room import Room
 from game_engine.models.game_board import GameBoard
+from game_engine.models.match.match_journal import MatchJournal
 from game_engine.models.player.player import Player
+from utils.rng_utils import RngStream, generate_seed, get_seeded_rng
+from utils.zobrist_utils import ZobristFeature, get_zobrist_key, salt_zobrist_hash
 
 
 @dataclass
@@ -21,6 +25,19 @@ class MatchContext:
     game_board: GameBoard
     player1: Player
     player2: Player
+    # Records the changes of the board and resources, so that they can be undone
+    journal: MatchJournal = field(
+        default_factory=MatchJournal, repr=False, compare=False
+    )
+    # Every random draw of the match derives from it, so that it can be replayed
+    rng_seed: int = field(default_factory=generate_seed, compare=False)
+    # Number of generators handed out by get_rng so far
+    rng_draws: int = field(default=0, compare=False)
+
+    def __post_init__(self):
+        self.game_board.bit_board.journal = self.journal
+        self.player1.resources.attach_journal(self.journal)
+        self.player2.resources.attach_journal(self.journal)
 
     def to_dto(self, for_player1: bool | None):
         """
@@ -38,9 +55,10 @@ class MatchContext:
         )
 
     @staticmethod
-    def get_initial(id: str, room: Room):
+    def get_initial(id: str, room: Room, rng_seed: int | None = None):
         return MatchContext(
             id=id,
+            rng_seed=generate_seed() if rng_seed is None else rng_seed,
             room_id=room.id,
             game_board=GameBoard.get_initial(),
             current_turn=0,
@@ -61,9 +79,51 @@ class MatchContext:
             ),
         )
 
+    def get_zobrist_hash(self) -> int:
+        """
+        Returns the Zobrist hash of the match state : board, players' resources
+        and side to move. Every part is maintained incrementally, so this is O(1).
+        """
+        zobrist_hash = (
+            self.game_board.bit_board.zobrist_hash
+            ^ salt_zobrist_hash(
+                self.player1.resources.get_zobrist_hash(),
+                ZobristFeature.PLAYER1_RESOURCES,
+            )
+            ^ salt_zobrist_hash(
+                self.player2.resources.get_zobrist_hash(),
+                ZobristFeature.PLAYER2_RESOURCES,
+            )
+        )
+        if self.is_player1_turn:
+            zobrist_hash ^= get_zobrist_key(ZobristFeature.PLAYER1_TURN)
+        return zobrist_hash
+
+    def undo(self):
+        """
+        Reverts the last action processed since the journal was started,
+        along with everything it triggered (hooks, callbacks, turn state counters).
+        """
+        self.journal.undo()
+
+    def get_rng(self) -> random.Random:
+        """
+        Returns the generator to use for the next random event of the match.
+
+        It only depends on the seed and the number of events before it, which is
+        journaled, so undoing an action also rewinds its draws.
+        """
+        self.journal.record_attribute(self, "rng_draws", self.rng_draws)
+        rng = get_seeded_rng(self.rng_seed, RngStream.GAME, self.rng_draws)
+        self.rng_draws += 1
+        return rng
+
     def get_current_player(self):
         return self.player1 if self.is_player1_turn else self.player2
 
+    def get_master(self, player1: bool):
+        return self.game_board.get_master(player1)
+
     def get_player_resources(self, player1_resources: bool):
         return self.player1.resources if player1_resources else self.player2.resources
 
@@ -0,0 +1,109 @@
+from typing import Any, Callable
+
+# Marks a dictionary key that did not exist before being recorded
+_MISSING = object()
+
+
+class MatchJournal:
+    """
+    Records the field changes made to a match so that they can be undone,
+    which allows exploring positions without cloning the board or the resources.
+
+    Changes are grouped into entries, and are only recorded while an entry is open,
+    from `begin_entry` until `end_entry`, the next `begin_entry` or an undo.
+    The match models (cells, player resources, turn state) report their own changes
+    to the journal they are attached to.
+    """
+
+    def __init__(self):
+        # Each entry is a list of (restore function, arguments) to call in reverse order
+        self._entries: list[list[tuple[Callable[..., Any], tuple]]] = []
+        self._is_enabled = False
+        self._is_entry_open = False
+        self._is_undoing = False
+
+    def is_recording(self):
+        return self._is_entry_open and not self._is_undoing
+
+    def start(self):
+        """
+        Enables the journal, every entry begun from now on will be recorded.
+        """
+        self._is_enabled = True
+
+    def stop(self):
+        """
+        Disables the journal and discards the recorded entries.
+        """
+        self._is_enabled = False
+        self.clear()
+
+    def clear(self):
+        """
+        Discards the recorded entries, typically once the match was set to
+        a position they do not lead to. The journal stays enabled if it was.
+        """
+        self._is_entry_open = False
+        self._entries = []
+
+    def begin_entry(self):
+        """
+        Opens a new entry, that will hold all the changes until it ends
+        or the next one begins. Does nothing if the journal is not enabled.
+        """
+        if self._is_enabled:
+            self._entries.append([])
+            self._is_entry_open = True
+
+    def end_entry(self):
+        """
+        Closes the open entry, if any, so that no further change gets recorded into it.
+        """
+        self._is_entry_open = False
+
+    def can_undo(self):
+        return bool(self._entries)
+
+    def undo(self):
+        """
+        Restores every field changed since the last entry began, and closes it.
+        """
+        if not self._entries:
+            raise ValueError("There is nothing to undo")
+
+        entry = self._entries.pop()
+        self._is_entry_open = False
+        self._is_undoing = True
+        try:
+            for restore, arguments in reversed(entry):
+                restore(*arguments)
+        finally:
+            self._is_undoing = False
+
+    # region Recording
+
+    def record_attribute(self, target: object, name: str, old_value: Any):
+        if self.is_recording():
+            self._entries[-1].append((setattr, (target, name, old_value)))
+
+    def record_item(self, dictionary: dict, key: Any):
+        if self.is_recording():
+            old_value = dictionary.get(key, _MISSING)
+            self._entries[-1].append((_restore_item, (dictionary, key, old_value)))
+
+    def record_call(self, restore: Callable[..., Any], *arguments: Any):
+        """
+        Records a custom restore function, for the changes that cannot simply be
+        written back (e.g. because some derived data must be kept in sync).
+        """
+        if self.is_recording():
+            self._entries[-1].append((restore, arguments))
+
+    # endregion
+
+
+def _restore_item(dictionary: dict, key: Any, old_value: Any):
+    if old_value is _MISSING:
+        dictionary.pop(key, None)
+    else:
+        dictionary[key] = old_value
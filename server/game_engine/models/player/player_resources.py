@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from constants.game_constants import MAX_HP_VALUE, MAX_MP_VALUE, MAX_STAMINA_VALUE
 from dto.player.player_resources_dto import PlayerResourcesDto
@@ -6,6 +7,23 @@ from dto.spell.spell_dto import SpellDto
 from dto.spell.spells_dto import SpellsDto
 from game_engine.models.spells.spell_factory import get_initial_spell_deck, get_spell
 from game_engine.models.spells.spell_id import SpellId
+from utils.zobrist_utils import ZobristFeature, get_zobrist_key
+
+if TYPE_CHECKING:
+    from game_engine.models.match.match_journal import MatchJournal
+
+# The resources that take part in the Zobrist hash, along with their key identifier
+_HASHED_RESOURCES = {
+    "max_hp": 0,
+    "current_hp": 1,
+    "max_mp": 2,
+    "current_mp": 3,
+    "current_stamina": 4,
+    "max_stamina": 5,
+}
+
+# Marks a slot that has not been assigned yet
+_UNSET = object()
 
 
 @dataclass
@@ -13,8 +31,26 @@ class PlayerResources:
     """
     The player resources that the player uses directly or indirectly during a match,
     such as HP, MP, stamina and their spells.
+
+    Every assignment updates their Zobrist hash and gets recorded into their journal
+    (if any), which means the spells dictionary must only be changed
+    through set_spell_count.
     """
 
+    # The dataclass fields, followed by the incrementally maintained Zobrist hash
+    # and the journal, which are not fields
+    __slots__ = (
+        "max_hp",
+        "current_hp",
+        "max_mp",
+        "current_mp",
+        "spells",
+        "current_stamina",
+        "max_stamina",
+        "_zobrist_hash",
+        "_journal",
+    )
+
     max_hp: int
     current_hp: int
     max_mp: int
@@ -36,6 +72,51 @@ class PlayerResources:
             max_stamina=MAX_STAMINA_VALUE,
         )
 
+    def __setattr__(self, name: str, value):
+        old_value = getattr(self, name, _UNSET)
+        journal: "MatchJournal | None" = getattr(self, "_journal", None)
+        if journal is not None and old_value is not _UNSET:
+            journal.record_attribute(self, name, old_value)
+
+        resource_id = _HASHED_RESOURCES.get(name)
+        if resource_id is not None:
+            zobrist_hash = self.get_zobrist_hash()
+            if old_value is not _UNSET:
+                zobrist_hash ^= _get_resource_key(resource_id, old_value)
+            zobrist_hash ^= _get_resource_key(resource_id, value)
+            object.__setattr__(self, "_zobrist_hash", zobrist_hash)
+        elif name == "spells":
+            zobrist_hash = self.get_zobrist_hash()
+            if old_value is not _UNSET:
+                zobrist_hash ^= _get_spells_zobrist_hash(old_value)
+            zobrist_hash ^= _get_spells_zobrist_hash(value)
+            object.__setattr__(self, "_zobrist_hash", zobrist_hash)
+
+        object.__setattr__(self, name, value)
+
+    def get_zobrist_hash(self) -> int:
+        return getattr(self, "_zobrist_hash", 0)
+
+    def attach_journal(self, journal: "MatchJournal"):
+        """
+        Binds the resources to the given journal so that every further change
+        gets recorded into it.
+        """
+        object.__setattr__(self, "_journal", journal)
+
+    def set_spell_count(self, spell_id: SpellId, count: int):
+        zobrist_hash = self.get_zobrist_hash()
+        if spell_id in self.spells:
+            old_count = self.spells[spell_id]
+            zobrist_hash ^= _get_spell_count_key(spell_id, old_count)
+            journal = getattr(self, "_journal", None)
+            if journal is not None:
+                journal.record_call(self.set_spell_count, spell_id, old_count)
+        zobrist_hash ^= _get_spell_count_key(spell_id, count)
+        object.__setattr__(self, "_zobrist_hash", zobrist_hash)
+
+        self.spells[spell_id] = count
+
     def to_dto(self):
         return PlayerResourcesDto(
             maxHP=self.max_hp,
@@ -55,3 +136,18 @@ class PlayerResources:
             result.append(spell.to_dto(count))
 
         return SpellsDto(result)
+
+
+def _get_resource_key(resource_id: int, value: int):
+    return get_zobrist_key(ZobristFeature.RESOURCE, resource_id, value)
+
+
+def _get_spell_count_key(spell_id: SpellId, count: int):
+    return get_zobrist_key(ZobristFeature.SPELL_COUNT, spell_id, count)
+
+
+def _get_spells_zobrist_hash(spells: dict[SpellId, int]):
+    zobrist_hash = 0
+    for spell_id, count in spells.items():
+        zobrist_hash ^= _get_spell_count_key(spell_id, count)
+    return zobrist_hash
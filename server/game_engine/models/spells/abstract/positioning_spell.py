@@ -1,10 +1,9 @@
 from typing import TYPE_CHECKING
 
-from dto.misc.coordinates_dto import CoordinatesDto
 from dto.spell.metadata.positioning_info_dto import PositioningInfoDto
-from game_engine.models.cell.cell_transient_state import CellTransientState
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.spells.abstract.spell import Spell
+from game_engine.models.spells.targeting_result import TargetingResult
 
 if TYPE_CHECKING:
     from game_engine.models.game_board import GameBoard
@@ -16,27 +15,16 @@ class PositioningSpell(Spell):
     (e.g. a line, a square, etc.).
     """
 
-    def __init__(self):
-        super().__init__()
-        # A formation represents a specific arrangement of cells.
-        # A cell can overlap on multiple formations, so we will have to choose which formation
-        # it is associated with.
-        # The coordinates key represent the cell, the int value represents the formation index in _cell_formations list
-        self._formation_per_cell: dict[Coordinates, int] = {}
-        self._cell_formations: list[list[Coordinates]] = []
-        self._already_associated_cells: set[Coordinates] = set()
+    def get_specific_metadata_dto(self, targeting_result: TargetingResult):
+        return self._get_positioning_info_dto(targeting_result)
 
-    def get_specific_metadata_dto(self):
-        return self._get_positioning_info_dto()
-
-    def get_impacted_cells(self, coordinates: Coordinates) -> list[Coordinates]:
+    def get_impacted_cells(
+        self, coordinates: Coordinates, targeting_result: TargetingResult
+    ):
         """
         Returns the formation associated with the given coordinates.
         """
-        formation_idx = self._formation_per_cell.get(coordinates)
-        if formation_idx is not None:
-            return self._cell_formations[formation_idx]
-        return [coordinates]
+        return targeting_result.get_formation(coordinates)
 
     @staticmethod
     def coordinates_to_key_string(coordinates: Coordinates):
@@ -46,36 +34,44 @@ class PositioningSpell(Spell):
     def _initialize_target_searching(
         self, transient_board: "GameBoard", from_player1: bool
     ):
-        self._already_associated_cells = set()
-
         cell_pool = transient_board.get_cells_owned_by_player(from_player1)
 
         # Convert cell pool to a set of coordinates for faster lookup
         cell_coordinates = {(cell.row_index, cell.column_index) for cell in cell_pool}
         return cell_coordinates
 
-    def _update_transient_board(
-        self, transient_board: "GameBoard", formation: list[Coordinates]
-    ):
-        for coords in formation:
-            transient_cell = transient_board.get(coords.row_index, coords.column_index)
-            transient_cell.transient_state = CellTransientState.CAN_BE_SPELL_TARGETTED
+    @staticmethod
+    def _create_targeting_result(formations: list[list[Coordinates]]):
+        """
+        Returns the targeting result matching the given formations,
+        each cell being associated with the first formation it belongs to.
+        """
+        possible_targets: list[Coordinates] = []
+        formation_per_cell: dict[Coordinates, int] = {}
+
+        for formation_index, formation in enumerate(formations):
+            possible_targets.extend(formation)
+            for cell_coords in formation:
+                formation_per_cell.setdefault(cell_coords, formation_index)
 
-    def _get_positioning_info_dto(self):
+        return TargetingResult.create(possible_targets, formations, formation_per_cell)
+
+    def _get_positioning_info_dto(self, targeting_result: TargetingResult):
         """
         Returns the positioning info of the spell, including the cell formation and the mapping
         of coordinates to formation indices.
         """
-        formations_dto: list[list[CoordinatesDto]] = []
-
         formations_dto = [
-            [coords.to_dto() for coords in square] for square in self._cell_formations
+            [coords.to_dto() for coords in formation]
+            for formation in targeting_result.formations
         ]
 
         # ⚠️ The key format "row_index,col_index" is being used by the client
         formation_per_coordinates = {
-            PositioningSpell.coordinates_to_key_string(cell_coords): square_index
-            for (cell_coords, square_index) in self._formation_per_cell.items()
+            PositioningSpell.coordinates_to_key_string(cell_coords): formation_index
+            for (cell_coords, formation_index) in (
+                targeting_result.formation_per_cell.items()
+            )
         }
 
         return PositioningInfoDto(
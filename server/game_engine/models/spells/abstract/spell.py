@@ -1,3 +1,4 @@
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from constants.game_constants import DEFAULT_SPELL_ORIGINAL_COUNT
@@ -5,9 +6,11 @@ from dto.spell.partial_spell_dto import PartialSpellDto
 from dto.spell.spell_dto import SpellDto
 from game_engine.models.cell.cell_owner import CellOwner
 from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.spells.targeting_result import TargetingResult
 
 if TYPE_CHECKING:
     from game_engine.models.actions.abstract.action_callback import ActionCallback
+    from game_engine.models.actions.spell_casting import SpellCasting
     from game_engine.models.game_board import GameBoard
     from game_engine.models.match.match_context import MatchContext
 
@@ -15,6 +18,9 @@ if TYPE_CHECKING:
 class Spell:
     """
     Base class for all spells.
+
+    Spells are shared across all matches (see the spell factory), so they must not
+    hold any state related to a specific board or casting.
     """
 
     ID = 0
@@ -25,56 +31,87 @@ class Spell:
     CONDITION_NOT_MET_ERROR_MESSAGE = "Cannot cast this spell"
     INVALID_SELECTION_ERROR_MESSAGE = "Invalid selection for this spell"
 
+    # Maximum number of targeting results kept per board, all spells included
+    TARGETING_CACHE_SIZE = 64
+
     def to_dto(self, count: int):
-        return SpellDto(
-            id=self.ID,
-            name=self.NAME,
-            description=self.DESCRIPTION,
-            manaCost=self.MANA_COST,
-            count=count,
-            maxCount=self.ORIGINAL_COUNT,
-        )
-
-    def to_partial_dto(self):
-        return PartialSpellDto(
-            id=self.ID,
-            name=self.NAME,
-            description=self.DESCRIPTION,
-            manaCost=self.MANA_COST,
-        )
+        return _get_spell_dto(type(self), count)
 
     @classmethod
     def to_partial_dto(cls):
-        return PartialSpellDto(
-            id=cls.ID,
-            name=cls.NAME,
-            description=cls.DESCRIPTION,
-            manaCost=cls.MANA_COST,
-        )
+        return _get_partial_spell_dto(cls)
 
     def get_possible_targets(
         self, board: "GameBoard", from_player1: bool
-    ) -> list[Coordinates]:
-        raise NotImplementedError
+    ) -> TargetingResult:
+        """
+        Returns the coordinates the spell can be casted on.
+
+        The targets only depend on the board state, so they are cached
+        on the board's bit board, per Zobrist hash.
+        """
+        targeting_results = board.bit_board.targeting_results
+        cache_key = (board.bit_board.zobrist_hash, self.ID, from_player1)
+        targeting_result = targeting_results.get(cache_key)
+        if targeting_result is None:
+            targeting_result = self._find_targets(board, from_player1)
+            if len(targeting_results) >= self.TARGETING_CACHE_SIZE:
+                # Evict the oldest result
+                targeting_results.pop(next(iter(targeting_results)), None)
+            targeting_results[cache_key] = targeting_result
+
+        return targeting_result
 
-    def get_impacted_cells(self, coordinates: Coordinates) -> list[Coordinates]:
+    def get_impacted_cells(
+        self, coordinates: Coordinates, targeting_result: TargetingResult
+    ) -> tuple[Coordinates, ...]:
         """
-        Returns the list of coordinates that will be impacted by the spell
+        Returns the coordinates that will be impacted by the spell
         if casted on the given coordinates.
         By default, only the target coordinate is impacted.
         """
-        return [coordinates]
+        return (coordinates,)
 
     def invoke(
         self,
         coordinates: Coordinates,
         match_context: "MatchContext",
         invocator: CellOwner,
+        spell_casting: "SpellCasting",
     ) -> list["ActionCallback"] | None:
         """
         Invokes the spell at the given coordinates, and possibly returns a list of action callbacks.
+
+        Anything specific to this casting must be stored on the given spell casting.
         """
         raise NotImplementedError
 
-    def get_specific_metadata_dto(self) -> None | Any:
+    def get_specific_metadata_dto(
+        self, targeting_result: TargetingResult
+    ) -> None | Any:
         return None
+
+    def _find_targets(self, board: "GameBoard", from_player1: bool) -> TargetingResult:
+        raise NotImplementedError
+
+
+@cache
+def _get_spell_dto(spell_type: type[Spell], count: int):
+    return SpellDto(
+        id=spell_type.ID,
+        name=spell_type.NAME,
+        description=spell_type.DESCRIPTION,
+        manaCost=spell_type.MANA_COST,
+        count=count,
+        maxCount=spell_type.ORIGINAL_COUNT,
+    )
+
+
+@cache
+def _get_partial_spell_dto(spell_type: type[Spell]):
+    return PartialSpellDto(
+        id=spell_type.ID,
+        name=spell_type.NAME,
+        description=spell_type.DESCRIPTION,
+        manaCost=spell_type.MANA_COST,
+    )
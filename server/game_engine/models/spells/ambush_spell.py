@@ -1,4 +1,3 @@
-import random
 from typing import TYPE_CHECKING
 
 from constants.game_constants import SPELLS_MANA_COST
@@ -7,8 +6,10 @@ from game_engine.models.cell.cell_owner import CellOwner
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.spells.abstract.spell import Spell
 from game_engine.models.spells.spell_id import SpellId
+from game_engine.models.spells.targeting_result import TargetingResult
 
 if TYPE_CHECKING:
+    from game_engine.models.actions.spell_casting import SpellCasting
     from game_engine.models.game_board import GameBoard
     from game_engine.models.match.match_context import MatchContext
 
@@ -23,11 +24,7 @@ class AmbushSpell(Spell):
 
     MAX_SPAWNED_CELLS = 2
 
-    def __init__(self):
-        super().__init__()
-        self._spawn_coordinates: list[Coordinates] = []
-
-    def get_possible_targets(self, transient_board: "GameBoard", from_player1: bool):
+    def _find_targets(self, transient_board: "GameBoard", from_player1: bool):
         possible_targets: list[Coordinates] = []
         enemy_cells = transient_board.get_cells_owned_by_player(
             player1=not from_player1
@@ -35,16 +32,16 @@ class AmbushSpell(Spell):
 
         for cell in enemy_cells:
             if transient_board.get_idle_neighbours(cell.row_index, cell.column_index):
-                cell.set_can_be_spell_targetted()
                 possible_targets.append(cell.get_coordinates())
 
-        return possible_targets
+        return TargetingResult.create(possible_targets)
 
     def invoke(
         self,
         coordinates: Coordinates,
         match_context: "MatchContext",
         invocator: CellOwner,
+        spell_casting: "SpellCasting",
     ):
         from game_engine.models.actions.cell_spawn import CellSpawn
 
@@ -59,10 +56,10 @@ class AmbushSpell(Spell):
         ):
             number_of_cells_to_spawn += 1
 
-        selected_neighbours = random.sample(
+        selected_neighbours = match_context.get_rng().sample(
             idle_neighbours, min(number_of_cells_to_spawn, len(idle_neighbours))
         )
-        self._spawn_coordinates = []
+        spawn_coordinates: list[Coordinates] = []
 
         callbacks = []
         for neighbour in selected_neighbours:
@@ -74,14 +71,11 @@ class AmbushSpell(Spell):
             )
             cell_spawn.apply(match_context)
             callbacks.extend(cell_spawn._callbacks_to_trigger)
-            self._spawn_coordinates.append(coordinates)
+            spawn_coordinates.append(coordinates)
 
+        spell_casting.specific_metadata = self._get_spawn_info_dto(spawn_coordinates)
         return callbacks
 
-    def get_specific_metadata_dto(self):
-        return self._get_spawn_info_dto()
-
-    def _get_spawn_info_dto(self):
-        return SpawnInfoDto(
-            coordinates=[coord.to_dto() for coord in self._spawn_coordinates]
-        )
+    @staticmethod
+    def _get_spawn_info_dto(spawn_coordinates: list[Coordinates]):
+        return SpawnInfoDto(coordinates=[coord.to_dto() for coord in spawn_coordinates])
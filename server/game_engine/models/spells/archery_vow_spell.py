@@ -6,8 +6,10 @@ from game_engine.models.cell.cell_state import CellState
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.spells.abstract.spell import Spell
 from game_engine.models.spells.spell_id import SpellId
+from game_engine.models.spells.targeting_result import TargetingResult
 
 if TYPE_CHECKING:
+    from game_engine.models.actions.spell_casting import SpellCasting
     from game_engine.models.game_board import GameBoard
     from game_engine.models.match.match_context import MatchContext
 
@@ -24,7 +26,7 @@ class ArcheryVowSpell(Spell):
         "You must select a minion cell with no neighbours to apply archery vow"
     )
 
-    def get_possible_targets(self, transient_board: "GameBoard", from_player1: bool):
+    def _find_targets(self, transient_board: "GameBoard", from_player1: bool):
         possible_targets: list[Coordinates] = []
         cell_pool = transient_board.get_cells_owned_by_player(from_player1)
 
@@ -35,16 +37,16 @@ class ArcheryVowSpell(Spell):
             ):
                 continue
 
-            cell.set_can_be_spell_targetted()
             possible_targets.append(cell.get_coordinates())
 
-        return possible_targets
+        return TargetingResult.create(possible_targets)
 
     def invoke(
         self,
         coordinates: Coordinates,
         match_context: "MatchContext",
         invocator: CellOwner,
+        spell_casting: "SpellCasting",
     ):
         board = match_context.game_board
         cell = board.get(coordinates.row_index, coordinates.column_index)
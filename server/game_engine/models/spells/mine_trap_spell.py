@@ -5,8 +5,10 @@ from game_engine.models.cell.cell_owner import CellOwner
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.spells.abstract.spell import Spell
 from game_engine.models.spells.spell_id import SpellId
+from game_engine.models.spells.targeting_result import TargetingResult
 
 if TYPE_CHECKING:
+    from game_engine.models.actions.spell_casting import SpellCasting
     from game_engine.models.game_board import GameBoard
     from game_engine.models.match.match_context import MatchContext
 
@@ -25,24 +27,18 @@ class MineTrapSpell(Spell):
         "You must select an idle cell to place a mine trap onto"
     )
 
-    def get_possible_targets(self, transient_board: "GameBoard", _):
-        possible_targets: list[Coordinates] = []
-
-        for row in transient_board.board:
-            for cell in row:
-                if cell.is_owned():
-                    continue
-
-                cell.set_can_be_spell_targetted()
-                possible_targets.append(cell.get_coordinates())
-
-        return possible_targets
+    def _find_targets(self, transient_board: "GameBoard", _):
+        idle_cells = transient_board.get_cells_from_mask(
+            transient_board.bit_board.get_idle()
+        )
+        return TargetingResult.create([cell.get_coordinates() for cell in idle_cells])
 
     def invoke(
         self,
         coordinates: Coordinates,
         match_context: "MatchContext",
         invocator: CellOwner,
+        spell_casting: "SpellCasting",
     ):
         board = match_context.game_board
         cell = board.get(coordinates.row_index, coordinates.column_index)
@@ -6,8 +6,10 @@ from game_engine.models.cell.cell_state import CellState
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.spells.abstract.positioning_spell import PositioningSpell
 from game_engine.models.spells.spell_id import SpellId
+from utils.bitboard_utils import get_square_sizes, to_bit_index
 
 if TYPE_CHECKING:
+    from game_engine.models.actions.spell_casting import SpellCasting
     from game_engine.models.game_board import GameBoard
     from game_engine.models.match.match_context import MatchContext
 
@@ -22,49 +24,45 @@ class ShieldFormationSpell(PositioningSpell):
         "You must select a square of friendly cells to shield"
     )
 
-    def get_possible_targets(self, transient_board: "GameBoard", from_player1: bool):
-        possible_targets: list[Coordinates] = []
+    def _find_targets(self, transient_board: "GameBoard", from_player1: bool):
+        squares: list[list[Coordinates]] = []
         cell_coordinates = self._initialize_target_searching(
             transient_board, from_player1
         )
-
-        # For each cell, try to form squares treating it as the top-left corner
-        for top_left_cell_coords in cell_coordinates:
-            row, col = top_left_cell_coords
-
-            if (row, col) in self._already_associated_cells:
+        square_sizes = get_square_sizes(
+            transient_board.bit_board.get_owned(from_player1)
+        )
+        # (row, col, size) of each formation, to check inclusions without any set
+        formation_bounds: list[tuple[int, int, int]] = []
+
+        # For each cell, take the largest square having it as the top-left corner.
+        # The candidates order is kept as is, since the formation indexes depend on it.
+        for row, col in cell_coordinates:
+            size = square_sizes[to_bit_index(row, col)]
+            if size < 2 or self._is_within_formation(formation_bounds, row, col, size):
                 continue
 
-            largest_valid_square = self._find_largest_valid_square(
-                cell_coordinates, row, col
-            )
+            square = [
+                Coordinates.of(r, c)
+                for r in range(row, row + size)
+                for c in range(col, col + size)
+            ]
+            formation_bounds.append((row, col, size))
+            squares.append(square)
 
-            if (
-                largest_valid_square is not None
-                and not self._is_subsquare_of_existing_square(largest_valid_square)
-            ):
-                self._update_transient_board(transient_board, largest_valid_square)
-                self._cell_formations.append(largest_valid_square)
-                possible_targets.extend(largest_valid_square)
-
-                for cell in largest_valid_square:
-                    if cell in self._already_associated_cells:
-                        continue
-
-                    self._already_associated_cells.add(cell)
-                    self._formation_per_cell[cell] = len(self._cell_formations) - 1
-
-        return possible_targets
+        return self._create_targeting_result(squares)
 
     def invoke(
         self,
         coordinates: Coordinates,
         match_context: "MatchContext",
         invocator: CellOwner,
+        spell_casting: "SpellCasting",
     ):
         board = match_context.game_board
-        corresponding_square_index = self._formation_per_cell[coordinates]
-        corresponding_square = self._cell_formations[corresponding_square_index]
+        corresponding_square = self.get_impacted_cells(
+            coordinates, spell_casting.targeting_result
+        )
 
         for cell_coords in corresponding_square:
             cell = board.get(cell_coords.row_index, cell_coords.column_index)
@@ -72,46 +70,20 @@ class ShieldFormationSpell(PositioningSpell):
 
     # region Private methods
 
-    def _find_largest_valid_square(
-        self, cell_coordinates: Coordinates, row: int, col: int
-    ) -> None | list[Coordinates]:
-        size = 1
-        largest_valid_square: list[Coordinates] = None
-        while True:
-            # Check if the bottom-right cell exists and belongs to the player
-            bottom_right = (row + size, col + size)
-            if bottom_right not in cell_coordinates:
-                break
-
-            # Check if all cells in the square belong to the player
-            valid_square = True
-            coordinates_square: list[Coordinates] = []
-            for r in range(row, row + size + 1):
-                for c in range(col, col + size + 1):
-                    if (r, c) not in cell_coordinates:
-                        valid_square = False
-                        break
-                    coordinates_square.append(Coordinates(r, c))
-
-                if not valid_square:
-                    break
-
-            if valid_square:
-                largest_valid_square = coordinates_square
-            else:
-                break
-
-            size += 1
-
-        return largest_valid_square
-
-    def _is_subsquare_of_existing_square(self, square: list[Coordinates]):
+    @staticmethod
+    def _is_within_formation(
+        formation_bounds: list[tuple[int, int, int]], row: int, col: int, size: int
+    ):
         """
-        Checks if the given square is a subsquare of any square in self._cell_formations.
+        Checks if the given square is a subsquare of any of the given formations.
         """
-        square_set = set(square)
-        for existing_square in self._cell_formations:
-            if square_set.issubset(set(existing_square)):
+        for formation_row, formation_col, formation_size in formation_bounds:
+            if (
+                formation_row <= row
+                and formation_col <= col
+                and row + size <= formation_row + formation_size
+                and col + size <= formation_col + formation_size
+            ):
                 return True
         return False
 
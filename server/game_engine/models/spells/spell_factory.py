@@ -8,20 +8,21 @@ from game_engine.models.spells.shield_formation_spell import \
     ShieldFormationSpell
 from game_engine.models.spells.spell_id import SpellId
 
-_SPELLS = {
-    MineTrapSpell.ID: lambda: MineTrapSpell(),
-    ShieldFormationSpell.ID: lambda: ShieldFormationSpell(),
-    CeleritySpell.ID: lambda: CeleritySpell(),
-    ArcheryVowSpell.ID: lambda: ArcheryVowSpell(),
-    AmbushSpell.ID: lambda: AmbushSpell(),
+# Spells hold no match related state, so a single instance of each is shared
+_SPELLS: dict[int, Spell] = {
+    MineTrapSpell.ID: MineTrapSpell(),
+    ShieldFormationSpell.ID: ShieldFormationSpell(),
+    CeleritySpell.ID: CeleritySpell(),
+    ArcheryVowSpell.ID: ArcheryVowSpell(),
+    AmbushSpell.ID: AmbushSpell(),
 }
 
 
 def get_spell(spell_id: int) -> Spell:
     """
-    Returns a spell instance associated with the given id.
+    Returns the spell instance associated with the given id.
     """
-    return _SPELLS[spell_id]()
+    return _SPELLS[spell_id]
 
 
 def get_initial_spell_deck():
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+from game_engine.models.dtos.coordinates import Coordinates
+
+
+@dataclass(frozen=True, eq=False)
+class TargetingResult:
+    """
+    Immutable result of a spell's target search on a given board.
+
+    Since spells are shared, everything depending on the board a spell was
+    targeted on is kept here rather than on the spell itself.
+    """
+
+    targets: tuple[Coordinates, ...]
+    # A formation represents a specific arrangement of cells (e.g. a line, a square).
+    # A cell can overlap on multiple formations, so it is only associated with one,
+    # given by its index in the formations tuple.
+    formations: tuple[tuple[Coordinates, ...], ...] = ()
+    formation_per_cell: Mapping[Coordinates, int] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # Same targets, for constant time membership checks
+    _target_set: frozenset[Coordinates] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_target_set", frozenset(self.targets))
+
+    def __contains__(self, coordinates: Coordinates):
+        return coordinates in self._target_set
+
+    def __iter__(self):
+        return iter(self.targets)
+
+    def __len__(self):
+        return len(self.targets)
+
+    @staticmethod
+    def create(
+        targets: list[Coordinates],
+        formations: list[list[Coordinates]] | None = None,
+        formation_per_cell: dict[Coordinates, int] | None = None,
+    ):
+        return TargetingResult(
+            targets=tuple(targets),
+            formations=tuple(tuple(formation) for formation in formations or ()),
+            formation_per_cell=MappingProxyType(dict(formation_per_cell or {})),
+        )
+
+    def get_formation(self, coordinates: Coordinates) -> tuple[Coordinates, ...]:
+        """
+        Returns the formation associated with the given coordinates,
+        or only the coordinates themselves if they are not part of any.
+        """
+        formation_index = self.formation_per_cell.get(coordinates)
+        if formation_index is None:
+            return (coordinates,)
+        return self.formations[formation_index]
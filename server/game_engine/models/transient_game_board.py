@@ -0,0 +1,94 @@
+from constants.game_constants import BOARD_SIZE
+from game_engine.models.bit_board import BitBoard
+from game_engine.models.cell.cell_transient_state import CellTransientState
+from game_engine.models.cell.transient_cell import TransientCell
+from game_engine.models.game_board import GameBoard
+from utils.bitboard_utils import iter_bit_indexes, to_bit_index
+from utils.board_geometry import NEIGHBOURS
+
+
+class TransientGameBoard(GameBoard):
+    """
+    Copy-on-write overlay of a live game board, meant to hold the transient states
+    resulting from the possible actions without marking the live board.
+
+    Every read goes through to the live board, and the overlay only stores
+    a view for each cell it handed out.
+    """
+
+    def __init__(self, live_game_board: GameBoard):
+        self.is_transient = True
+        self._live_game_board = live_game_board
+        # Only the transient layers of this bit board are used
+        self._transient_bit_board = BitBoard.get_empty()
+        self._transient_cells: dict[int, TransientCell] = {}
+        self._owned_cells: dict[bool, tuple[int, tuple[TransientCell, ...]]] = {}
+
+    def __repr__(self):
+        return (
+            f"<TransientGameBoard(live_game_board={self._live_game_board!r}, "
+            f"transient_cells={list(self._transient_cells.values())!r})>"
+        )
+
+    @property
+    def bit_board(self):
+        return self._live_game_board.bit_board
+
+    @property
+    def board(self):
+        return [
+            [self.get(row_index, column_index) for column_index in range(BOARD_SIZE)]
+            for row_index in range(BOARD_SIZE)
+        ]
+
+    def to_dto(self, for_player1: bool | None):
+        board_dto = self._live_game_board.to_dto(for_player1)
+        for transient_cell in self._transient_cells.values():
+            if transient_cell.transient_state == CellTransientState.NONE:
+                continue
+
+            cell_dto = board_dto[transient_cell.row_index][transient_cell.column_index]
+            cell_dto.transientState = transient_cell.transient_state
+
+        return board_dto
+
+    def get(self, row_index: int, column_index: int):
+        return self._get_transient_cell(to_bit_index(row_index, column_index))
+
+    def clone(self):
+        cloned_board = [[cell.clone() for cell in row] for row in self.board]
+        return GameBoard(cloned_board, is_transient=True)
+
+    def spawn_cell(self, *_):
+        raise ValueError("Cannot spawn into a transient board")
+
+    def get_transient_state_mask(self, transient_state: CellTransientState):
+        return self._transient_bit_board.get_transient_state(transient_state)
+
+    # region Getters
+
+    def get_cells_from_mask(self, mask: int):
+        return [
+            self._get_transient_cell(bit_index) for bit_index in iter_bit_indexes(mask)
+        ]
+
+    def get_neighbours(self, row_index: int, column_index: int):
+        return [
+            self._get_transient_cell(bit_index)
+            for bit_index in NEIGHBOURS[to_bit_index(row_index, column_index)]
+        ]
+
+    def _get_transient_cell(self, bit_index: int):
+        transient_cell = self._transient_cells.get(bit_index)
+        if transient_cell is None:
+            row_index, column_index = divmod(bit_index, BOARD_SIZE)
+            transient_cell = TransientCell(
+                self._live_game_board.get(row_index, column_index),
+                self._transient_bit_board,
+                1 << bit_index,
+            )
+            self._transient_cells[bit_index] = transient_cell
+
+        return transient_cell
+
+    # endregion
@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+from game_engine.models.match.match_journal import MatchJournal
 from game_engine.models.player.player_resources import PlayerResources
 from game_engine.models.spells.spell_id import SpellId
 
+if TYPE_CHECKING:
+    from game_engine.models.cell.cell import Cell
 
-@dataclass
+
+@dataclass(slots=True)
 class TurnState:
     """
     Holds data that persists within the duration of a turn.
@@ -14,31 +19,51 @@ class TurnState:
 
     is_player1_turn: bool
     # Cells that attacked this turn, [key,value] = [cell_id, number of attacks]
-    attacks: dict[str, int]
+    attacks: dict[int, int]
     # Cells that moved this turn, [key,value] = [cell_id, number of movements]
-    movements: dict[str, int]
+    movements: dict[int, int]
     # List of the ids of the cells that were casted this turn
     spells: list[SpellId]
     player1_resources: PlayerResources
     player2_resources: PlayerResources
+    # Journal the counters changes are recorded into, if any
+    journal: MatchJournal | None = field(default=None, repr=False, compare=False)
 
     def reset_for_new_turn(self):
+        if self.journal is not None:
+            # The counters are replaced rather than cleared, so the old ones remain
+            for name in ("is_player1_turn", "attacks", "movements", "spells"):
+                self.journal.record_attribute(self, name, getattr(self, name))
+
         self.is_player1_turn = not self.is_player1_turn
         self.attacks = {}
         self.movements = {}
         self.spells = []
 
-    def register_attack(self, cell_id: str):
+    def register_attack(self, cell_id: int):
         self._internal_register(cell_id, self.attacks)
 
-    def register_movement(self, cell_id: str):
+    def register_movement(self, cell_id: int):
         self._internal_register(cell_id, self.movements)
 
+    def has_already_attacked(self, cell: "Cell"):
+        """
+        Whether the given cell used up all of its attacks this turn.
+        """
+        return self._has_reached_limit(cell, self.attacks)
+
+    def has_already_moved(self, cell: "Cell"):
+        """
+        Whether the given cell used up all of its movements this turn.
+        """
+        return self._has_reached_limit(cell, self.movements)
+
     @staticmethod
     def get_initial(
         player1_turn: bool,
         player1_resources: PlayerResources,
         player2_resources: PlayerResources,
+        journal: MatchJournal | None = None,
     ):
         return TurnState(
             is_player1_turn=player1_turn,
@@ -47,10 +72,24 @@ class TurnState:
             spells=[],
             player1_resources=player1_resources,
             player2_resources=player2_resources,
+            journal=journal,
         )
 
-    def _internal_register(self, cell_id: str, dictionary: dict[str, int]):
+    def _internal_register(self, cell_id: int, dictionary: dict[int, int]):
+        if self.journal is not None:
+            self.journal.record_item(dictionary, cell_id)
+
         if cell_id not in dictionary:
             dictionary[cell_id] = 1
         else:
             dictionary[cell_id] += 1
+
+    @staticmethod
+    def _has_reached_limit(cell: "Cell", dictionary: dict[int, int]):
+        count = dictionary.get(cell.id)
+        if count is None:
+            return False
+
+        if cell.is_accelerated():
+            return count == 2
+        return count == 1
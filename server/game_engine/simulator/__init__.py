@@ -0,0 +1,5 @@
+"""
+This package allows to play full matches headlessly, straight through the game engine
+and without any server, socket or timer involved. Typically used for self-play,
+fuzzing and AI tuning, as well as replaying ended matches.
+"""
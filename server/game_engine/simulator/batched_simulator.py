@@ -0,0 +1,405 @@
+from game_engine.action_codec import (
+    get_action_type,
+    get_origin_index,
+    get_target_index,
+    is_from_player1,
+    pack_action,
+)
+from game_engine.models.actions.action_type import ActionType
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.game_board import GameBoard
+from game_engine.models.match.ending_reason import EndingReason
+from game_engine.models.player.player_resources import PlayerResources
+from utils.bitboard_utils import (
+    FULL_MASK,
+    get_neighbours_mask,
+    get_orthogonal_neighbours_mask,
+    iter_bit_indexes,
+)
+from utils.board_geometry import NEIGHBOURS_MASKS, PRIMARY_NEIGHBOURS_MASKS
+
+# Action code standing for the end of the current player's turn
+END_TURN = -1
+
+# Indexes of the players in the per player vectors
+_PLAYER1 = 0
+_PLAYER2 = 1
+
+
+def _get_player_index(player1: bool):
+    return _PLAYER1 if player1 else _PLAYER2
+
+
+class BatchedMatchSimulator:
+    """
+    Plays many matches in lockstep, each step applying one action per match.
+
+    Every match is stored as a row of stacked layers : one bitboard per match for
+    each board layer, and one value per match for each player's resources.
+    The rule kernels only deal with these plain ints, mirroring the cell movement,
+    attack and spawn actions, the mana bubble hook and the turn change processing.
+
+    Actions are given as action codes (see action_codec), or END_TURN.
+    Spells are not supported, so neither are the states they bring
+    (shields, archers, acceleration and mine traps).
+    """
+
+    def __init__(self, size: int):
+        game_board = GameBoard.get_initial()
+        bit_board = game_board.bit_board
+        resources = PlayerResources.get_initial()
+
+        self.size = size
+
+        # region Board layers
+
+        # Cells owned by each player
+        self.owned = ([bit_board.player1] * size, [bit_board.player2] * size)
+        self.masters = [bit_board.masters] * size
+        self.freshly_spawned = [bit_board.get_state(CellState.FRESHLY_SPAWNED)] * size
+        self.mana_bubbles = [bit_board.get_state(CellState.MANA_BUBBLE)] * size
+        # Squares of the cells that already moved or attacked during the turn
+        self.moved = [0] * size
+        self.attacked = [0] * size
+
+        # endregion
+
+        # region Player resources
+
+        self.max_hp = resources.max_hp
+        self.max_mp = resources.max_mp
+        self.hp = ([resources.current_hp] * size, [resources.current_hp] * size)
+        self.mp = ([resources.current_mp] * size, [resources.current_mp] * size)
+        self.stamina = (
+            [resources.current_stamina] * size,
+            [resources.current_stamina] * size,
+        )
+        self.fatigue_damage = ([0] * size, [0] * size)
+
+        # endregion
+
+        self.current_turn = [1] * size
+        self.is_player1_turn = [True] * size
+        self.ending_reasons: list[EndingReason | None] = [None] * size
+        # None if the match is not over or ended on a draw
+        self.loser_is_player1: list[bool | None] = [None] * size
+
+    def is_over(self, match_index: int):
+        return self.ending_reasons[match_index] is not None
+
+    def all_over(self):
+        return all(ending_reason is not None for ending_reason in self.ending_reasons)
+
+    def legal_actions(self) -> list[list[int]]:
+        """
+        Returns the codes of every action the current player can perform, per match,
+        in the same order as get_all_legal_actions.
+        """
+        return [
+            [] if self.is_over(match_index) else self._get_legal_actions(match_index)
+            for match_index in range(self.size)
+        ]
+
+    def step(self, action_codes: list[int | None]):
+        """
+        Applies one action per match, None leaving the match as it is.
+
+        Every action is checked before any is applied, so that no match changes
+        if one of them is not valid.
+        """
+        if len(action_codes) != self.size:
+            raise ValueError(f"Expected {self.size} actions, got {len(action_codes)}")
+
+        for match_index, action_code in enumerate(action_codes):
+            if action_code is not None:
+                self._check(match_index, action_code)
+
+        for match_index, action_code in enumerate(action_codes):
+            if action_code is None:
+                continue
+
+            if action_code == END_TURN:
+                self._end_turn(match_index)
+            else:
+                self._apply(match_index, action_code)
+                self._end_match_if_game_over(match_index)
+
+    def _get_legal_actions(self, match_index: int):
+        player1 = self.is_player1_turn[match_index]
+        player_index = _get_player_index(player1)
+        owned_mask = self.owned[player_index][match_index]
+        hostile_mask = self.owned[1 - player_index][match_index]
+        idle_mask = FULL_MASK & ~(owned_mask | hostile_mask)
+        moved_mask = self.moved[match_index]
+        attacked_mask = self.attacked[match_index]
+        active_mask = owned_mask & ~self.freshly_spawned[match_index]
+
+        movements: list[int] = []
+        attacks: list[int] = []
+        for origin_index in iter_bit_indexes(active_mask):
+            origin_bit = 1 << origin_index
+
+            if not moved_mask & origin_bit:
+                targets_mask = self._get_movement_targets_mask(
+                    origin_index, hostile_mask, idle_mask
+                )
+                movements.extend(
+                    pack_action(
+                        ActionType.CELL_MOVE, player1, target_index, origin_index
+                    )
+                    for target_index in iter_bit_indexes(targets_mask)
+                )
+
+            if not attacked_mask & origin_bit:
+                attacks.extend(
+                    pack_action(
+                        ActionType.CELL_ATTACK, player1, target_index, origin_index
+                    )
+                    for target_index in iter_bit_indexes(
+                        hostile_mask & NEIGHBOURS_MASKS[origin_index]
+                    )
+                )
+
+        action_codes = movements + attacks
+        if self.mp[player_index][match_index] >= CellSpawn.DEFAULT_MANA_COST:
+            action_codes.extend(
+                pack_action(ActionType.CELL_SPAWN, player1, target_index)
+                for target_index in iter_bit_indexes(
+                    get_neighbours_mask(owned_mask) & idle_mask
+                )
+            )
+
+        return action_codes
+
+    @staticmethod
+    def _get_movement_targets_mask(
+        origin_index: int, hostile_mask: int, idle_mask: int
+    ):
+        primary_targets_mask = PRIMARY_NEIGHBOURS_MASKS[origin_index] & ~hostile_mask
+        return (
+            primary_targets_mask | get_orthogonal_neighbours_mask(primary_targets_mask)
+        ) & idle_mask
+
+    # region Rule checks
+
+    def _check(self, match_index: int, action_code: int):
+        """
+        Raises a ValueError if the given action cannot be performed in the match.
+        """
+        if self.is_over(match_index):
+            raise ValueError(f"The match {match_index} is already over")
+
+        if action_code == END_TURN:
+            return
+
+        player1 = self.is_player1_turn[match_index]
+        if is_from_player1(action_code) != player1:
+            raise ValueError(f"Not the turn of the player of the action {action_code}")
+
+        player_index = _get_player_index(player1)
+        action_type = get_action_type(action_code)
+        target_bit = 1 << get_target_index(action_code)
+
+        if action_type == ActionType.CELL_SPAWN:
+            is_legal = self._is_spawn_legal(match_index, player_index, target_bit)
+        elif action_type == ActionType.PLAYER_SPELL:
+            raise ValueError("Spell castings are not supported")
+        else:
+            origin_bit = 1 << get_origin_index(action_code)
+            active_mask = (
+                self.owned[player_index][match_index]
+                & ~self.freshly_spawned[match_index]
+            )
+            is_legal_for_cell = (
+                self._is_movement_legal
+                if action_type == ActionType.CELL_MOVE
+                else self._is_attack_legal
+            )
+            is_legal = bool(active_mask & origin_bit) and is_legal_for_cell(
+                match_index, player_index, origin_bit, target_bit
+            )
+
+        if not is_legal:
+            raise ValueError(
+                f"The action {action_code} is not valid in the match {match_index}"
+            )
+
+    def _is_movement_legal(
+        self, match_index: int, player_index: int, origin_bit: int, target_bit: int
+    ):
+        hostile_mask = self.owned[1 - player_index][match_index]
+        idle_mask = FULL_MASK & ~(self.owned[player_index][match_index] | hostile_mask)
+        return not self.moved[match_index] & origin_bit and bool(
+            self._get_movement_targets_mask(
+                origin_bit.bit_length() - 1, hostile_mask, idle_mask
+            )
+            & target_bit
+        )
+
+    def _is_attack_legal(
+        self, match_index: int, player_index: int, origin_bit: int, target_bit: int
+    ):
+        return (
+            not self.attacked[match_index] & origin_bit
+            and bool(self.owned[1 - player_index][match_index] & target_bit)
+            and bool(NEIGHBOURS_MASKS[origin_bit.bit_length() - 1] & target_bit)
+        )
+
+    def _is_spawn_legal(self, match_index: int, player_index: int, target_bit: int):
+        owned_mask = self.owned[player_index][match_index]
+        hostile_mask = self.owned[1 - player_index][match_index]
+        idle_mask = FULL_MASK & ~(owned_mask | hostile_mask)
+        return (
+            self.mp[player_index][match_index] >= CellSpawn.DEFAULT_MANA_COST
+            and bool(idle_mask & target_bit)
+            and bool(NEIGHBOURS_MASKS[target_bit.bit_length() - 1] & owned_mask)
+        )
+
+    # endregion
+
+    # region Rule kernels
+
+    def _apply(self, match_index: int, action_code: int):
+        """
+        Applies the given action, which must have been checked beforehand.
+        """
+        player_index = _get_player_index(self.is_player1_turn[match_index])
+        action_type = get_action_type(action_code)
+        target_bit = 1 << get_target_index(action_code)
+
+        if action_type == ActionType.CELL_SPAWN:
+            self._spawn(match_index, player_index, target_bit)
+        elif action_type == ActionType.CELL_MOVE:
+            origin_bit = 1 << get_origin_index(action_code)
+            self._move(match_index, player_index, origin_bit, target_bit)
+        else:
+            origin_bit = 1 << get_origin_index(action_code)
+            self._attack(match_index, player_index, origin_bit, target_bit)
+
+    def _move(
+        self, match_index: int, player_index: int, origin_bit: int, target_bit: int
+    ):
+        """
+        Mirrors CellMovement.apply.
+        """
+        self._trigger_mana_bubble(match_index, player_index, target_bit)
+
+        # The target square takes the whole state of the cell
+        owned = self.owned[player_index]
+        owned[match_index] = owned[match_index] & ~origin_bit | target_bit
+        for layer in (
+            self.masters,
+            self.freshly_spawned,
+            self.mana_bubbles,
+            self.attacked,
+        ):
+            layer[match_index] = layer[match_index] & ~(origin_bit | target_bit) | (
+                target_bit if layer[match_index] & origin_bit else 0
+            )
+        self.moved[match_index] = self.moved[match_index] & ~origin_bit | target_bit
+
+    def _attack(
+        self, match_index: int, player_index: int, origin_bit: int, target_bit: int
+    ):
+        """
+        Mirrors CellAttack.apply for melee attacks.
+        """
+        # Melee attacks are always retaliated
+        self._damage(match_index, origin_bit)
+        self._damage(match_index, target_bit)
+
+        if self.owned[player_index][match_index] & origin_bit:
+            self.attacked[match_index] |= origin_bit
+
+    def _spawn(self, match_index: int, player_index: int, target_bit: int):
+        """
+        Mirrors CellSpawn.apply.
+        """
+        mp = self.mp[player_index]
+        mp[match_index] -= CellSpawn.DEFAULT_MANA_COST
+        self._trigger_mana_bubble(match_index, player_index, target_bit)
+
+        self.owned[player_index][match_index] |= target_bit
+        self.freshly_spawned[match_index] |= target_bit
+        self.mana_bubbles[match_index] &= ~target_bit
+
+    def _trigger_mana_bubble(
+        self, match_index: int, player_index: int, target_bit: int
+    ):
+        """
+        Mirrors ManaBubbleHook.trigger.
+        """
+        if self.mana_bubbles[match_index] & target_bit:
+            mp = self.mp[player_index]
+            mp[match_index] = min(self.max_mp, mp[match_index] + 1)
+
+    def _damage(self, match_index: int, bit: int):
+        """
+        Mirrors Cell.damage, for cells that cannot be shielded.
+        """
+        player_index = _PLAYER1 if self.owned[_PLAYER1][match_index] & bit else _PLAYER2
+        if not self.masters[match_index] & bit:
+            self._kill(match_index, bit)
+            return
+
+        hp = self.hp[player_index]
+        hp[match_index] -= 1
+        if hp[match_index] <= 0:
+            self._kill(match_index, bit)
+
+    def _kill(self, match_index: int, bit: int):
+        for layer in (
+            *self.owned,
+            self.masters,
+            self.freshly_spawned,
+            self.mana_bubbles,
+            self.moved,
+            self.attacked,
+        ):
+            layer[match_index] &= ~bit
+
+    def _end_turn(self, match_index: int):
+        """
+        Mirrors process_turn_change, along with the turn state reset.
+        """
+        current_turn = self.current_turn[match_index] + 1
+        player1 = not self.is_player1_turn[match_index]
+        self.current_turn[match_index] = current_turn
+        self.is_player1_turn[match_index] = player1
+        player_index = _get_player_index(player1)
+
+        # Stamina and fatigue
+        if current_turn > 2:
+            stamina = self.stamina[player_index]
+            stamina[match_index] = max(0, stamina[match_index] - 1)
+            if stamina[match_index] <= 0:
+                fatigue_damage = self.fatigue_damage[player_index]
+                fatigue_damage[match_index] += 1
+                hp = self.hp[player_index]
+                hp[match_index] -= fatigue_damage[match_index]
+                if hp[match_index] <= 0:
+                    self.ending_reasons[match_index] = EndingReason.FATIGUE
+                    self.loser_is_player1[match_index] = player1
+
+        self.mp[player_index][match_index] = min(
+            current_turn // 2 + current_turn % 2, self.max_mp
+        )
+
+        # Cell states
+        self.freshly_spawned[match_index] &= ~self.owned[player_index][match_index]
+        self.moved[match_index] = 0
+        self.attacked[match_index] = 0
+
+    def _end_match_if_game_over(self, match_index: int):
+        player1_is_dead = self.hp[_PLAYER1][match_index] <= 0
+        player2_is_dead = self.hp[_PLAYER2][match_index] <= 0
+
+        if player1_is_dead and player2_is_dead:
+            self.ending_reasons[match_index] = EndingReason.DRAW
+
+        elif player1_is_dead or player2_is_dead:
+            self.ending_reasons[match_index] = EndingReason.PLAYER_VICTORY
+            self.loser_is_player1[match_index] = player1_is_dead
+
+    # endregion
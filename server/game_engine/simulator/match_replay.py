@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
+
+from game_engine.action_codec import NO_SQUARE, decode_action, pack_action
+from game_engine.models.actions.abstract.action import Action
+from game_engine.models.actions.action_type import ActionType
+from game_engine.models.game_board import GameBoard
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.snapshot_codec import encode_snapshot, restore_snapshot
+from utils.bitboard_utils import to_bit_index
+
+if TYPE_CHECKING:
+    from persistence.database.models.ended_match import EndedMatch
+
+DEFAULT_CHECKPOINT_INTERVAL = 10
+
+_CELL_ACTION_TYPES = (ActionType.CELL_MOVE, ActionType.CELL_ATTACK)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayFrame:
+    """
+    The position of a replayed match right after one of its actions.
+    """
+
+    turn: int
+    action: Action
+    # Binary snapshot of the position, see the snapshot codec to restore it
+    board_state: bytes
+
+
+class MatchReplay:
+    """
+    Replays an ended match from its serialized actions and random seed.
+
+    A snapshot of the position is kept at the beginning of every
+    `checkpoint_interval`-th turn replayed, so that seeking a turn only takes
+    restoring the closest checkpoint and replaying the turns left from there.
+    """
+
+    def __init__(
+        self,
+        actions_per_turn: dict[int, list[dict]],
+        total_turns: int,
+        rng_seed: int,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        if checkpoint_interval < 1:
+            raise ValueError("The checkpoint interval must be at least 1 turn")
+
+        # The turn numbers become strings once the log is stored as JSON
+        self.actions_per_turn = {
+            int(turn): actions for turn, actions in actions_per_turn.items()
+        }
+        self.total_turns = total_turns
+        self.rng_seed = rng_seed
+        self.checkpoint_interval = checkpoint_interval
+        # Key : turn number | Value : snapshot of the position at its beginning
+        self._checkpoints: dict[int, bytes] = {}
+
+    @staticmethod
+    def from_ended_match(
+        ended_match: "EndedMatch",
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        if ended_match.rng_seed is None:
+            raise ValueError(
+                f"Cannot replay the match {ended_match.id}, its seed was not stored"
+            )
+
+        return MatchReplay(
+            ended_match.actions_per_turn,
+            ended_match.total_turns,
+            ended_match.rng_seed,
+            checkpoint_interval,
+        )
+
+    def seek(self, turn: int) -> MatchSimulator:
+        """
+        Returns a simulator positioned at the beginning of the given turn,
+        before any of its actions.
+        """
+        if not 1 <= turn <= self.total_turns:
+            raise ValueError(
+                f"The turn must be between 1 and {self.total_turns}, got {turn}"
+            )
+
+        simulator, current_turn = self._restore_closest_checkpoint(turn)
+        while current_turn < turn:
+            for _ in self._play_turn(simulator, current_turn):
+                pass
+            current_turn += 1
+
+        return simulator
+
+    def iter_frames(self, from_turn: int = 1) -> Iterator[ReplayFrame]:
+        """
+        Lazily replays the match from the beginning of the given turn,
+        yielding a frame after each action.
+        """
+        simulator = self.seek(from_turn)
+        for turn in range(from_turn, self.total_turns + 1):
+            for action in self._play_turn(simulator, turn):
+                yield ReplayFrame(
+                    turn,
+                    action,
+                    encode_snapshot(simulator.match_context, simulator.turn_state),
+                )
+
+    def _restore_closest_checkpoint(self, turn: int):
+        """
+        Returns a simulator at the latest checkpoint not after the given turn,
+        along with the turn of that checkpoint.
+        """
+        checkpoint_turn = turn - (turn - 1) % self.checkpoint_interval
+        while checkpoint_turn > 1 and checkpoint_turn not in self._checkpoints:
+            checkpoint_turn -= self.checkpoint_interval
+
+        simulator = MatchSimulator.create(rng_seed=self.rng_seed)
+        if checkpoint_turn > 1:
+            restore_snapshot(
+                self._checkpoints[checkpoint_turn],
+                simulator.match_context,
+                simulator.turn_state,
+            )
+
+        return simulator, checkpoint_turn
+
+    def _play_turn(self, simulator: MatchSimulator, turn: int) -> Iterator[Action]:
+        """
+        Plays the logged actions of the given turn, yielding each one once processed,
+        then ends the turn unless it is the last one.
+        """
+        for logged_action in self.actions_per_turn.get(turn, []):
+            action = decode_logged_action(
+                logged_action, simulator.match_context.game_board
+            )
+            simulator.step(action)
+            yield action
+
+        if turn == self.total_turns or simulator.is_over():
+            return
+
+        simulator.end_turn()
+        next_turn = turn + 1
+        if (next_turn - 1) % self.checkpoint_interval == 0:
+            self._checkpoints.setdefault(
+                next_turn,
+                encode_snapshot(simulator.match_context, simulator.turn_state),
+            )
+
+
+def decode_logged_action(logged_action: dict, game_board: GameBoard) -> Action:
+    """
+    Returns the action of the given serialized action dto.
+
+    The board is needed to retrieve the id of the cell performing a cell action.
+    """
+    action_type = ActionType(logged_action["type"])
+    metadata = logged_action["metadata"]
+    target_coords = metadata["impactedCoords"]
+    origin_index = NO_SQUARE
+    if action_type in _CELL_ACTION_TYPES:
+        origin_coords = metadata["originatingCellCoords"]
+        origin_index = to_bit_index(
+            origin_coords["rowIndex"], origin_coords["columnIndex"]
+        )
+    spell = logged_action["spell"]
+
+    code = pack_action(
+        action_type,
+        logged_action["player1"],
+        to_bit_index(target_coords["rowIndex"], target_coords["columnIndex"]),
+        origin_index=origin_index,
+        spell_id=spell["id"] if spell else 0,
+    )
+    return decode_action(code, game_board)
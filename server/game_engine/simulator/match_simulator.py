@@ -0,0 +1,160 @@
+from typing import Iterator
+
+from game_engine.action_calculation import get_all_legal_actions
+from game_engine.action_processing import process_action
+from game_engine.models.actions.abstract.action import Action
+from game_engine.models.actions.abstract.action_callback import ActionCallback
+from game_engine.models.actions.abstract.with_callbacks import WithCallbacks
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.game_board import GameBoard
+from game_engine.models.match.ending_reason import EndingReason
+from game_engine.models.match.match_context import MatchContext
+from game_engine.models.player.player import Player
+from game_engine.models.turn.turn_processing_result import TurnProcessingResult
+from game_engine.models.turn.turn_state import TurnState
+from game_engine.turn_change_processing import process_turn_change
+from utils.rng_utils import generate_seed
+
+
+class MatchSimulator:
+    """
+    Plays a match synchronously, applying the same rules as the match handler unit
+    (validation, processing, callbacks, turn changes and match ending)
+    without any notification, timer nor background task.
+    """
+
+    def __init__(self, match_context: MatchContext, turn_state: TurnState):
+        self.match_context = match_context
+        self.turn_state = turn_state
+        # Key : turn number | Value : list of actions processed during the turn
+        self.actions_per_turn: dict[int, list[Action]] = {}
+        self.ending_reason: EndingReason | None = None
+        # None if the match is not over or ended on a draw
+        self.loser: Player | None = None
+
+    @staticmethod
+    def create(match_id: str = "simulation", rng_seed: int | None = None):
+        """
+        Returns a simulator for a match that just started, like a match handler unit
+        would right after the countdown.
+
+        Two simulators created with the same seed play the same actions identically.
+        """
+        match_context = MatchContext(
+            id=match_id,
+            room_id=match_id,
+            current_turn=1,
+            is_player1_turn=True,
+            game_board=GameBoard.get_initial(),
+            player1=Player.get_initial("player1", "player1", "player1", True),
+            player2=Player.get_initial("player2", "player2", "player2", False),
+            rng_seed=generate_seed() if rng_seed is None else rng_seed,
+        )
+        turn_state = TurnState.get_initial(
+            player1_turn=True,
+            player1_resources=match_context.player1.resources,
+            player2_resources=match_context.player2.resources,
+            journal=match_context.journal,
+        )
+        return MatchSimulator(match_context, turn_state)
+
+    def is_over(self):
+        return self.ending_reason is not None
+
+    def legal_actions(self):
+        """
+        Returns every action the current player can perform.
+        """
+        if self.is_over():
+            return []
+        return get_all_legal_actions(
+            self.match_context.is_player1_turn, self.match_context, self.turn_state
+        )
+
+    def step(self, action: Action) -> list[ActionCallback]:
+        """
+        Validates and processes the given action of the current player, then triggers
+        its callbacks.
+
+        Returns the callbacks that did trigger, in the order they triggered.
+        """
+        if self.is_over():
+            raise ValueError("Cannot perform an action once the match is over")
+
+        player_resources = self.match_context.get_player_resources(action.from_player1)
+        if action.mana_cost > player_resources.current_mp or not action.is_valid(
+            self.match_context, self.turn_state
+        ):
+            raise ValueError(f"The following action is not valid : {action}")
+
+        processed_action = process_action(action, self.match_context)
+        self._register_processed_action(processed_action)
+        triggered_callbacks = [
+            callback
+            for callback in self._trigger_callbacks(processed_action)
+            if callback.did_trigger
+        ]
+        # Anything changed from now on is not part of the action
+        self.match_context.journal.end_entry()
+
+        self._end_match_if_game_over()
+        return triggered_callbacks
+
+    def end_turn(self) -> TurnProcessingResult:
+        """
+        Ends the current player's turn and processes the turn change.
+        """
+        if self.is_over():
+            raise ValueError("Cannot end a turn once the match is over")
+
+        turn_change_result = process_turn_change(self.match_context)
+        self.turn_state.reset_for_new_turn()
+        self.match_context.journal.end_entry()
+
+        if turn_change_result.match_ending_reason:
+            self._end(
+                turn_change_result.match_ending_reason,
+                loser=self.match_context.get_current_player(),
+            )
+
+        return turn_change_result
+
+    def _register_processed_action(self, action: Action):
+        current_turn = self.match_context.current_turn
+        self.actions_per_turn.setdefault(current_turn, []).append(action)
+
+        if isinstance(action, CellMovement):
+            self.turn_state.register_movement(action.cell_id)
+
+        elif isinstance(action, CellAttack):
+            self.turn_state.register_attack(action.cell_id)
+
+    def _trigger_callbacks(
+        self, action_or_callback: WithCallbacks
+    ) -> Iterator[ActionCallback]:
+        for callback in action_or_callback.get_callbacks_to_trigger():
+            callback.trigger(self.match_context)
+
+            yield callback
+
+            # recursively trigger the callbacks of the callback
+            yield from self._trigger_callbacks(callback)
+
+    def _end_match_if_game_over(self):
+        """
+        Ends the match if at least one player dies.
+        """
+        match_context = self.match_context
+        if match_context.both_players_are_dead():
+            self._end(EndingReason.DRAW)
+
+        elif match_context.player1_is_dead():
+            self._end(EndingReason.PLAYER_VICTORY, loser=match_context.player1)
+
+        elif match_context.player2_is_dead():
+            self._end(EndingReason.PLAYER_VICTORY, loser=match_context.player2)
+
+    def _end(self, ending_reason: EndingReason, loser: Player | None = None):
+        self.ending_reason = ending_reason
+        self.loser = loser
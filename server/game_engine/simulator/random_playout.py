@@ -0,0 +1,33 @@
+import random
+
+from game_engine.simulator.match_simulator import MatchSimulator
+
+
+def play_random_turns(
+    simulator: MatchSimulator,
+    rng: random.Random,
+    turns: int | None = None,
+    max_actions_per_turn: int = 3,
+):
+    """
+    Plays up to `max_actions_per_turn` random legal actions per turn, for the given
+    number of turns or until the match is over.
+
+    Returns the number of actions played.
+    """
+    action_count = played_turns = 0
+    while not simulator.is_over() and (turns is None or played_turns < turns):
+        for _ in range(rng.randint(0, max_actions_per_turn)):
+            legal_actions = list(simulator.legal_actions())
+            if not legal_actions:
+                break
+
+            simulator.step(rng.choice(legal_actions))
+            action_count += 1
+            if simulator.is_over():
+                return action_count
+
+        simulator.end_turn()
+        played_turns += 1
+
+    return action_count
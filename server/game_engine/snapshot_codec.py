@@ -0,0 +1,254 @@
+"""
+Packs a match position into a fixed-size binary snapshot and back,
+for the places that need to store or ship positions (checkpoints, replays, fixtures)
+where the dtos are too heavy.
+
+Layout of a snapshot, little-endian :
+
+• Header : format version (B), current turn (H), whether it is player 1's turn (?),
+next cell id of the board (H), random seed (Q) and draws (I) of the match
+
+• 2 player records, player 1 first : max hp (h), current hp (h), max mp (B),
+current mp (B), current stamina (B), max stamina (B), fatigue damage (H),
+then the count of each spell (B), in the initial deck order
+
+• Number of times each spell was cast during the turn (B), in the initial deck order
+
+• The bit board layers (16 bytes each) : squares of player 1, of player 2, of the
+masters, of each state flag, of the mine traps and of the mine traps
+visible to each player
+
+• 121 cell ids (H, 0 if none), then the movements (B) and attacks (B)
+of each cell during the turn, all in bit index order
+
+The cells are built back from the layers on demand, see GameBoard.from_bit_board.
+The transient states are not kept, as they only matter to the player's display.
+"""
+
+import struct
+from typing import TYPE_CHECKING
+
+from game_engine.models.bit_board import BitBoard
+from game_engine.models.cell.cell_state import (
+    STATE_ACCELERATED,
+    STATE_ARCHER,
+    STATE_FRESHLY_SPAWNED,
+    STATE_MANA_BUBBLE,
+    STATE_SHIELDED,
+    CellState,
+)
+from game_engine.models.game_board import GameBoard
+from game_engine.models.player.player import Player
+from game_engine.models.spells.spell_factory import get_initial_spell_deck
+from utils.bitboard_utils import SQUARE_COUNT
+
+if TYPE_CHECKING:
+    from game_engine.models.match.match_context import MatchContext
+    from game_engine.models.turn.turn_state import TurnState
+
+SNAPSHOT_VERSION = 3
+
+_SPELL_IDS = tuple(get_initial_spell_deck())
+
+_STATE_FLAGS = (
+    STATE_FRESHLY_SPAWNED,
+    STATE_MANA_BUBBLE,
+    STATE_SHIELDED,
+    STATE_ACCELERATED,
+    STATE_ARCHER,
+)
+
+_LAYER_SIZE = (SQUARE_COUNT + 7) // 8
+# Player 1, player 2, masters, state flags, mine traps and their visibility
+_LAYER_COUNT = 3 + len(_STATE_FLAGS) + 3
+
+_HEADER_FORMAT = "BH?HQI"
+_PLAYER_FORMAT = "hhBBBBH" + "B" * len(_SPELL_IDS)
+_SNAPSHOT_STRUCT = struct.Struct(
+    "<"
+    + _HEADER_FORMAT
+    + _PLAYER_FORMAT * 2
+    + "B" * len(_SPELL_IDS)
+    + f"{_LAYER_SIZE}s" * _LAYER_COUNT
+    + "H" * SQUARE_COUNT
+    + "B" * SQUARE_COUNT * 2
+)
+
+SNAPSHOT_SIZE = _SNAPSHOT_STRUCT.size
+
+_HEADER_LENGTH = len(_HEADER_FORMAT)
+_PLAYER_LENGTH = len(_PLAYER_FORMAT)
+_RESOURCES_LENGTH = _PLAYER_LENGTH - len(_SPELL_IDS)
+
+# Offsets of each section within the unpacked values
+_PLAYERS_OFFSET = _HEADER_LENGTH
+_TURN_SPELLS_OFFSET = _PLAYERS_OFFSET + _PLAYER_LENGTH * 2
+_LAYERS_OFFSET = _TURN_SPELLS_OFFSET + len(_SPELL_IDS)
+_CELL_IDS_OFFSET = _LAYERS_OFFSET + _LAYER_COUNT
+_MOVEMENTS_OFFSET = _CELL_IDS_OFFSET + SQUARE_COUNT
+_ATTACKS_OFFSET = _MOVEMENTS_OFFSET + SQUARE_COUNT
+
+
+def encode_snapshot(match_context: "MatchContext", turn_state: "TurnState") -> bytes:
+    """
+    Returns the snapshot of the given match position.
+    """
+    game_board = match_context.game_board
+    bit_board = game_board.bit_board
+    values = [
+        SNAPSHOT_VERSION,
+        match_context.current_turn,
+        match_context.is_player1_turn,
+        bit_board.next_cell_id,
+        match_context.rng_seed,
+        match_context.rng_draws,
+    ]
+    _append_player_values(values, match_context.player1)
+    _append_player_values(values, match_context.player2)
+    values += (turn_state.spells.count(spell_id) for spell_id in _SPELL_IDS)
+
+    layers = (
+        bit_board.player1,
+        bit_board.player2,
+        bit_board.masters,
+        *(bit_board.states[flag] for flag in _STATE_FLAGS),
+        bit_board.mine_traps,
+        bit_board.mine_traps_visible_to_player1,
+        bit_board.mine_traps_visible_to_player2,
+    )
+    values += (layer.to_bytes(_LAYER_SIZE, "little") for layer in layers)
+
+    cell_ids = game_board.get_cell_ids()
+    movements, attacks = turn_state.movements, turn_state.attacks
+    values += (cell_id or 0 for cell_id in cell_ids)
+    values += (movements.get(cell_id, 0) for cell_id in cell_ids)
+    values += (attacks.get(cell_id, 0) for cell_id in cell_ids)
+
+    return _SNAPSHOT_STRUCT.pack(*values)
+
+
+def restore_snapshot(
+    snapshot: bytes | bytearray | memoryview,
+    match_context: "MatchContext",
+    turn_state: "TurnState",
+):
+    """
+    Restores the position of the given snapshot into the match context and turn state.
+
+    The match context gets a new game board, built over the restored layers,
+    while the players' resources are updated in place.
+    The changes recorded by the match journal so far are discarded,
+    since they do not lead to the restored position.
+    """
+    if len(snapshot) != SNAPSHOT_SIZE:
+        raise ValueError(
+            f"Expected a snapshot of {SNAPSHOT_SIZE} bytes, got {len(snapshot)}"
+        )
+
+    values = _SNAPSHOT_STRUCT.unpack(snapshot)
+    (
+        version,
+        current_turn,
+        is_player1_turn,
+        next_cell_id,
+        rng_seed,
+        rng_draws,
+    ) = values[:_HEADER_LENGTH]
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version : {version}")
+
+    match_context.journal.clear()
+    match_context.current_turn = current_turn
+    match_context.is_player1_turn = is_player1_turn
+    match_context.rng_seed = rng_seed
+    match_context.rng_draws = rng_draws
+    _restore_player(
+        values[_PLAYERS_OFFSET : _PLAYERS_OFFSET + _PLAYER_LENGTH],
+        match_context.player1,
+    )
+    _restore_player(
+        values[_PLAYERS_OFFSET + _PLAYER_LENGTH : _TURN_SPELLS_OFFSET],
+        match_context.player2,
+    )
+
+    (
+        player1,
+        player2,
+        masters,
+        *state_masks,
+        mine_traps,
+        mine_traps_visible_to_player1,
+        mine_traps_visible_to_player2,
+    ) = (
+        int.from_bytes(layer, "little")
+        for layer in values[_LAYERS_OFFSET:_CELL_IDS_OFFSET]
+    )
+    bit_board = BitBoard.get_empty()
+    bit_board.player1 = player1
+    bit_board.player2 = player2
+    bit_board.masters = masters
+    bit_board.states = {
+        CellState(flag): state_mask
+        for flag, state_mask in zip(_STATE_FLAGS, state_masks)
+    }
+    bit_board.mine_traps = mine_traps
+    bit_board.mine_traps_visible_to_player1 = mine_traps_visible_to_player1
+    bit_board.mine_traps_visible_to_player2 = mine_traps_visible_to_player2
+    bit_board.zobrist_hash = bit_board.compute_zobrist_hash()
+    bit_board.next_cell_id = next_cell_id
+    bit_board.journal = match_context.journal
+
+    cell_ids = [
+        cell_id or None for cell_id in values[_CELL_IDS_OFFSET:_MOVEMENTS_OFFSET]
+    ]
+    match_context.game_board = GameBoard.from_bit_board(bit_board, cell_ids)
+
+    turn_state.is_player1_turn = is_player1_turn
+    turn_state.movements = _get_turn_counters(
+        cell_ids, values[_MOVEMENTS_OFFSET:_ATTACKS_OFFSET]
+    )
+    turn_state.attacks = _get_turn_counters(cell_ids, values[_ATTACKS_OFFSET:])
+    turn_state.spells = [
+        spell_id
+        for spell_id, count in zip(
+            _SPELL_IDS, values[_TURN_SPELLS_OFFSET:_LAYERS_OFFSET]
+        )
+        for _ in range(count)
+    ]
+
+
+def _get_turn_counters(cell_ids: list[int | None], counts: tuple[int, ...]):
+    return {
+        cell_id: count for cell_id, count in zip(cell_ids, counts) if count and cell_id
+    }
+
+
+def _append_player_values(values: list, player: Player):
+    resources = player.resources
+    values += (
+        resources.max_hp,
+        resources.current_hp,
+        resources.max_mp,
+        resources.current_mp,
+        resources.current_stamina,
+        resources.max_stamina,
+        player.match_data.fatigue_damage,
+    )
+    values += (resources.spells.get(spell_id, 0) for spell_id in _SPELL_IDS)
+
+
+def _restore_player(values: tuple, player: Player):
+    resources = player.resources
+    (
+        resources.max_hp,
+        resources.current_hp,
+        resources.max_mp,
+        resources.current_mp,
+        resources.current_stamina,
+        resources.max_stamina,
+        player.match_data.fatigue_damage,
+    ) = values[:_RESOURCES_LENGTH]
+
+    for spell_id, count in zip(_SPELL_IDS, values[_RESOURCES_LENGTH:]):
+        if resources.spells.get(spell_id) != count:
+            resources.set_spell_count(spell_id, count)
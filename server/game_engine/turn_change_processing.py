@@ -4,6 +4,7 @@ from constants.game_constants import (
 )
 from game_engine.models.match.match_closure_info import EndingReason
 from game_engine.models.match.match_context import MatchContext
+from game_engine.models.match.match_journal import MatchJournal
 from game_engine.models.player.player import Player
 from game_engine.models.turn.turn_processing_result import TurnProcessingResult
 
@@ -16,6 +17,15 @@ def process_turn_change(match_context: MatchContext):
     """
     turn_change_result = TurnProcessingResult.get_default()
 
+    # The turn change gets its own entry, for the caller to end once the turn state
+    # is reset as well
+    journal = match_context.journal
+    journal.begin_entry()
+    journal.record_attribute(match_context, "current_turn", match_context.current_turn)
+    journal.record_attribute(
+        match_context, "is_player1_turn", match_context.is_player1_turn
+    )
+
     # Actual turn change
     match_context.current_turn += 1
     match_context.is_player1_turn = not match_context.is_player1_turn
@@ -32,13 +42,18 @@ def _post_change_processing(
     current_turn = match_context.current_turn
     player = match_context.get_current_player()
 
-    _decrement_player_stamina(player, current_turn, turn_change_result)
+    _decrement_player_stamina(
+        player, current_turn, turn_change_result, match_context.journal
+    )
     _increment_current_player_mp(player, match_context.current_turn)
     _process_cell_states(match_context)
 
 
 def _decrement_player_stamina(
-    player: Player, current_turn: int, turn_change_result: TurnProcessingResult
+    player: Player,
+    current_turn: int,
+    turn_change_result: TurnProcessingResult,
+    journal: MatchJournal,
 ):
     if current_turn <= 2:
         return
@@ -51,7 +66,9 @@ def _decrement_player_stamina(
 
     # Player has lost stamina, so we need to decrement their HP
     # and check if they have lost the game due to fatigue
-    fatigue_damage = player.match_data.fatigue_damage + 1
+    match_data = player.match_data
+    journal.record_attribute(match_data, "fatigue_damage", match_data.fatigue_damage)
+    fatigue_damage = match_data.fatigue_damage + 1
     player.match_data.fatigue_damage = turn_change_result.ongoing_fatigue_damage = (
         fatigue_damage
     )
@@ -77,18 +94,18 @@ def _process_cell_states(match_context: MatchContext):
     Cells cannot move nor attack on the turn they are spawned, so
     we "wake them up" during the next turn.
     """
-    current_player_cells = match_context.game_board.get_cells_owned_by_player(
-        player1=match_context.is_player1_turn,
-    )
-    other_player_cells = match_context.game_board.get_cells_owned_by_player(
-        player1=not match_context.is_player1_turn,
-    )
-    for cell in current_player_cells:
-        for state in STATES_TO_CLEAR_AT_TURN_BEGINNING:
-            if cell.has_state(state):
-                cell.remove_state(state)
-
-    for cell in other_player_cells:
-        for state in STATES_TO_CLEAR_AT_TURN_END:
-            if cell.has_state(state):
-                cell.remove_state(state)
+    game_board = match_context.game_board
+    bit_board = game_board.bit_board
+    current_player_mask = bit_board.get_owned(match_context.is_player1_turn)
+    other_player_mask = bit_board.get_owned(not match_context.is_player1_turn)
+
+    # Only visit the cells actually having the states to clear
+    for state in STATES_TO_CLEAR_AT_TURN_BEGINNING:
+        state_mask = current_player_mask & bit_board.get_state(state)
+        for cell in game_board.get_cells_from_mask(state_mask):
+            cell.remove_state(state)
+
+    for state in STATES_TO_CLEAR_AT_TURN_END:
+        state_mask = other_player_mask & bit_board.get_state(state)
+        for cell in game_board.get_cells_from_mask(state_mask):
+            cell.remove_state(state)
@@ -48,6 +48,7 @@ class MatchHandlerUnit:
             player1_turn=False,
             player1_resources=player1.resources,
             player2_resources=player2.resources,
+            journal=self.match_context.journal,
         )
 
         self.status = MatchStatus.WAITING_TO_START
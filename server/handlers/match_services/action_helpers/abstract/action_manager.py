@@ -56,7 +56,9 @@ class ActionManager(TransientTurnStateHolder):
             @functools.wraps(func)
             def wrapper(self: "ActionManager", *args, **kwargs):
                 if force_reset or not self.get_transient_game_board():
-                    self.set_transient_game_board(self._game_board.clone_as_transient())
+                    self.set_transient_game_board(
+                        self._game_board.create_transient_overlay()
+                    )
 
                 return func(self, *args, **kwargs)
 
@@ -39,12 +39,16 @@ class CommonActionManager(ActionManager):
         self, action: Action, with_post_processing_recalculation: bool = False
     ):
         """
-        Validates the given action and processes it if it is valid.
+        Validates the given action against the game rules and processes it
+        if it is valid.
         """
-        if action not in self.get_possible_actions():
-            self.logger.error(
-                f"The following action was not registered in the possible actions : {action}"
-            )
+        current_player = self._match_actions_service.current_player
+        if action.mana_cost > current_player.resources.current_mp:
+            self.set_error_message(ErrorMessages.NOT_ENOUGH_MANA)
+            return
+
+        if not action.is_valid(self.match_context, self.turn_state):
+            self.logger.error(f"The following action is not valid : {action}")
 
             player_mode = self.get_player_mode()
             if player_mode == PlayerMode.SPELL_SELECTED:
@@ -54,11 +58,6 @@ class CommonActionManager(ActionManager):
                 self.set_error_message(ErrorMessages.INVALID_ACTION)
             return
 
-        current_player = self._match_actions_service.current_player
-        if action.mana_cost > current_player.resources.current_mp:
-            self.set_error_message(ErrorMessages.NOT_ENOUGH_MANA)
-            return
-
         self._process_action(action, with_post_processing_recalculation)
 
     def trigger_callbacks(self):
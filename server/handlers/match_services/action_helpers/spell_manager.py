@@ -59,7 +59,13 @@ class SpellManager(ActionManager):
         self.set_player_mode(PlayerMode.SPELL_SELECTED)
         self.set_selected_spell(spell)
         self.set_possible_actions(possible_spell_invocations)
-        self.set_possible_actions_metadata(spell.get_specific_metadata_dto())
+        # Already computed when calculating the spell castings
+        targeting_result = spell.get_possible_targets(
+            transient_game_board, player.is_player_1
+        )
+        self.set_possible_actions_metadata(
+            spell.get_specific_metadata_dto(targeting_result)
+        )
 
     def _player_has_enough_mana(self, spell: Spell, playerResources: PlayerResources):
         """
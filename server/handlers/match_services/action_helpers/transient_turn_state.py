@@ -28,7 +28,7 @@ class TransientTurnState:
         self.triggered_callbacks: set[ActionCallback] = set()
         self.player_mode = PlayerMode.IDLE
         self.server_mode = ServerMode.SHOW_POSSIBLE_ACTIONS
-        # Board copy to save and send to the client the transient states
+        # Board overlay to save and send to the client the transient states
         # resulting from the possible actions.
         self.transient_game_bard: GameBoard | None = None
         # Applicable when the player mode is OWN_CELL_SELECTED
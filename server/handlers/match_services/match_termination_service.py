@@ -88,6 +88,7 @@ class MatchTerminationService(ServiceBase):
             actions_per_turn_serialized=self.match.get_actions_per_turn(
                 serialized=True
             ),
+            rng_seed=self.match_context.rng_seed,
         )
         self._logger.debug(f"Match ended -> {self.match_closure_info.simple_str()}")
 
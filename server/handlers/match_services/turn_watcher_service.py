@@ -92,6 +92,7 @@ class TurnWatcherService(ServiceBase):
         """
         turn_change_result = process_turn_change(self.match_context)
         self._trigger_external_callbacks()
+        self.match_context.journal.end_entry()
 
         return turn_change_result
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Integer, String, func
+from sqlalchemy import JSON, BigInteger, DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from game_engine.models.match.match_closure_info import MatchClosureInfo
@@ -21,6 +21,8 @@ class EndedMatch(db.Model):
     ending_reason: Mapped[str] = mapped_column(String(256), nullable=False)
     total_turns: Mapped[int] = mapped_column(Integer, nullable=False)
     actions_per_turn: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    # None for the matches ended before the seed was stored
+    rng_seed: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     ended_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     def __repr__(self):
@@ -37,6 +39,7 @@ class EndedMatch(db.Model):
             ending_reason=closure_info.ending_reason.value,
             total_turns=closure_info.total_turns,
             actions_per_turn=closure_info.actions_per_turn_serialized,
+            rng_seed=closure_info.rng_seed,
         )
 
     def __repr__(self):
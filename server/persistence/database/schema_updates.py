@@ -0,0 +1,20 @@
+from sqlalchemy import text
+
+from persistence.database import db
+from persistence.database.tables import Table
+
+# Columns added to tables that existing databases already created,
+# which db.create_all() leaves untouched. Each statement must be idempotent.
+_SCHEMA_UPDATES = (
+    f"ALTER TABLE {Table.ENDED_MATCHES} ADD COLUMN IF NOT EXISTS rng_seed BIGINT",
+)
+
+
+def apply_schema_updates():
+    """
+    Brings the existing tables up to date with the models.
+    Meant to run right after db.create_all(), within an application context.
+    """
+    with db.engine.begin() as connection:
+        for statement in _SCHEMA_UPDATES:
+            connection.execute(text(statement))
@@ -4,9 +4,9 @@ from unittest.mock import MagicMock, patch
 from ai.strategy.decision_makers.attack_decider import AttackDecider
 from ai.strategy.evaluators.board.board_evaluation import BoardEvaluation
 from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.legal_actions import LegalActions
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.match.match_context import MatchContext
-from game_engine.models.cell.cell import Cell
 from handlers.match_handler_unit import MatchHandlerUnit
 from game_engine.models.game_board import GameBoard
 
@@ -24,41 +24,27 @@ class TestAttackDecider:
     def decider(self, mock_match: MagicMock) -> AttackDecider:
         return AttackDecider(mock_match, ai_is_player1=True)
 
-    @patch(
-        "ai.strategy.decision_makers.attack_decider.get_possible_movements_and_attacks"
-    )
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
     def test_decide_attack_no_options(
-        self, mock_get_options: MagicMock, decider: AttackDecider
+        self, mock_get_legal_actions: MagicMock, decider: AttackDecider
     ) -> None:
         # Arrange
-        mock_get_options.return_value = set()
+        mock_get_legal_actions.return_value = LegalActions.get_empty()
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
-        # Ensure game_board.get_cells_owned_by_player is mocked
-        decider._match_context.game_board.get_cells_owned_by_player.return_value = [
-            MagicMock(spec=Cell)
-        ]
-
         # Act
         action: Optional[CellAttack] = decider.decide_attack(evaluation)
 
         # Assert
         assert action is None
 
-    @patch(
-        "ai.strategy.decision_makers.attack_decider.get_possible_movements_and_attacks"
-    )
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
     def test_decide_attack_picks_best_score(
-        self, mock_get_options: MagicMock, decider: AttackDecider, mock_match: MagicMock
+        self, mock_get_legal_actions: MagicMock, decider: AttackDecider
     ) -> None:
         # Arrange
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
-        ai_cell: Cell = MagicMock(spec=Cell)
-        mock_match.match_context.game_board.get_cells_owned_by_player.return_value = [
-            ai_cell
-        ]
-
         attack1: CellAttack = MagicMock(spec=CellAttack)
         attack1.metadata = MagicMock()
         attack1.metadata.impacted_coords = Coordinates(8, 5)
@@ -67,7 +53,10 @@ class TestAttackDecider:
         attack2.metadata = MagicMock()
         attack2.metadata.impacted_coords = Coordinates(4, 5)
 
-        mock_get_options.return_value = {attack1, attack2}
+        legal_actions = LegalActions.get_empty()
+        legal_actions.attacks[Coordinates(7, 5)] = [attack1]
+        legal_actions.attacks[Coordinates(5, 5)] = [attack2]
+        mock_get_legal_actions.return_value = legal_actions
 
         # Mock the evaluator to prefer attack2
         with patch.object(decider._evaluator, "evaluate") as mock_eval:
@@ -81,19 +70,22 @@ class TestAttackDecider:
             # Assert
             assert action.action == attack2
 
-    @patch(
-        "ai.strategy.decision_makers.attack_decider.get_possible_movements_and_attacks"
-    )
-    def test_decide_attack_returns_none_if_no_cells(
-        self, mock_get_options: MagicMock, decider: AttackDecider, mock_match: MagicMock
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
+    def test_decide_attack_computes_legal_actions_of_the_ai(
+        self,
+        mock_get_legal_actions: MagicMock,
+        decider: AttackDecider,
+        mock_match: MagicMock,
     ) -> None:
-        """Test that None is returned if AI has no cells on board."""
+        """Test that the legal actions are computed for the AI side and current turn."""
         # Arrange
-        mock_match.match_context.game_board.get_cells_owned_by_player.return_value = []
+        mock_get_legal_actions.return_value = LegalActions.get_empty()
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
         # Act
-        action: Optional[CellAttack] = decider.decide_attack(evaluation)
+        decider.decide_attack(evaluation)
 
         # Assert
-        assert action is None
+        mock_get_legal_actions.assert_called_once_with(
+            True, mock_match.match_context, mock_match.turn_state
+        )
@@ -19,6 +19,7 @@ class TestCelerityEvaluator:
         action = MagicMock(spec=SpellCasting)
         action.metadata = MagicMock()
         action.spell = MagicMock()
+        action.targeting_result = MagicMock()
         action.spell.ID = SpellId.CELERITY
         return action
 
@@ -21,6 +21,7 @@ class TestShieldFormationEvaluator:
         action = MagicMock(spec=SpellCasting)
         action.metadata = MagicMock()
         action.spell = MagicMock()
+        action.targeting_result = MagicMock()
         action.spell.ID = SpellId.SHIELD_FORMATION
         action.metadata.impacted_coords = []
         return action
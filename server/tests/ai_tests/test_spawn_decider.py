@@ -3,6 +3,7 @@ from typing import Optional
 from unittest.mock import MagicMock, patch
 from ai.strategy.decision_makers.spawn_decider import SpawnDecider
 from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.actions.legal_actions import LegalActions
 from game_engine.models.dtos.coordinates import Coordinates
 from game_engine.models.match.match_context import MatchContext
 from handlers.match_handler_unit import MatchHandlerUnit
@@ -19,6 +20,7 @@ class TestSpawnDecider:
         match = MagicMock(spec=MatchHandlerUnit)
         match_context = MagicMock(spec=MatchContext)
         match.match_context = match_context
+        match.turn_state = MagicMock()
 
         player1 = MagicMock(spec=Player)
         player1.resources = MagicMock(spec=PlayerResources)
@@ -76,31 +78,29 @@ class TestSpawnDecider:
         # Should return None because Player 2's mana is checked
         assert action is None
 
-    @patch("ai.strategy.decision_makers.spawn_decider.get_possible_spawns")
-    def test_decide_spawn_uses_transient_board(
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
+    def test_decide_spawn_computes_legal_actions_of_the_ai(
         self,
-        mock_get_possible_spawns: MagicMock,
+        mock_get_legal_actions: MagicMock,
         decider: SpawnDecider,
         mock_match: MagicMock,
     ) -> None:
-        """Test that get_possible_spawns is called with a cloned board."""
+        """Test that the legal actions are computed for the AI side and current turn."""
         # Arrange
-        transient_board: MagicMock = MagicMock(spec=GameBoard)
-        mock_match.match_context.game_board.clone_as_transient.return_value = (
-            transient_board
-        )
-        mock_get_possible_spawns.return_value = []
+        mock_get_legal_actions.return_value = LegalActions.get_empty()
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
         # Act
         decider.decide_spawn(evaluation)
 
         # Assert
-        mock_get_possible_spawns.assert_called_once_with(True, transient_board)
+        mock_get_legal_actions.assert_called_once_with(
+            True, mock_match.match_context, mock_match.turn_state
+        )
 
-    @patch("ai.strategy.decision_makers.spawn_decider.get_possible_spawns")
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
     def test_decide_spawn_picks_best_score(
-        self, mock_get_possible_spawns: MagicMock, decider: SpawnDecider
+        self, mock_get_legal_actions: MagicMock, decider: SpawnDecider
     ) -> None:
         """Test that the decider chooses relevant spawn based on evaluator scores."""
         # Arrange
@@ -112,7 +112,9 @@ class TestSpawnDecider:
         spawn2.metadata = MagicMock(spec=ActionMedatata)
         spawn2.metadata.impacted_coords = Coordinates(3, 5)
 
-        mock_get_possible_spawns.return_value = [spawn1, spawn2]
+        legal_actions = LegalActions.get_empty()
+        legal_actions.spawns = [spawn1, spawn2]
+        mock_get_legal_actions.return_value = legal_actions
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
         # Mock the evaluator to prefer spawn2
@@ -127,13 +129,13 @@ class TestSpawnDecider:
             # Assert
             assert action.action == spawn2
 
-    @patch("ai.strategy.decision_makers.spawn_decider.get_possible_spawns")
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
     def test_decide_spawn_returns_none_if_no_options(
-        self, mock_get_possible_spawns: MagicMock, decider: SpawnDecider
+        self, mock_get_legal_actions: MagicMock, decider: SpawnDecider
     ) -> None:
         """Test that None is returned if no spawn locations are available."""
         # Arrange
-        mock_get_possible_spawns.return_value = []
+        mock_get_legal_actions.return_value = LegalActions.get_empty()
         evaluation: BoardEvaluation = MagicMock(spec=BoardEvaluation)
 
         # Act
@@ -1,16 +1,16 @@
 from unittest.mock import MagicMock, patch
 from ai.strategy.decision_makers.spell_decider import SpellDecider
 from game_engine.models.spells.spell_id import SpellId
+from game_engine.models.actions.legal_actions import LegalActions
 from game_engine.models.actions.spell_casting import SpellCasting
 from game_engine.models.dtos.coordinates import Coordinates
 
 
 class TestSpellDecider:
 
-    @patch("ai.strategy.decision_makers.spell_decider.get_spell")
-    @patch("ai.strategy.decision_makers.spell_decider.SpellCasting.calculate")
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
     def test_decide_spell_prioritizes_stamina_when_low(
-        self, mock_calculate, mock_get_spell, mock_match, board_evaluation
+        self, mock_get_legal_actions, mock_match, board_evaluation
     ):
         # Arrange
         ai_is_player1 = True
@@ -25,13 +25,14 @@ class TestSpellDecider:
         mock_spell = MagicMock()
         mock_spell.ID = SpellId.MINE_TRAP
         mock_spell.MANA_COST = 1
-        mock_get_spell.return_value = mock_spell
 
         mock_action = MagicMock(spec=SpellCasting)
         mock_action.spell = mock_spell
         mock_action.metadata = MagicMock()
         mock_action.metadata.impacted_coords = Coordinates(5, 5)
-        mock_calculate.return_value = [mock_action]
+        legal_actions = LegalActions.get_empty()
+        legal_actions.spell_castings[SpellId.MINE_TRAP] = [mock_action]
+        mock_get_legal_actions.return_value = legal_actions
 
         # Low stamina
         board_evaluation.ai_stamina = 1
@@ -43,7 +44,10 @@ class TestSpellDecider:
         # Assert
         assert action.action == mock_action
 
-    def test_decide_spell_returns_none_if_no_mana(self, mock_match, board_evaluation):
+    @patch("ai.strategy.decision_makers.base_decider.get_all_legal_actions")
+    def test_decide_spell_returns_none_if_no_mana(
+        self, mock_get_legal_actions, mock_match, board_evaluation
+    ):
         # Arrange
         ai_is_player1 = True
         decider = SpellDecider(mock_match, ai_is_player1)
@@ -51,6 +55,8 @@ class TestSpellDecider:
         player = mock_match.match_context.player1
         player.resources.spells = {SpellId.MINE_TRAP: 1}
         player.resources.current_mp = 0  # No mana
+        # The spells the AI cannot afford are left out of its legal actions
+        mock_get_legal_actions.return_value = LegalActions.get_empty()
 
         # Act
         action = decider.decide_spell(board_evaluation)
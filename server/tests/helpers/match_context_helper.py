@@ -1,4 +1,6 @@
+from game_engine.models.game_board import GameBoard
 from game_engine.models.match.match_context import MatchContext
+from game_engine.models.player.player import Player
 
 
 class MatchContextHelper:
@@ -27,8 +29,7 @@ class MatchContextHelper:
         return (player1_match_data, player2_match_data)
 
     def get_master_cell(self, of_player_1: bool):
-        player_cells = self._game_board.get_cells_owned_by_player(of_player_1)
-        return next((cell for cell in player_cells if cell.is_master), None)
+        return self._game_board.get_master(of_player_1)
 
     def get_neighbours(self, row_index: int, col_index: int):
         return self._game_board.get_neighbours(row_index, col_index)
@@ -37,3 +38,18 @@ class MatchContextHelper:
         return self._game_board.get(row_index, col_index)
 
     # endregion
+
+
+def create_match_context(current_turn: int = 1):
+    """
+    Returns a standalone match context on its initial board, with player 1 to move.
+    """
+    return MatchContext(
+        id="match",
+        room_id="room",
+        current_turn=current_turn,
+        is_player1_turn=True,
+        game_board=GameBoard.get_initial(),
+        player1=Player.get_initial("p1", "room1", "user1", True, False),
+        player2=Player.get_initial("p2", "room2", "user2", False, False),
+    )
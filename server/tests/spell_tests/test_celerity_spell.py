@@ -1,6 +1,9 @@
 from game_engine.models.actions.cell_movement import CellMovement
 from game_engine.models.cell.cell_state import CellState
 from game_engine.models.cell.cell_transient_state import CellTransientState
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from game_engine.models.spells.celerity_spell import CeleritySpell
 from game_engine.models.spells.spell_id import SpellId
 from tests.helpers.match_helper import MatchHelper
 
@@ -111,3 +114,25 @@ def test_accelerated_state(started_match: MatchHelper):
     player1_resources, player2_resources = started_match.get_both_players_resources()
     assert player1_resources.current_hp == player1_resources.max_hp - 2
     assert player2_resources.current_hp == player2_resources.max_hp - 2
+
+
+def test_celerity_targets_only_maximal_diagonals():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    for row_index, column_index in [(2, 2), (3, 3), (4, 4)]:
+        game_board.get(row_index, column_index).set_owned_by_player1()
+    spell = CeleritySpell()
+
+    # Act
+    targeting_result = spell.get_possible_targets(
+        game_board.create_transient_overlay(), True
+    )
+
+    # Assert
+    assert targeting_result.formations == (
+        (Coordinates(2, 2), Coordinates(3, 3), Coordinates(4, 4)),
+    )
+    assert (
+        spell.get_impacted_cells(Coordinates(3, 3), targeting_result)
+        == targeting_result.formations[0]
+    )
@@ -1,4 +1,12 @@
+from unittest.mock import MagicMock
+
+from game_engine.models.actions.callbacks.mine_explosion_callback import (
+    MineExplosionCallback,
+)
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.cell.cell_owner import CellOwner
 from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
 from game_engine.models.spells.spell_id import SpellId
 from tests.helpers.match_helper import MatchHelper
 
@@ -41,3 +49,44 @@ def test_mine_trap_spell(started_match: MatchHelper):
     assert not mine_trap1.belongs_to_player_2()
     # The player has taken 2 damage
     assert player2_resources.current_hp == player2_resources.max_hp - 2
+
+
+def test_chained_explosions_follow_discovery_order():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    origin = Coordinates(5, 5)
+    # (4, 5) is reached first, then (3, 6) diagonally, then (4, 7) and (5, 7),
+    # so the radius 3 explosions come before the radius 2 one
+    for row_index, column_index in [(5, 5), (4, 5), (3, 6), (4, 7), (5, 7)]:
+        game_board.get(row_index, column_index).set_as_mine_trap(CellOwner.PLAYER_1)
+    match_context = MagicMock()
+    match_context.game_board = game_board
+    callback = MineExplosionCallback(CellSpawn.create(False, *origin.as_tuple()))
+    callback.explosion_center_coords = origin
+
+    # Act
+    callback.register_callbacks(match_context)
+
+    # Assert
+    assert [
+        chained.explosion_center_coords.as_tuple()
+        for chained in callback.get_callbacks_to_trigger()
+    ] == [(4, 5), (3, 6), (4, 7), (5, 7)]
+
+
+def test_no_callback_registered_on_unmined_target():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    game_board.get(4, 4).set_as_mine_trap(CellOwner.PLAYER_1)
+    match_context = MagicMock()
+    match_context.game_board = game_board
+
+    # Act
+    safe_spawn = CellSpawn.create(False, 4, 5)
+    safe_spawn.register_callbacks(match_context)
+    mined_spawn = CellSpawn.create(False, 4, 4)
+    mined_spawn.register_callbacks(match_context)
+
+    # Assert
+    assert not safe_spawn.has_callbacks_to_trigger()
+    assert mined_spawn.has_callbacks_to_trigger()
@@ -0,0 +1,200 @@
+from constants.game_constants import BOARD_SIZE
+from game_engine.action_calculation import (
+    get_all_legal_actions,
+    get_possible_movements_and_attacks,
+    get_possible_spawns,
+    get_possible_spell_castings,
+)
+from game_engine.action_codec import decode_action, encode_action, is_from_player1
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.actions.spell_casting import SpellCasting
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from game_engine.models.spells.spell_factory import get_spell
+from game_engine.models.turn.turn_state import TurnState
+from tests.helpers.match_context_helper import create_match_context
+
+
+def test_legal_actions_match_per_cell_calculations():
+    # Arrange
+    match_context = create_match_context(current_turn=3)
+    game_board = match_context.game_board
+    game_board.spawn_cell(Coordinates(2, 5), for_player1=True)
+    game_board.get(2, 5).remove_state(CellState.FRESHLY_SPAWNED)
+    game_board.spawn_cell(Coordinates(3, 3), for_player1=True)
+    game_board.get(3, 3).remove_state(CellState.FRESHLY_SPAWNED)
+    game_board.get(3, 3).add_modifier(CellState.ARCHER)
+    game_board.spawn_cell(Coordinates(3, 5), for_player1=False)
+    game_board.spawn_cell(Coordinates(8, 8), for_player1=False)
+    game_board.get(4, 4).set_as_mine_trap(CellOwner.PLAYER_2)
+    match_context.player1.resources.current_mp = 10
+
+    turn_state = TurnState.get_initial(
+        True, match_context.player1.resources, match_context.player2.resources
+    )
+    turn_state.register_attack(game_board.get(2, 5).id)
+
+    expected = set()
+    for cell in game_board.get_cells_owned_by_player(True):
+        expected |= get_possible_movements_and_attacks(
+            True, cell, game_board.create_transient_overlay(), turn_state
+        )
+    expected |= get_possible_spawns(True, game_board.create_transient_overlay())
+    for spell_id in match_context.player1.resources.spells:
+        expected |= get_possible_spell_castings(
+            get_spell(spell_id), True, game_board.create_transient_overlay()
+        )
+
+    # Act
+    legal_actions = get_all_legal_actions(True, match_context, turn_state)
+
+    # Assert
+    assert set(legal_actions) == expected
+    assert len(legal_actions) == len(expected)
+    assert Coordinates(2, 5) not in legal_actions.attacks
+    archer_attacks = legal_actions.attacks[Coordinates(3, 3)]
+    assert {attack.metadata.impacted_coords for attack in archer_attacks} == {
+        Coordinates(3, 5),
+        Coordinates(8, 8),
+        Coordinates(9, 5),
+    }
+    assert all(
+        isinstance(action, (CellMovement, CellAttack))
+        for action in legal_actions.get_cell_actions(Coordinates(1, 5))
+    )
+
+
+def test_no_spawns_nor_spells_without_mana():
+    # Arrange
+    match_context = create_match_context(current_turn=3)
+    match_context.player1.resources.current_mp = 0
+    turn_state = TurnState.get_initial(
+        True, match_context.player1.resources, match_context.player2.resources
+    )
+
+    # Act
+    legal_actions = get_all_legal_actions(True, match_context, turn_state)
+
+    # Assert
+    assert not legal_actions.spawns
+    assert not legal_actions.spell_castings
+    assert legal_actions.movements[Coordinates(1, 5)]
+
+
+def test_action_codes_round_trip():
+    # Arrange
+    match_context = create_match_context(current_turn=3)
+    game_board = match_context.game_board
+    game_board.spawn_cell(Coordinates(2, 5), for_player1=True)
+    game_board.get(2, 5).remove_state(CellState.FRESHLY_SPAWNED)
+    game_board.spawn_cell(Coordinates(3, 5), for_player1=False)
+    match_context.player1.resources.current_mp = 10
+    turn_state = TurnState.get_initial(
+        True, match_context.player1.resources, match_context.player2.resources
+    )
+    actions = list(get_all_legal_actions(True, match_context, turn_state))
+
+    # Act
+    codes = [encode_action(action) for action in actions]
+    decoded_actions = [decode_action(code, game_board) for code in codes]
+
+    # Assert
+    assert len(set(codes)) == len(actions)
+    assert decoded_actions == actions
+    assert all(is_from_player1(code) for code in codes)
+
+
+def test_archer_attacks_are_tagged_up_front():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    game_board.spawn_cell(Coordinates(2, 5), for_player1=True)
+    archer = game_board.get(2, 5)
+    archer.add_modifier(CellState.ARCHER)
+    game_board.spawn_cell(Coordinates(3, 5), for_player1=False)
+    game_board.spawn_cell(Coordinates(7, 2), for_player1=False)
+    game_board.get(7, 2).add_modifier(CellState.ARCHER)
+
+    # Act
+    attacks = CellAttack.calculate(
+        archer, True, game_board.create_transient_overlay()
+    )
+
+    # Assert
+    tags = {
+        attack.metadata.impacted_coords: (
+            attack.specific_metadata.is_ranged_attack,
+            attack.specific_metadata.is_retaliated,
+        )
+        for attack in attacks
+    }
+    assert tags == {
+        Coordinates(3, 5): (False, True),
+        Coordinates(7, 2): (True, True),
+        Coordinates(9, 5): (True, False),
+    }
+
+
+def test_rule_validators_agree_with_legal_actions():
+    # Arrange
+    match_context = create_match_context(current_turn=3)
+    game_board = match_context.game_board
+    game_board.spawn_cell(Coordinates(2, 5), for_player1=True)
+    game_board.get(2, 5).remove_state(CellState.FRESHLY_SPAWNED)
+    game_board.spawn_cell(Coordinates(3, 3), for_player1=True)
+    game_board.get(3, 3).remove_state(CellState.FRESHLY_SPAWNED)
+    game_board.get(3, 3).add_modifier(CellState.ARCHER)
+    game_board.spawn_cell(Coordinates(2, 2), for_player1=True)
+    game_board.spawn_cell(Coordinates(3, 5), for_player1=False)
+    game_board.spawn_cell(Coordinates(8, 8), for_player1=False)
+    game_board.get(4, 4).set_as_mine_trap(CellOwner.PLAYER_2)
+    match_context.player1.resources.current_mp = 10
+
+    turn_state = TurnState.get_initial(
+        True, match_context.player1.resources, match_context.player2.resources
+    )
+    turn_state.register_attack(game_board.get(2, 5).id)
+    turn_state.register_movement(game_board.get(1, 5).id)
+    legal_actions = set(get_all_legal_actions(True, match_context, turn_state))
+
+    squares = [
+        Coordinates.of(row_index, column_index)
+        for row_index in range(BOARD_SIZE)
+        for column_index in range(BOARD_SIZE)
+    ]
+    candidates = []
+    for cell in game_board.get_cells_owned_by_player(True):
+        origin = cell.get_coordinates()
+        for target in squares:
+            candidates.append(
+                CellMovement.create(
+                    True, cell.id, *origin.as_tuple(), *target.as_tuple()
+                )
+            )
+            candidates.append(CellAttack.create(True, cell.id, origin, target))
+    for target in squares:
+        candidates.append(CellSpawn.create(True, *target.as_tuple()))
+        for spell_id in match_context.player1.resources.spells:
+            candidates.append(
+                SpellCasting.create(True, get_spell(spell_id), *target.as_tuple())
+            )
+
+    # Act
+    valid_actions = {
+        action
+        for action in candidates
+        if action.is_valid(match_context, turn_state)
+    }
+
+    # Assert
+    assert valid_actions == legal_actions
+    assert not CellMovement.create(False, 2, 9, 5, 8, 5).is_valid(
+        match_context, turn_state
+    )
+    assert not CellAttack.create(
+        True, game_board.get(3, 3).id + 1, Coordinates(3, 3), Coordinates(3, 5)
+    ).is_valid(match_context, turn_state)
+    assert not CellSpawn.create(True, -1, 5).is_valid(match_context, turn_state)
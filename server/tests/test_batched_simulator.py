@@ -0,0 +1,156 @@
+import random
+
+import pytest
+
+from game_engine.action_codec import (
+    encode_action,
+    get_action_type,
+    get_target_index,
+    is_from_player1,
+    pack_action,
+)
+from game_engine.models.actions.action_type import ActionType
+from game_engine.models.actions.spell_casting import SpellCasting
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.match.ending_reason import EndingReason
+from game_engine.simulator.batched_simulator import END_TURN, BatchedMatchSimulator
+from game_engine.simulator.match_simulator import MatchSimulator
+from utils.bitboard_utils import to_bit_index
+
+
+def _assert_same_match(
+    batch: BatchedMatchSimulator, match_index: int, simulator: MatchSimulator
+):
+    match_context = simulator.match_context
+    bit_board = match_context.game_board.bit_board
+    assert batch.owned[0][match_index] == bit_board.player1
+    assert batch.owned[1][match_index] == bit_board.player2
+    assert batch.masters[match_index] == bit_board.masters
+    assert batch.freshly_spawned[match_index] == bit_board.get_state(
+        CellState.FRESHLY_SPAWNED
+    )
+    assert batch.mana_bubbles[match_index] == bit_board.get_state(
+        CellState.MANA_BUBBLE
+    )
+
+    players = (match_context.player1, match_context.player2)
+    for player_index, player in enumerate(players):
+        assert batch.hp[player_index][match_index] == player.resources.current_hp
+        assert batch.mp[player_index][match_index] == player.resources.current_mp
+        assert batch.stamina[player_index][match_index] == (
+            player.resources.current_stamina
+        )
+        assert batch.fatigue_damage[player_index][match_index] == (
+            player.match_data.fatigue_damage
+        )
+
+    assert batch.current_turn[match_index] == match_context.current_turn
+    assert batch.is_player1_turn[match_index] == match_context.is_player1_turn
+    assert batch.ending_reasons[match_index] == simulator.ending_reason
+    if simulator.loser is not None:
+        assert batch.loser_is_player1[match_index] == simulator.loser.is_player_1
+
+
+def _pick_action_code(rng: random.Random, action_codes: list[int]):
+    """
+    Favors attacks then moving towards the opponent, so that the masters fight.
+    """
+    attacks = [
+        action_code
+        for action_code in action_codes
+        if get_action_type(action_code) == ActionType.CELL_ATTACK
+    ]
+    if attacks:
+        return rng.choice(attacks)
+
+    if rng.random() < 0.5:
+        return max(
+            action_codes,
+            key=lambda action_code: (
+                get_target_index(action_code)
+                if is_from_player1(action_code)
+                else -get_target_index(action_code),
+                rng.random(),
+            ),
+        )
+
+    return rng.choice(action_codes)
+
+
+def test_batched_simulator_matches_object_engine():
+    # Arrange
+    rng = random.Random(4)
+    size = 3
+    batch = BatchedMatchSimulator(size)
+    simulators = [MatchSimulator.create() for _ in range(size)]
+
+    while not batch.all_over():
+        batch_legal_actions = batch.legal_actions()
+
+        action_codes = []
+        for match_index, simulator in enumerate(simulators):
+            if simulator.is_over():
+                action_codes.append(None)
+                continue
+
+            cell_actions = [
+                action
+                for action in simulator.legal_actions()
+                if not isinstance(action, SpellCasting)
+            ]
+            cell_action_codes = [encode_action(action) for action in cell_actions]
+            assert batch_legal_actions[match_index] == cell_action_codes
+
+            # Act
+            if not cell_actions or rng.random() < 0.25:
+                simulator.end_turn()
+                action_codes.append(END_TURN)
+            else:
+                action_code = _pick_action_code(rng, cell_action_codes)
+                simulator.step(cell_actions[cell_action_codes.index(action_code)])
+                action_codes.append(action_code)
+
+        batch.step(action_codes)
+
+        # Assert
+        for match_index, simulator in enumerate(simulators):
+            _assert_same_match(batch, match_index, simulator)
+
+    assert all(simulator.is_over() for simulator in simulators)
+    assert {simulator.ending_reason for simulator in simulators} == {
+        EndingReason.PLAYER_VICTORY,
+        EndingReason.DRAW,
+    }
+
+
+def test_batched_simulator_rejects_invalid_actions():
+    # Arrange
+    batch = BatchedMatchSimulator(2)
+    opponent_spawn = pack_action(ActionType.CELL_SPAWN, False, to_bit_index(8, 5))
+    out_of_reach_spawn = pack_action(ActionType.CELL_SPAWN, True, to_bit_index(5, 5))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        batch.step([opponent_spawn, None])
+    with pytest.raises(ValueError):
+        batch.step([None, out_of_reach_spawn])
+    with pytest.raises(ValueError):
+        batch.step([END_TURN])
+
+
+def test_batched_simulator_leaves_the_batch_untouched_on_invalid_actions():
+    # Arrange
+    batch = BatchedMatchSimulator(2)
+    valid_spawn = pack_action(ActionType.CELL_SPAWN, True, to_bit_index(2, 5))
+    out_of_reach_spawn = pack_action(ActionType.CELL_SPAWN, True, to_bit_index(5, 5))
+    legal_actions = batch.legal_actions()
+
+    # Act
+    with pytest.raises(ValueError):
+        batch.step([valid_spawn, out_of_reach_spawn])
+
+    # Assert
+    assert batch.legal_actions() == legal_actions
+    assert batch.mp[0] == [1, 1]
+    batch.step([valid_spawn, valid_spawn])
+    assert batch.mp[0] == [0, 0]
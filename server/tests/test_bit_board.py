@@ -0,0 +1,270 @@
+from constants.game_constants import BOARD_SIZE
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.cell.cell_transient_state import CellTransientState
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from utils.bitboard_utils import (
+    get_bit,
+    get_diagonal_runs,
+    get_neighbours_mask,
+    get_orthogonal_neighbours_mask,
+    get_square_sizes,
+    iter_bit_indexes,
+    to_bit_index,
+)
+from utils.board_geometry import NEIGHBOURS_MASKS, PRIMARY_NEIGHBOURS_MASKS
+from utils.board_utils import get_neighbours
+
+
+def _get_mask(game_board: GameBoard, condition):
+    mask = 0
+    for row in game_board.board:
+        for cell in row:
+            if condition(cell):
+                mask |= get_bit(cell.row_index, cell.column_index)
+    return mask
+
+
+def _assert_layers_match_cells(game_board: GameBoard):
+    bit_board = game_board.bit_board
+    assert bit_board.player1 == _get_mask(game_board, lambda c: c.belongs_to_player_1())
+    assert bit_board.player2 == _get_mask(game_board, lambda c: c.belongs_to_player_2())
+    assert bit_board.masters == _get_mask(game_board, lambda c: c.is_master)
+    assert bit_board.mine_traps == _get_mask(game_board, lambda c: c.is_mine_trap())
+    for state in bit_board.states:
+        assert bit_board.get_state(state) == _get_mask(
+            game_board, lambda c: c.has_state(state)
+        )
+    for transient_state in bit_board.transient_states:
+        assert bit_board.get_transient_state(transient_state) == _get_mask(
+            game_board, lambda c: c.transient_state == transient_state
+        )
+
+
+def test_neighbours_mask_matches_neighbours():
+    game_board = GameBoard.get_initial()
+
+    for row_index in range(BOARD_SIZE):
+        for column_index in range(BOARD_SIZE):
+            neighbours = get_neighbours(row_index, column_index, game_board.board)
+            expected_indexes = sorted(
+                cell.row_index * BOARD_SIZE + cell.column_index for cell in neighbours
+            )
+
+            neighbours_mask = get_neighbours_mask(get_bit(row_index, column_index))
+
+            assert list(iter_bit_indexes(neighbours_mask)) == expected_indexes
+
+
+def test_layers_follow_cell_mutations():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    player1_master_cell = game_board.get(1, 5)
+    _assert_layers_match_cells(game_board)
+
+    # Act
+    game_board.spawn_cell(Coordinates(2, 5), for_player1=True)
+    game_board.get(2, 5).add_modifier(CellState.SHIELDED)
+    game_board.get(3, 3).set_as_mine_trap(CellOwner.PLAYER_2)
+    game_board.get(4, 4).set_can_be_moved_into()
+    CellMovement._transfer_cell(player1_master_cell, game_board.get(0, 5))
+    game_board.get(9, 5).kill()
+
+    # Assert
+    _assert_layers_match_cells(game_board)
+    assert game_board.bit_board.masters == get_bit(0, 5)
+    assert game_board.bit_board.mine_traps_visible_to_player2 == get_bit(3, 3)
+    assert game_board.bit_board.mine_traps_visible_to_player1 == 0
+
+
+def test_cloned_board_layers_are_independent():
+    # Arrange
+    game_board = GameBoard.get_initial()
+
+    # Act
+    cloned_board = game_board.clone()
+    cloned_board.get(1, 4).set_owned_by_player1()
+    cloned_board.get(1, 5).set_selected()
+
+    # Assert
+    _assert_layers_match_cells(game_board)
+    _assert_layers_match_cells(cloned_board)
+    assert game_board.bit_board.player1 == get_bit(1, 5)
+    assert cloned_board.bit_board.player1 == get_bit(1, 5) | get_bit(1, 4)
+
+
+def test_cell_ids_are_allocated_sequentially_per_board():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    other_game_board = GameBoard.get_initial()
+
+    # Act
+    game_board.spawn_cell(Coordinates(1, 4), True)
+    cloned_board = game_board.clone()
+    cloned_board.spawn_cell(Coordinates(9, 4), False)
+    game_board.spawn_cell(Coordinates(9, 4), False)
+
+    # Assert
+    assert other_game_board.get(1, 5).id == 1
+    assert other_game_board.get(9, 5).id == 2
+    assert game_board.get(1, 4).id == 3
+    assert game_board.get(9, 4).id == cloned_board.get(9, 4).id == 4
+
+
+def test_board_dto_projects_mine_trap_visibility():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    game_board.get(3, 3).set_as_mine_trap(CellOwner.PLAYER_1)
+    game_board.get(7, 7).set_as_mine_trap(CellOwner.PLAYER_2)
+    game_board.get(5, 5).set_as_mine_trap(CellOwner.PLAYER_1)
+    game_board.get(5, 5).set_as_mine_trap(CellOwner.PLAYER_2)
+
+    for for_player1 in (True, False, None):
+        # Act
+        board_dto = game_board.to_dto(for_player1)
+
+        # Assert
+        assert board_dto == [
+            [cell.to_dto(for_player1) for cell in row] for row in game_board.board
+        ]
+
+
+def test_transient_overlay_does_not_mark_live_board():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    transient_board = game_board.create_transient_overlay()
+
+    # Act
+    CellSpawn.calculate(True, transient_board)
+
+    # Assert
+    spawn_targets_mask = transient_board.get_transient_state_mask(
+        CellTransientState.CAN_BE_SPAWNED_INTO
+    )
+    assert spawn_targets_mask == get_neighbours_mask(get_bit(1, 5))
+    _assert_layers_match_cells(game_board)
+    assert all(
+        cell.transient_state == CellTransientState.NONE
+        for row in game_board.board
+        for cell in row
+    )
+
+    board_dto = transient_board.to_dto(for_player1=True)
+    for row in board_dto:
+        for cell_dto in row:
+            is_spawn_target = spawn_targets_mask & get_bit(
+                cell_dto.rowIndex, cell_dto.columnIndex
+            )
+            assert (
+                cell_dto.transientState == CellTransientState.CAN_BE_SPAWNED_INTO
+            ) == bool(is_spawn_target)
+
+
+def test_geometry_tables_match_neighbours():
+    game_board = GameBoard.get_initial()
+
+    for row_index in range(BOARD_SIZE):
+        for column_index in range(BOARD_SIZE):
+            bit_index = row_index * BOARD_SIZE + column_index
+            expected_neighbours = get_neighbours(
+                row_index, column_index, game_board.board
+            )
+
+            # The order matters as much as the content
+            assert game_board.get_neighbours(row_index, column_index) == (
+                expected_neighbours
+            )
+            assert NEIGHBOURS_MASKS[bit_index] == get_neighbours_mask(
+                get_bit(row_index, column_index)
+            )
+            assert PRIMARY_NEIGHBOURS_MASKS[bit_index] == (
+                get_orthogonal_neighbours_mask(get_bit(row_index, column_index))
+            )
+
+
+def test_ownership_index_follows_cell_mutations():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    player1_master_cell = game_board.get(1, 5)
+    assert game_board.get_cells_owned_by_player(True) == [player1_master_cell]
+
+    # Act & Assert
+    game_board.get(2, 2).set_owned_by_player1()
+    game_board.get(2, 3).set_owned_by_player2()
+    assert game_board.get_cells_owned_by_player(True) == [
+        player1_master_cell,
+        game_board.get(2, 2),
+    ]
+
+    CellMovement._transfer_cell(player1_master_cell, game_board.get(0, 5))
+    assert game_board.get_cells_owned_by_player(True) == [
+        game_board.get(0, 5),
+        game_board.get(2, 2),
+    ]
+
+    game_board.get(2, 2).kill()
+    game_board.get(2, 3).set_idle()
+    game_board.get(4, 4).set_owned_by_player2()
+
+    assert game_board.get_cells_owned_by_player(True) == [game_board.get(0, 5)]
+    assert game_board.get_cells_owned_by_player(False) == [
+        game_board.get(4, 4),
+        game_board.get(9, 5),
+    ]
+    assert game_board.count_cells_owned_by_player(False) == 2
+
+
+def test_master_locator_follows_masters():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    assert game_board.get_master(True) == game_board.get(1, 5)
+    assert game_board.get_master(False) == game_board.get(9, 5)
+
+    # Act
+    CellMovement._transfer_cell(game_board.get(1, 5), game_board.get(2, 5))
+    game_board.get(9, 5).kill()
+
+    # Assert
+    assert game_board.get_master(True) == game_board.get(2, 5)
+    assert game_board.get_master(False) is None
+
+
+def test_square_sizes_match_largest_squares():
+    # Arrange
+    mask = 0
+    for row_index, column_index in [
+        (2, 2), (2, 3), (2, 4), (3, 2), (3, 3), (3, 4), (4, 2), (4, 3), (10, 10)
+    ]:
+        mask |= get_bit(row_index, column_index)
+
+    # Act
+    sizes = get_square_sizes(mask)
+
+    # Assert
+    assert sizes[to_bit_index(2, 2)] == 2
+    assert sizes[to_bit_index(2, 3)] == 2
+    assert sizes[to_bit_index(2, 4)] == 1
+    assert sizes[to_bit_index(4, 2)] == 1
+    assert sizes[to_bit_index(10, 10)] == 1
+    assert sizes[to_bit_index(0, 0)] == 0
+
+
+def test_diagonal_runs_are_maximal():
+    # Arrange
+    mask = 0
+    for row_index, column_index in [(2, 2), (3, 3), (4, 4), (4, 2), (2, 4), (0, 10)]:
+        mask |= get_bit(row_index, column_index)
+    # Would wrap around to the next row without the column masks
+    mask |= get_bit(1, 0)
+
+    # Act
+    increasing_runs, decreasing_runs = get_diagonal_runs(mask)
+
+    # Assert
+    assert increasing_runs == [[to_bit_index(r, r) for r in (2, 3, 4)]]
+    assert decreasing_runs == [
+        [to_bit_index(4, 2), to_bit_index(3, 3), to_bit_index(2, 4)]
+    ]
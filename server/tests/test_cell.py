@@ -0,0 +1,91 @@
+import pytest
+
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.cell.cell_transient_state import CellTransientState
+from game_engine.models.cell.transient_cell import TransientCell
+from game_engine.models.game_board import GameBoard
+from utils.bitboard_utils import get_bit
+
+
+def test_cell_state_round_trips_through_modifiers():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    cell = game_board.get(1, 5)
+
+    # Act
+    cell.add_modifier(CellState.SHIELDED)
+    shielded_state = cell.state
+    cell.set_freshly_spawned()
+    cell.pop_shield()
+
+    # Assert
+    assert shielded_state == CellState.SHIELDED
+    assert cell.state == CellState.FRESHLY_SPAWNED
+    assert cell.state_value == CellState.FRESHLY_SPAWNED.value
+    assert cell.clone().state == cell.state
+    assert cell.is_freshly_spawned() and not cell.is_shielded()
+    bit_board = game_board.bit_board
+    assert bit_board.get_state(CellState.FRESHLY_SPAWNED) & get_bit(1, 5)
+    assert not bit_board.get_state(CellState.SHIELDED)
+    with pytest.raises(ValueError):
+        cell.add_modifier(CellState.MANA_BUBBLE)
+
+
+def test_cell_dto_exposes_the_state_as_a_cell_state():
+    # Arrange
+    cell = GameBoard.get_initial().get(1, 5)
+    cell.add_modifier(CellState.SHIELDED)
+
+    # Act
+    cell_dto = cell.to_dto(True)
+
+    # Assert
+    assert type(cell_dto.state) is CellState
+    assert cell_dto.state == CellState.SHIELDED
+
+
+def test_board_models_are_slotted():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    cell = game_board.get(0, 0)
+    transient_cell = game_board.create_transient_overlay().get(0, 0)
+
+    # Act
+    models = (cell, cell.hidden_state_info, cell.get_coordinates(), transient_cell)
+
+    # Assert
+    for model in models:
+        assert not hasattr(model, "__dict__")
+
+
+def test_transient_cell_only_writes_its_transient_state():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    live_cell = game_board.get(1, 5)
+    transient_cell = game_board.create_transient_overlay().get(1, 5)
+
+    # Act
+    transient_cell.transient_state = CellTransientState.SELECTED
+
+    # Assert
+    assert transient_cell.transient_state == CellTransientState.SELECTED
+    assert live_cell.transient_state == CellTransientState.NONE
+    assert transient_cell.is_master and transient_cell.id == live_cell.id
+    for name in ("_owner", "_is_master", "_state", "_hidden_state_info", "_id"):
+        with pytest.raises(AttributeError):
+            setattr(transient_cell, name, None)
+    with pytest.raises(AttributeError):
+        transient_cell.set_owned_by_player2()
+    assert transient_cell.owner == live_cell.owner == CellOwner.PLAYER_1
+
+
+def test_transient_cell_without_live_cell_raises_attribute_error():
+    # Arrange
+    transient_cell = TransientCell.__new__(TransientCell)
+
+    # Act & Assert
+    with pytest.raises(AttributeError):
+        transient_cell.id
+    with pytest.raises(AttributeError):
+        transient_cell.missing_field
@@ -0,0 +1,34 @@
+from dto.misc.coordinates_dto import CoordinatesDto
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+
+
+def test_board_coordinates_are_interned():
+    # Arrange
+    game_board = GameBoard.get_initial()
+
+    # Act
+    coordinates = Coordinates.of(3, 4)
+
+    # Assert
+    assert coordinates is Coordinates.of(3, 4)
+    assert coordinates is game_board.get(3, 4).get_coordinates()
+    assert coordinates is CellSpawn.create(True, 3, 4).metadata.impacted_coords
+    assert coordinates is Coordinates.from_dto(CoordinatesDto(3, 4))
+    assert coordinates.to_dto() == CoordinatesDto(3, 4)
+
+
+def test_interned_coordinates_behave_like_built_ones():
+    # Arrange
+    built_coordinates = Coordinates(3, 4)
+
+    # Act
+    interned_coordinates = Coordinates.of(3, 4)
+
+    # Assert
+    assert interned_coordinates == built_coordinates
+    assert hash(interned_coordinates) == hash(built_coordinates) == hash((3, 4))
+    assert {built_coordinates: True}[interned_coordinates]
+    assert interned_coordinates != Coordinates.of(4, 3)
+    assert Coordinates.of(-1, -1) == Coordinates(-1, -1)
@@ -0,0 +1,118 @@
+import pytest
+
+from game_engine.action_processing import process_action
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.match.match_context import MatchContext
+from game_engine.models.turn.turn_state import TurnState
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.snapshot_codec import encode_snapshot
+from tests.helpers.match_context_helper import create_match_context
+
+
+def _process(action, match_context: MatchContext):
+    process_action(action, match_context)
+    for callback in action.get_callbacks_to_trigger():
+        callback.trigger(match_context)
+
+
+def test_undo_restores_action_and_callbacks():
+    # Arrange
+    match_context = create_match_context()
+    turn_state = TurnState.get_initial(
+        True,
+        match_context.player1.resources,
+        match_context.player2.resources,
+        journal=match_context.journal,
+    )
+    game_board = match_context.game_board
+    game_board.get(2, 5).set_as_mine_trap(CellOwner.PLAYER_2)
+    match_context.journal.start()
+
+    initial_dto = match_context.to_dto(True)
+    initial_hash = match_context.get_zobrist_hash()
+    initial_spells = dict(match_context.player1.resources.spells)
+
+    # Act
+    _process(CellSpawn.create(True, 2, 4), match_context)
+    spawned_cell_id = game_board.get(2, 4).id
+    after_spawn_hash = match_context.get_zobrist_hash()
+
+    # Moving onto the mine makes it explode
+    movement = CellMovement.create(True, spawned_cell_id, 2, 4, 2, 5)
+    _process(movement, match_context)
+    turn_state.register_movement(movement.cell_id)
+    assert not game_board.get(2, 5).is_mine_trap()
+
+    match_context.undo()
+    undone_movement_hash = match_context.get_zobrist_hash()
+    undone_movement_cell_id = game_board.get(2, 4).id
+    match_context.undo()
+
+    # Assert
+    assert undone_movement_hash == after_spawn_hash
+    assert undone_movement_cell_id == spawned_cell_id
+    assert not turn_state.movements
+    assert match_context.to_dto(True) == initial_dto
+    assert match_context.get_zobrist_hash() == initial_hash
+    assert match_context.player1.resources.spells == initial_spells
+    bit_board = game_board.bit_board
+    assert bit_board.zobrist_hash == bit_board.compute_zobrist_hash()
+    assert bit_board.next_cell_id == 3
+    assert not match_context.journal.can_undo()
+
+
+def test_journal_records_nothing_unless_started():
+    # Arrange
+    match_context = create_match_context()
+
+    # Act
+    _process(CellSpawn.create(True, 2, 4), match_context)
+
+    # Assert
+    assert not match_context.journal.can_undo()
+    with pytest.raises(ValueError):
+        match_context.undo()
+
+
+def test_undo_across_turn_changes():
+    # Arrange
+    simulator = MatchSimulator.create(rng_seed=0)
+    match_context, turn_state = simulator.match_context, simulator.turn_state
+    match_context.journal.start()
+    snapshots = [encode_snapshot(match_context, turn_state)]
+
+    # Act
+    simulator.step(CellSpawn.create(True, 2, 5))
+    snapshots.append(encode_snapshot(match_context, turn_state))
+    simulator.end_turn()
+    snapshots.append(encode_snapshot(match_context, turn_state))
+    simulator.end_turn()
+
+    # Assert
+    for snapshot in reversed(snapshots):
+        match_context.undo()
+        assert encode_snapshot(match_context, turn_state) == snapshot
+    assert match_context.current_turn == 1
+    assert match_context.is_player1_turn and turn_state.is_player1_turn
+    assert match_context.player1.resources.current_mp == 1
+    assert not match_context.journal.can_undo()
+
+
+def test_journal_records_nothing_outside_entries():
+    # Arrange
+    simulator = MatchSimulator.create(rng_seed=0)
+    match_context = simulator.match_context
+    match_context.journal.start()
+    simulator.step(CellSpawn.create(True, 2, 5))
+    simulator.end_turn()
+    match_context.undo()
+
+    # Act
+    match_context.player2.resources.current_hp = 1
+    match_context.undo()
+
+    # Assert
+    assert match_context.player2.resources.current_hp == 1
+    assert not match_context.journal.can_undo()
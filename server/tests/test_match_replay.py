@@ -0,0 +1,90 @@
+import json
+import random
+
+import pytest
+
+from game_engine.simulator.match_replay import MatchReplay
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+from game_engine.snapshot_codec import encode_snapshot
+
+
+def _play_random_match(rng_seed: int, policy_seed: int):
+    simulator = MatchSimulator.create(rng_seed=rng_seed)
+    play_random_turns(simulator, random.Random(policy_seed))
+    return simulator
+
+
+def _get_replay(simulator: MatchSimulator, checkpoint_interval: int):
+    # Goes through JSON, like the log stored with the ended match
+    actions_per_turn = json.loads(
+        json.dumps(
+            {
+                turn: [action.to_dto().to_dict() for action in actions]
+                for turn, actions in simulator.actions_per_turn.items()
+            }
+        )
+    )
+    return MatchReplay(
+        actions_per_turn,
+        simulator.match_context.current_turn,
+        simulator.match_context.rng_seed,
+        checkpoint_interval,
+    )
+
+
+def _get_snapshot(simulator: MatchSimulator):
+    return encode_snapshot(simulator.match_context, simulator.turn_state)
+
+
+def test_replay_reaches_the_final_position():
+    # Arrange
+    simulator = _play_random_match(rng_seed=3, policy_seed=5)
+    replay = _get_replay(simulator, checkpoint_interval=4)
+
+    # Act
+    frames = list(replay.iter_frames())
+    final_simulator = replay.seek(simulator.match_context.current_turn)
+
+    # Assert
+    assert simulator.match_context.rng_draws
+    assert len(frames) == sum(map(len, simulator.actions_per_turn.values()))
+    assert [(frame.turn, frame.action) for frame in frames] == [
+        (turn, action)
+        for turn, actions in simulator.actions_per_turn.items()
+        for action in actions
+    ]
+    assert _get_snapshot(final_simulator) == _get_snapshot(simulator)
+    assert final_simulator.ending_reason == simulator.ending_reason
+
+
+def test_seek_from_checkpoints_matches_a_full_replay():
+    # Arrange
+    simulator = _play_random_match(rng_seed=8, policy_seed=1)
+    total_turns = simulator.match_context.current_turn
+    replay = _get_replay(simulator, checkpoint_interval=3)
+    replay_without_checkpoints = _get_replay(simulator, checkpoint_interval=1_000)
+    for _ in replay.iter_frames():
+        pass
+
+    for turn in (1, 2, 4, total_turns // 2, total_turns):
+        # Act
+        simulator_at_turn = replay.seek(turn)
+
+        # Assert
+        assert simulator_at_turn.match_context.current_turn == turn
+        assert _get_snapshot(simulator_at_turn) == _get_snapshot(
+            replay_without_checkpoints.seek(turn)
+        )
+
+
+def test_seek_rejects_turns_outside_the_match():
+    # Arrange
+    simulator = _play_random_match(rng_seed=0, policy_seed=0)
+    replay = _get_replay(simulator, checkpoint_interval=10)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        replay.seek(0)
+    with pytest.raises(ValueError):
+        replay.seek(simulator.match_context.current_turn + 1)
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from game_engine.models.actions.cell_spawn import CellSpawn
+from game_engine.models.match.ending_reason import EndingReason
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+from game_engine.snapshot_codec import encode_snapshot
+
+
+def test_random_matches_play_until_the_end():
+    # Arrange
+    rng = random.Random(7)
+
+    for rng_seed in range(3):
+        simulator = MatchSimulator.create(rng_seed=rng_seed)
+
+        # Act
+        play_random_turns(simulator, rng)
+
+        # Assert
+        match_context = simulator.match_context
+        assert simulator.ending_reason in (
+            EndingReason.PLAYER_VICTORY,
+            EndingReason.FATIGUE,
+            EndingReason.DRAW,
+        )
+        if simulator.ending_reason != EndingReason.DRAW:
+            assert simulator.loser.resources.current_hp <= 0
+        assert simulator.actions_per_turn
+        assert not simulator.legal_actions()
+        with pytest.raises(ValueError):
+            simulator.end_turn()
+
+
+def test_matches_with_the_same_seed_play_identically():
+    # Arrange
+    simulators = [MatchSimulator.create(rng_seed=11) for _ in range(2)]
+
+    # Act
+    for simulator in simulators:
+        play_random_turns(simulator, random.Random(5))
+
+    # Assert
+    first_simulator, second_simulator = simulators
+    assert first_simulator.match_context.rng_draws
+    assert encode_snapshot(
+        first_simulator.match_context, first_simulator.turn_state
+    ) == encode_snapshot(second_simulator.match_context, second_simulator.turn_state)
+
+
+def test_step_rejects_invalid_actions():
+    # Arrange
+    simulator = MatchSimulator.create()
+    opponent_spawn = CellSpawn.create(False, 8, 5)
+    out_of_reach_spawn = CellSpawn.create(True, 5, 5)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        simulator.step(opponent_spawn)
+    with pytest.raises(ValueError):
+        simulator.step(out_of_reach_spawn)
+    assert not simulator.actions_per_turn
+
+
+def test_end_turn_processes_turn_change():
+    # Arrange
+    simulator = MatchSimulator.create()
+    match_context = simulator.match_context
+    simulator.step(CellSpawn.create(True, 2, 5))
+    spawned_cell = match_context.game_board.get(2, 5)
+
+    # Act
+    simulator.end_turn()
+    player2_legal_actions = simulator.legal_actions()
+    simulator.end_turn()
+
+    # Assert
+    assert match_context.current_turn == 3
+    assert match_context.is_player1_turn and simulator.turn_state.is_player1_turn
+    assert match_context.player1.resources.current_mp == 2
+    assert not spawned_cell.is_freshly_spawned()
+    assert all(not action.from_player1 for action in player2_legal_actions)
+    assert simulator.actions_per_turn == {1: [CellSpawn.create(True, 2, 5)]}
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from game_engine.action_codec import encode_action
+from game_engine.models.actions.cell_attack import CellAttack
+from game_engine.models.actions.cell_movement import CellMovement
+from game_engine.models.spells.spell_id import SpellId
+from game_engine.simulator.match_simulator import MatchSimulator
+from game_engine.simulator.random_playout import play_random_turns
+from game_engine.snapshot_codec import (
+    SNAPSHOT_SIZE,
+    encode_snapshot,
+    restore_snapshot,
+)
+
+
+def _play_into_the_turn(simulator: MatchSimulator, rng: random.Random):
+    """
+    Moves or attacks with a few cells, for the turn counters to be encoded as well.
+    """
+    for _ in range(4):
+        cell_actions = [
+            action
+            for action in simulator.legal_actions()
+            if isinstance(action, (CellMovement, CellAttack))
+        ]
+        if cell_actions:
+            simulator.step(rng.choice(cell_actions))
+
+
+def test_snapshot_round_trip():
+    # Arrange
+    rng = random.Random(3)
+    simulator = MatchSimulator.create(rng_seed=3)
+    play_random_turns(simulator, rng, turns=30)
+    _play_into_the_turn(simulator, rng)
+    match_context, turn_state = simulator.match_context, simulator.turn_state
+    restored_simulator = MatchSimulator.create(rng_seed=0)
+    restored_context = restored_simulator.match_context
+    restored_turn_state = restored_simulator.turn_state
+
+    # Act
+    snapshot = encode_snapshot(match_context, turn_state)
+    restore_snapshot(memoryview(snapshot), restored_context, restored_turn_state)
+
+    # Assert
+    assert len(snapshot) == SNAPSHOT_SIZE
+    assert encode_snapshot(restored_context, restored_turn_state) == snapshot
+    assert restored_context.get_zobrist_hash() == match_context.get_zobrist_hash()
+    for for_player1 in (True, False, None):
+        assert restored_context.to_dto(for_player1).boardArray == (
+            match_context.to_dto(for_player1).boardArray
+        )
+    assert restored_context.player1.resources == match_context.player1.resources
+    assert restored_context.player2.resources == match_context.player2.resources
+    assert [
+        encode_action(action) for action in restored_simulator.legal_actions()
+    ] == [encode_action(action) for action in simulator.legal_actions()]
+    assert [
+        repr(cell) for row in restored_context.game_board.board for cell in row
+    ] == [repr(cell) for row in match_context.game_board.board for cell in row]
+    assert match_context.game_board.bit_board.mine_traps
+    assert turn_state.movements and turn_state.attacks
+
+
+def test_snapshot_keeps_the_spells_cast_during_the_turn():
+    # Arrange
+    simulator = MatchSimulator.create(rng_seed=0)
+    simulator.turn_state.spells += [SpellId.CELERITY, SpellId.MINE_TRAP]
+    restored_simulator = MatchSimulator.create(rng_seed=0)
+
+    # Act
+    restore_snapshot(
+        encode_snapshot(simulator.match_context, simulator.turn_state),
+        restored_simulator.match_context,
+        restored_simulator.turn_state,
+    )
+
+    # Assert
+    assert sorted(restored_simulator.turn_state.spells) == sorted(
+        simulator.turn_state.spells
+    )
+
+
+def test_restore_discards_the_journal_and_builds_cells_on_demand():
+    # Arrange
+    rng = random.Random(1)
+    simulator = MatchSimulator.create(rng_seed=1)
+    play_random_turns(simulator, rng, turns=6)
+    match_context = simulator.match_context
+    snapshot = encode_snapshot(match_context, simulator.turn_state)
+    match_context.journal.start()
+    _play_into_the_turn(simulator, rng)
+    assert match_context.journal.can_undo()
+
+    # Act
+    restore_snapshot(snapshot, match_context, simulator.turn_state)
+    master = match_context.game_board.get_master(True)
+
+    # Assert
+    assert not match_context.journal.can_undo()
+    assert master.is_master and master.belongs_to_player_1()
+    assert match_context.game_board.get_master(True) is master
+    assert encode_snapshot(match_context, simulator.turn_state) == snapshot
+
+
+def test_restore_rejects_unknown_snapshots():
+    # Arrange
+    simulator = MatchSimulator.create()
+    snapshot = bytearray(encode_snapshot(simulator.match_context, simulator.turn_state))
+    snapshot[0] += 1
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        restore_snapshot(snapshot, simulator.match_context, simulator.turn_state)
+    with pytest.raises(ValueError):
+        restore_snapshot(snapshot[1:], simulator.match_context, simulator.turn_state)
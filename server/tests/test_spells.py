@@ -1,4 +1,10 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from constants.game_constants import MAX_MP_VALUE, SPELLS_MANA_COST
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
 from game_engine.models.spells.spell_factory import get_initial_spell_deck, get_spell
 from game_engine.models.spells.spell_id import SpellId
 
@@ -62,3 +68,46 @@ def test_all_spells_are_present_in_the_player_deck():
     assert (
         not missing_spells
     ), f"The following spells are missing from the player's deck: {', '.join(missing_spells)}"
+
+
+def test_spells_are_shared_and_cache_their_targets():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    game_board.get(2, 2).set_owned_by_player1()
+    game_board.get(3, 3).set_owned_by_player1()
+    spell = get_spell(SpellId.CELERITY)
+
+    # Act
+    targeting_result = spell.get_possible_targets(
+        game_board.create_transient_overlay(), True
+    )
+    cached_targeting_result = spell.get_possible_targets(game_board, True)
+    game_board.get(4, 4).set_owned_by_player1()
+    new_targeting_result = spell.get_possible_targets(game_board, True)
+
+    # Assert
+    assert get_spell(SpellId.CELERITY) is spell
+    assert cached_targeting_result is targeting_result
+    assert targeting_result.targets == (Coordinates(2, 2), Coordinates(3, 3))
+    assert len(new_targeting_result) == 3
+    with pytest.raises(FrozenInstanceError):
+        targeting_result.targets = ()
+    with pytest.raises(TypeError):
+        targeting_result.formation_per_cell[Coordinates(0, 0)] = 0
+
+
+def test_targets_are_cached_per_board():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    other_game_board = GameBoard.get_initial()
+    spell = get_spell(SpellId.CELERITY)
+
+    # Act
+    targeting_result = spell.get_possible_targets(game_board, True)
+    other_targeting_result = spell.get_possible_targets(other_game_board, True)
+
+    # Assert
+    assert not vars(spell)
+    assert other_targeting_result is not targeting_result
+    assert list(game_board.bit_board.targeting_results.values()) == [targeting_result]
+    assert not game_board.clone().bit_board.targeting_results
@@ -0,0 +1,82 @@
+from game_engine.models.cell.cell_owner import CellOwner
+from game_engine.models.cell.cell_state import CellState
+from game_engine.models.dtos.coordinates import Coordinates
+from game_engine.models.game_board import GameBoard
+from game_engine.models.spells.spell_id import SpellId
+from tests.helpers.match_context_helper import create_match_context
+from utils.zobrist_utils import get_zobrist_key
+
+
+def test_board_hash_matches_full_computation():
+    # Arrange
+    game_board = GameBoard.get_initial()
+    cell = game_board.get(3, 4)
+
+    # Act
+    game_board.spawn_cell(Coordinates(3, 4), for_player1=True)
+    cell.add_modifier(CellState.SHIELDED)
+    game_board.get(6, 6).set_as_mine_trap(CellOwner.PLAYER_2)
+    cell.set_owned_by_player2()
+
+    # Assert
+    bit_board = game_board.bit_board
+    assert bit_board.zobrist_hash != 0
+    assert bit_board.zobrist_hash == bit_board.compute_zobrist_hash()
+    assert game_board.clone().bit_board.zobrist_hash == bit_board.zobrist_hash
+
+
+def test_hash_goes_back_after_reverted_changes():
+    # Arrange
+    match_context = create_match_context()
+    initial_hash = match_context.get_zobrist_hash()
+    cell = match_context.game_board.get(3, 4)
+    resources = match_context.player1.resources
+    spell_count = resources.spells[SpellId.MINE_TRAP]
+
+    # Act & Assert
+    cell.set_owned_by_player1()
+    resources.current_mp -= 1
+    resources.set_spell_count(SpellId.MINE_TRAP, spell_count - 1)
+    assert match_context.get_zobrist_hash() != initial_hash
+
+    cell.set_idle()
+    resources.current_mp += 1
+    resources.set_spell_count(SpellId.MINE_TRAP, spell_count)
+    assert match_context.get_zobrist_hash() == initial_hash
+
+
+def test_hash_depends_on_side_to_move_and_player():
+    # Arrange
+    match_context = create_match_context()
+    initial_hash = match_context.get_zobrist_hash()
+
+    # Act & Assert
+    match_context.is_player1_turn = False
+    assert match_context.get_zobrist_hash() != initial_hash
+    match_context.is_player1_turn = True
+
+    match_context.player1.resources.current_hp -= 1
+    player1_damaged_hash = match_context.get_zobrist_hash()
+    match_context.player1.resources.current_hp += 1
+    match_context.player2.resources.current_hp -= 1
+    assert match_context.get_zobrist_hash() not in (initial_hash, player1_damaged_hash)
+
+
+def test_hashing_resources_does_not_grow_the_key_cache():
+    # Arrange
+    match_context = create_match_context()
+    resources = match_context.player1.resources
+    for value in range(3):
+        resources.current_hp = resources.current_mp = value
+        match_context.get_zobrist_hash()
+    cache_size = get_zobrist_key.cache_info().currsize
+
+    # Act
+    # Every combination is a new resources hash, made of already seen values
+    for current_hp in range(3):
+        for current_mp in range(3):
+            resources.current_hp, resources.current_mp = current_hp, current_mp
+            match_context.get_zobrist_hash()
+
+    # Assert
+    assert get_zobrist_key.cache_info().currsize == cache_size
@@ -0,0 +1,176 @@
+"""
+Contains all utility methods relative to board bitmasks.
+
+A bitmask is a plain integer in which the bit of index
+row_index * BOARD_SIZE + column_index represents the square at (row_index, column_index).
+"""
+
+from typing import Iterator
+
+from constants.game_constants import BOARD_SIZE
+
+SQUARE_COUNT = BOARD_SIZE * BOARD_SIZE
+
+FULL_MASK = (1 << SQUARE_COUNT) - 1
+
+_FIRST_COLUMN_MASK = sum(1 << (row * BOARD_SIZE) for row in range(BOARD_SIZE))
+_LAST_COLUMN_MASK = _FIRST_COLUMN_MASK << (BOARD_SIZE - 1)
+
+# Used to cancel out the bits that wrapped around to another row after a horizontal shift
+_NOT_FIRST_COLUMN_MASK = FULL_MASK & ~_FIRST_COLUMN_MASK
+_NOT_LAST_COLUMN_MASK = FULL_MASK & ~_LAST_COLUMN_MASK
+
+
+def to_bit_index(row_index: int, column_index: int) -> int:
+    return row_index * BOARD_SIZE + column_index
+
+
+def from_bit_index(bit_index: int) -> tuple[int, int]:
+    return divmod(bit_index, BOARD_SIZE)
+
+
+def get_bit(row_index: int, column_index: int) -> int:
+    return 1 << (row_index * BOARD_SIZE + column_index)
+
+
+def iter_bit_indexes(mask: int) -> Iterator[int]:
+    """
+    Yields the indexes of the bits set in the given mask, in ascending order
+    (i.e. row by row, from left to right).
+    """
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+def get_lowest_bit_index(mask: int) -> int:
+    """
+    Returns the index of the first bit set in the given mask, -1 if the mask is empty.
+    """
+    return (mask & -mask).bit_length() - 1
+
+
+def count_bits(mask: int) -> int:
+    return mask.bit_count()
+
+
+# region Shifts
+
+
+def shift_up(mask: int) -> int:
+    """
+    Moves every square of the mask to the next row (row_index + 1).
+    """
+    return (mask << BOARD_SIZE) & FULL_MASK
+
+
+def shift_down(mask: int) -> int:
+    """
+    Moves every square of the mask to the previous row (row_index - 1).
+    """
+    return mask >> BOARD_SIZE
+
+
+def shift_right(mask: int) -> int:
+    """
+    Moves every square of the mask to the next column (column_index + 1).
+    """
+    return (mask << 1) & _NOT_FIRST_COLUMN_MASK
+
+
+def shift_left(mask: int) -> int:
+    """
+    Moves every square of the mask to the previous column (column_index - 1).
+    """
+    return (mask >> 1) & _NOT_LAST_COLUMN_MASK
+
+
+# endregion
+
+
+def get_orthogonal_neighbours_mask(mask: int) -> int:
+    """
+    Returns the squares that are directly up, down, left or right of any square of the given mask.
+
+    Remark : The result may contain squares of the given mask if some of them are adjacent.
+    """
+    return shift_up(mask) | shift_down(mask) | shift_left(mask) | shift_right(mask)
+
+
+def get_neighbours_mask(mask: int) -> int:
+    """
+    Returns the squares that are adjacent (diagonals included) to any square of the given mask.
+
+    Remark : The result may contain squares of the given mask if some of them are adjacent.
+    """
+    horizontal_spread = mask | shift_left(mask) | shift_right(mask)
+    return (
+        shift_left(mask)
+        | shift_right(mask)
+        | shift_up(horizontal_spread)
+        | shift_down(horizontal_spread)
+    )
+
+
+def get_square_sizes(mask: int) -> list[int]:
+    """
+    Returns, for each bit index, the side length of the largest square of the mask
+    having that square as its corner of lowest row and column indexes (0 if not set).
+
+    Computed in a single sweep from the last square to the first one.
+    """
+    sizes = [0] * SQUARE_COUNT
+    for bit_index in reversed(list(iter_bit_indexes(mask))):
+        row_index, column_index = from_bit_index(bit_index)
+        if row_index == BOARD_SIZE - 1 or column_index == BOARD_SIZE - 1:
+            sizes[bit_index] = 1
+            continue
+
+        sizes[bit_index] = 1 + min(
+            sizes[bit_index + 1],
+            sizes[bit_index + BOARD_SIZE],
+            sizes[bit_index + BOARD_SIZE + 1],
+        )
+
+    return sizes
+
+
+def get_diagonal_runs(
+    mask: int, min_length: int = 2
+) -> tuple[list[list[int]], list[list[int]]]:
+    """
+    Returns the maximal diagonal runs of squares of the mask, as lists of bit indexes,
+    found in a single sweep over each diagonal direction :
+
+    • First, the runs going towards increasing rows and columns
+
+    • Then, the runs going towards decreasing rows and increasing columns
+
+    Each run is ordered by increasing column index, and the runs by their first square.
+    """
+    # Squares followed by another one of the mask in each direction
+    followed_increasing = mask & shift_down(shift_left(mask))
+    followed_decreasing = mask & shift_up(shift_left(mask))
+    # Squares not preceded by another one of the mask in each direction
+    starts_increasing = mask & ~shift_up(shift_right(mask))
+    starts_decreasing = mask & ~shift_down(shift_right(mask))
+
+    return (
+        _get_runs(starts_increasing, followed_increasing, BOARD_SIZE + 1, min_length),
+        _get_runs(starts_decreasing, followed_decreasing, 1 - BOARD_SIZE, min_length),
+    )
+
+
+def _get_runs(starts_mask: int, followed_mask: int, step: int, min_length: int):
+    runs = []
+    for bit_index in iter_bit_indexes(starts_mask):
+        run = [bit_index]
+        while followed_mask & (1 << bit_index):
+            bit_index += step
+            run.append(bit_index)
+
+        if len(run) >= min_length:
+            runs.append(run)
+
+    return runs
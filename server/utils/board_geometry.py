@@ -0,0 +1,57 @@
+"""
+Static geometry of the game board, computed once at import time.
+
+Squares are identified by their bit index (row_index * BOARD_SIZE + column_index),
+see bitboard_utils.
+"""
+
+from constants.game_constants import BOARD_SIZE
+
+# Same order as the one the neighbours have always been returned in,
+# some client-visible outcomes (e.g. deaths order) depend on it
+DIRECTIONS = (
+    (-1, 0),  # down
+    (1, 0),  # up
+    (0, -1),  # left
+    (0, 1),  # right
+    (-1, -1),  # bottom-left
+    (-1, 1),  # bottom-right
+    (1, -1),  # top-left
+    (1, 1),  # top-right
+)
+
+PRIMARY_DIRECTIONS = DIRECTIONS[:4]
+
+
+def _build_neighbours_table(
+    directions: tuple[tuple[int, int], ...],
+) -> tuple[tuple[int, ...], ...]:
+    table = []
+    for row_index in range(BOARD_SIZE):
+        for column_index in range(BOARD_SIZE):
+            neighbours = []
+            for row_offset, column_offset in directions:
+                r, c = row_index + row_offset, column_index + column_offset
+                if 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+                    neighbours.append(r * BOARD_SIZE + c)
+            table.append(tuple(neighbours))
+
+    return tuple(table)
+
+
+def _build_masks_table(
+    neighbours_table: tuple[tuple[int, ...], ...],
+) -> tuple[int, ...]:
+    return tuple(
+        sum(1 << bit_index for bit_index in neighbours)
+        for neighbours in neighbours_table
+    )
+
+
+# The bit indexes of the (up to) 8 neighbours of each square, in the DIRECTIONS order
+NEIGHBOURS = _build_neighbours_table(DIRECTIONS)
+# The bit indexes of the (up to) 4 primary direction neighbours of each square
+PRIMARY_NEIGHBOURS = _build_neighbours_table(PRIMARY_DIRECTIONS)
+
+NEIGHBOURS_MASKS = _build_masks_table(NEIGHBOURS)
+PRIMARY_NEIGHBOURS_MASKS = _build_masks_table(PRIMARY_NEIGHBOURS)
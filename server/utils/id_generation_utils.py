@@ -3,7 +3,6 @@ from enum import StrEnum
 
 from dto.player.queue_player_dto import QueuePlayerDto
 from dto.player.user_dto import UserDto
-from game_engine.models.cell.cell import Cell
 from game_engine.models.dtos.room import Room
 from game_engine.models.match.match_context import MatchContext
 
@@ -13,7 +12,6 @@ class IdPrefixes(StrEnum):
     PLAYER = "p"
     ROOM = "r"
     MATCH = "m"
-    CELL = "c"
 
 
 def generate_id(type):
@@ -25,5 +23,3 @@ def generate_id(type):
         return f"{IdPrefixes.ROOM}-{uuid.uuid4()}"
     elif type is MatchContext:
         return f"{IdPrefixes.MATCH}-{uuid.uuid4()}"
-    elif type is Cell:
-        return f"{IdPrefixes.CELL}-{uuid.uuid4()}"
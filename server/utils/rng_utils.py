@@ -0,0 +1,37 @@
+"""
+Contains all utility methods relative to the seeded randomness of a match.
+
+Every random draw of a match comes from a generator derived from the match's seed,
+so that playing the same actions with the same seed always leads to the same match.
+"""
+
+import random
+from enum import IntEnum
+
+SEED_BITS = 63
+
+
+class RngStream(IntEnum):
+    """
+    Identifies an independent sequence of draws derived from a match seed.
+    """
+
+    # Draws that change the match state (e.g. the cells spawned by an ambush)
+    GAME = 0
+    # Draws of the AI player, which must not shift the game ones
+    AI = 1
+
+
+def generate_seed() -> int:
+    """
+    Returns a new seed for a match, fitting a signed 64-bit column.
+    """
+    return random.SystemRandom().getrandbits(SEED_BITS)
+
+
+def get_seeded_rng(seed: int, stream: RngStream, index: int = 0) -> random.Random:
+    """
+    Returns the generator of the given stream and index for the given seed,
+    always the same for the same arguments.
+    """
+    return random.Random(seed << 64 | stream << 32 | index)
@@ -0,0 +1,79 @@
+"""
+Contains all utility methods relative to the Zobrist hashing of the match state.
+
+A Zobrist hash is the XOR of one pseudo-random key per feature of the state
+(e.g. "the square 12 is owned by player 1"), which allows updating it in O(1)
+whenever a single feature changes.
+
+The keys are derived from their identifying parts with a fixed seed, so that
+the same state always gets the same hash, across matches and server restarts.
+"""
+
+from enum import IntEnum
+from functools import cache
+
+from utils.bitboard_utils import SQUARE_COUNT
+
+
+class ZobristFeature(IntEnum):
+    """
+    Identifies the kind of feature a key stands for, first part of every key.
+    """
+
+    PLAYER1_SQUARE = 0
+    PLAYER2_SQUARE = 1
+    MASTER_SQUARE = 2
+    STATE_SQUARE = 3
+    MINE_TRAP_SQUARE = 4
+    MINE_TRAP_VISIBLE_TO_PLAYER1_SQUARE = 5
+    MINE_TRAP_VISIBLE_TO_PLAYER2_SQUARE = 6
+    RESOURCE = 7
+    SPELL_COUNT = 8
+    PLAYER1_RESOURCES = 9
+    PLAYER2_RESOURCES = 10
+    PLAYER1_TURN = 11
+
+
+_MASK_64 = (1 << 64) - 1
+_SEED = 0x636F6C6F72636F6E
+
+
+def _mix(value: int) -> int:
+    """
+    splitmix64 finalizer, turns any integer into a well distributed 64-bit one.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+@cache
+def get_zobrist_key(*parts: int) -> int:
+    """
+    Returns the 64-bit key identified by the given parts.
+    """
+    key = _SEED
+    for part in parts:
+        key = _mix(key ^ (part & _MASK_64))
+    return key
+
+
+def salt_zobrist_hash(zobrist_hash: int, *parts: int) -> int:
+    """
+    Mixes the given hash with the key identified by the given parts.
+
+    Unlike get_zobrist_key, the result is not cached, since the hashes
+    (e.g. of a player's resources) can take any value.
+    """
+    return _mix(zobrist_hash ^ get_zobrist_key(*parts))
+
+
+def create_square_keys(*parts: int) -> tuple[int, ...]:
+    """
+    Returns one key per square of the board (indexed by bit index)
+    for the layer identified by the given parts.
+    """
+    return tuple(
+        get_zobrist_key(*parts, bit_index) for bit_index in range(SQUARE_COUNT)
+    )